@@ -1,5 +1,5 @@
 use crate::process;
-use crate::state::{Provider, SessionInfo};
+use crate::state::{Provider, SessionInfo, Terminal};
 use crate::terminal;
 use crate::transcript;
 use std::collections::HashMap;
@@ -25,49 +25,72 @@ pub fn poll_sessions() -> Vec<SessionInfo> {
 
     let home = std::env::var("HOME").unwrap_or_default();
 
-    let mut sessions = Vec::new();
-    for (tty, term) in &merged {
-        let agent = match agent_by_tty.get(tty) {
-            Some(p) => p,
-            None => continue,
-        };
-        let pid = agent.pid;
-        let provider = agent.provider;
+    // Reuse tails parsed by earlier polls for transcripts that have not changed
+    let tail_cache_path = transcript::tail_cache_path();
+    transcript::load_tail_caches(&tail_cache_path);
 
-        let cwd = process::get_pid_cwd(pid).unwrap_or_default();
-        let transcript_path = match provider {
-            Provider::Claude => {
-                let project_hash = transcript::project_hash(&cwd);
-                let tty_short = tty.trim_start_matches("/dev/");
-                let project_dir = Path::new(&home)
-                    .join(".claude/projects")
-                    .join(&project_hash);
-                let state_dir = transcript::state_dir_for_cwd(&cwd);
-                transcript::resolve_transcript(tty_short, &state_dir, &project_dir, &active_ttys)
-            }
-            Provider::Codex => transcript::find_latest_codex_session_for_cwd(&cwd),
-        };
+    // Each session needs an lsof call plus transcript stat/reads; run them
+    // concurrently so a poll costs about as much as its slowest session
+    let sessions = std::thread::scope(|scope| {
+        let handles: Vec<_> = merged
+            .iter()
+            .filter_map(|(tty, term)| {
+                let agent = *agent_by_tty.get(tty)?;
+                let (home, active_ttys) = (&home, &active_ttys);
+                Some(scope.spawn(move || session_info(tty, *term, agent, home, active_ttys)))
+            })
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().expect("session poll thread panicked"))
+            .collect()
+    });
 
-        let transcript_opt = if transcript_path.is_empty() {
-            None
-        } else {
-            Some(transcript_path)
-        };
+    // Best effort: a failed save only means the next poll reads tails again
+    let _ = transcript::save_tail_caches(&tail_cache_path);
+    sessions
+}
 
-        let status = transcript::determine_status_for(provider, transcript_opt.as_deref());
+/// Discover the CWD, transcript and status of one agent session.
+fn session_info(
+    tty: &str,
+    term: Terminal,
+    agent: process::AgentProcess,
+    home: &str,
+    active_ttys: &HashSet<String>,
+) -> SessionInfo {
+    let pid = agent.pid;
+    let provider = agent.provider;
 
-        sessions.push(SessionInfo {
-            tty: tty.clone(),
-            pid,
-            cwd,
-            provider,
-            terminal: *term,
-            transcript: transcript_opt,
-            status,
-        });
-    }
+    let cwd = process::get_pid_cwd(pid).unwrap_or_default();
+    let transcript_path = match provider {
+        Provider::Claude => {
+            let project_hash = transcript::project_hash(&cwd);
+            let tty_short = tty.trim_start_matches("/dev/");
+            let project_dir = Path::new(home).join(".claude/projects").join(&project_hash);
+            let state_dir = transcript::state_dir_for_cwd(&cwd);
+            transcript::resolve_transcript(tty_short, &state_dir, &project_dir, active_ttys)
+        }
+        Provider::Codex => transcript::find_latest_codex_session_for_cwd(&cwd),
+    };
 
-    sessions
+    let transcript_opt = if transcript_path.is_empty() {
+        None
+    } else {
+        Some(transcript_path)
+    };
+
+    let status = transcript::determine_status_for(provider, transcript_opt.as_deref());
+
+    SessionInfo {
+        tty: tty.to_string(),
+        pid,
+        cwd,
+        provider,
+        terminal: term,
+        transcript: transcript_opt,
+        status,
+    }
 }
 
 #[cfg(test)]
@@ -1,125 +1,596 @@
 use crate::state::{Provider, Status};
+use memchr::memmem::Finder;
+use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
 use std::fs;
-use std::io::{BufRead, BufReader, Read, Seek, SeekFrom};
+use std::io::{BufRead, BufReader};
+use std::os::unix::fs::FileExt;
 use std::path::{Path, PathBuf};
+use std::sync::{LazyLock, Mutex, OnceLock};
 use std::time::SystemTime;
 
+/// Maximum number of trailing bytes of a transcript considered for status.
+const TAIL_WINDOW: u64 = 65536;
+
+/// Initial number of trailing bytes read when plan mode is not needed; grown
+/// 4x while the status is undecided.
+///
+/// Only transcripts quiet for 3-10s are read this way. Their results are
+/// never cached, so older transcripts always read the full TAIL_WINDOW.
+const TAIL_INITIAL_CHUNK: u64 = 4096;
+
+/// Record types and roles of the transcript entries status detection reads.
+const ROLE_ASSISTANT: &str = "assistant";
+const ROLE_USER: &str = "user";
+
+/// Byte markers a transcript line must contain to be an assistant or user record.
+const ASSISTANT_MARKER: &[u8] = b"\"assistant\"";
+const USER_MARKER: &[u8] = b"\"user\"";
+
+/// Searchers for the role markers, built once instead of on every line.
+static ASSISTANT_FINDER: LazyLock<Finder<'static>> =
+    LazyLock::new(|| Finder::new(ASSISTANT_MARKER));
+static USER_FINDER: LazyLock<Finder<'static>> = LazyLock::new(|| Finder::new(USER_MARKER));
+
+/// Byte marker of the only tool call that can turn plan mode on.
+const ENTER_PLAN_MODE_MARKER: &[u8] = b"EnterPlanMode";
+
+/// Byte marker every Codex function_call payload contains.
+const FUNCTION_CALL_MARKER: &[u8] = b"\"function_call\"";
+
+/// Byte marker shared by Codex function_call and function_call_output payloads.
+const CALL_EVENT_MARKER: &[u8] = b"\"function_call";
+
+/// Searchers for the single-pattern markers, built once instead of on
+/// every search.
+static ENTER_PLAN_MODE_FINDER: LazyLock<Finder<'static>> =
+    LazyLock::new(|| Finder::new(ENTER_PLAN_MODE_MARKER));
+static FUNCTION_CALL_FINDER: LazyLock<Finder<'static>> =
+    LazyLock::new(|| Finder::new(FUNCTION_CALL_MARKER));
+static CALL_EVENT_FINDER: LazyLock<Finder<'static>> =
+    LazyLock::new(|| Finder::new(CALL_EVENT_MARKER));
+
+/// Maximum number of parsed transcript tails kept in memory.
+const TAIL_CACHE_CAPACITY: usize = 64;
+
+/// File under the claude-bar state directory the tail caches persist to.
+const TAIL_CACHE_FILE: &str = "tail-cache.json";
+
+/// Version of the persisted tail cache; bump it whenever the format or the
+/// scan rules behind cached results change, so older results are dropped.
+const TAIL_CACHE_VERSION: u32 = 2;
+
+type TailKey = (String, SystemTime, u64);
+type TailResult = (Option<&'static str>, bool, bool);
+
+/// Parsed transcript tails keyed by (path, mtime, size).
+///
+/// A transcript that has not been written since it was last parsed has the
+/// same key, so its tail is not read again.
+struct TailCache<V> {
+    entries: HashMap<TailKey, (V, u64)>,
+    tick: u64,
+    /// Whether results were added, or the LRU order of a full cache changed,
+    /// since the cache was loaded or saved
+    dirty: bool,
+}
+
+impl<V: Clone> TailCache<V> {
+    fn new() -> Self {
+        TailCache {
+            entries: HashMap::new(),
+            tick: 0,
+            dirty: false,
+        }
+    }
+
+    fn get(&mut self, key: &TailKey) -> Option<V> {
+        self.tick += 1;
+        let tick = self.tick;
+        let full = self.entries.len() >= TAIL_CACHE_CAPACITY;
+        let (result, used) = self.entries.get_mut(key)?;
+        *used = tick;
+        // The order only decides evictions once the cache is full; save it
+        // then, so entries hit by every poll are not evicted first
+        if full {
+            self.dirty = true;
+        }
+        Some(result.clone())
+    }
+
+    fn insert(&mut self, key: TailKey, result: V) {
+        self.tick += 1;
+        if self.entries.len() >= TAIL_CACHE_CAPACITY && !self.entries.contains_key(&key) {
+            // Evict the least recently used entry
+            if let Some(oldest) = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, used))| *used)
+                .map(|(k, _)| k.clone())
+            {
+                self.entries.remove(&oldest);
+            }
+        }
+        self.entries.insert(key, (result, self.tick));
+        self.dirty = true;
+    }
+
+    /// Cached entries, least recently used first.
+    fn oldest_first(&self) -> Vec<(TailKey, V)> {
+        let mut entries: Vec<_> = self.entries.iter().collect();
+        entries.sort_by_key(|(_, (_, used))| *used);
+        entries
+            .into_iter()
+            .map(|(key, (result, _))| (key.clone(), result.clone()))
+            .collect()
+    }
+
+    /// Add previously saved entries, oldest first, keeping their LRU order.
+    fn restore(&mut self, entries: impl IntoIterator<Item = (TailKey, V)>) {
+        for (key, result) in entries {
+            self.insert(key, result);
+        }
+        self.dirty = false;
+    }
+}
+
+/// On-disk form of the tail caches, least recently used entries first.
+///
+/// `poll` runs as a new process every time, so cached tails only save work
+/// across polls when they are persisted in between.
+#[derive(Default, Serialize, Deserialize)]
+struct PersistedTailCaches {
+    #[serde(default)]
+    version: u32,
+    #[serde(default)]
+    claude: Vec<(TailKey, Option<String>, bool, bool)>,
+    #[serde(default)]
+    codex: Vec<(TailKey, bool, bool)>,
+}
+
+impl PersistedTailCaches {
+    fn from_caches(claude: &TailCache<TailResult>, codex: &TailCache<(bool, bool)>) -> Self {
+        PersistedTailCaches {
+            version: TAIL_CACHE_VERSION,
+            claude: claude
+                .oldest_first()
+                .into_iter()
+                .map(|(key, (role, pending, plan))| (key, role.map(String::from), pending, plan))
+                .collect(),
+            codex: codex
+                .oldest_first()
+                .into_iter()
+                .map(|(key, (call, escalation))| (key, call, escalation))
+                .collect(),
+        }
+    }
+
+    fn restore_into(self, claude: &mut TailCache<TailResult>, codex: &mut TailCache<(bool, bool)>) {
+        claude.restore(self.claude.into_iter().map(|(key, role, pending, plan)| {
+            let role = match role.as_deref() {
+                Some(ROLE_ASSISTANT) => Some(ROLE_ASSISTANT),
+                Some(ROLE_USER) => Some(ROLE_USER),
+                _ => None,
+            };
+            (key, (role, pending, plan))
+        }));
+        codex.restore(
+            self.codex
+                .into_iter()
+                .map(|(key, call, escalation)| (key, (call, escalation))),
+        );
+    }
+}
+
+/// Path the tail caches are persisted to between polls.
+pub fn tail_cache_path() -> PathBuf {
+    state_dir_for_cwd("").join(TAIL_CACHE_FILE)
+}
+
+/// Load tail results saved by an earlier poll into the in-memory caches.
+///
+/// A missing, unreadable or outdated file leaves the caches as they are;
+/// every transcript is then simply read again.
+pub fn load_tail_caches(path: &Path) {
+    load_tail_caches_into(
+        path,
+        &mut tail_cache().lock().unwrap(),
+        &mut codex_tail_cache().lock().unwrap(),
+    );
+}
+
+fn load_tail_caches_into(
+    path: &Path,
+    claude: &mut TailCache<TailResult>,
+    codex: &mut TailCache<(bool, bool)>,
+) {
+    let persisted: PersistedTailCaches = match fs::read(path)
+        .ok()
+        .and_then(|data| serde_json::from_slice(&data).ok())
+    {
+        Some(p) => p,
+        None => return,
+    };
+    if persisted.version == TAIL_CACHE_VERSION {
+        persisted.restore_into(claude, codex);
+    }
+}
+
+/// Save the in-memory tail caches for the next poll if they changed.
+pub fn save_tail_caches(path: &Path) -> std::io::Result<()> {
+    save_tail_caches_from(
+        path,
+        &mut tail_cache().lock().unwrap(),
+        &mut codex_tail_cache().lock().unwrap(),
+    )
+}
+
+fn save_tail_caches_from(
+    path: &Path,
+    claude: &mut TailCache<TailResult>,
+    codex: &mut TailCache<(bool, bool)>,
+) -> std::io::Result<()> {
+    if !claude.dirty && !codex.dirty {
+        return Ok(());
+    }
+    let data = serde_json::to_vec(&PersistedTailCaches::from_caches(claude, codex))?;
+    if let Some(dir) = path.parent() {
+        fs::create_dir_all(dir)?;
+    }
+    // Write a temporary file and rename it over the cache, so a concurrent
+    // poll or an interrupted write never leaves a truncated file behind
+    let tmp = path.with_extension(format!("json.{}.tmp", std::process::id()));
+    if let Err(e) = fs::write(&tmp, data).and_then(|_| fs::rename(&tmp, path)) {
+        let _ = fs::remove_file(&tmp);
+        return Err(e);
+    }
+    claude.dirty = false;
+    codex.dirty = false;
+    Ok(())
+}
+
+fn tail_cache() -> &'static Mutex<TailCache<TailResult>> {
+    static CACHE: OnceLock<Mutex<TailCache<TailResult>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(TailCache::new()))
+}
+
+fn codex_tail_cache() -> &'static Mutex<TailCache<(bool, bool)>> {
+    static CACHE: OnceLock<Mutex<TailCache<(bool, bool)>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(TailCache::new()))
+}
+
+/// Cache key for a file, or None if the platform reports no mtime.
+fn tail_key(path: &str, metadata: &fs::Metadata) -> Option<TailKey> {
+    let mtime = metadata.modified().ok()?;
+    Some((path.to_string(), mtime, metadata.len()))
+}
+
 /// Parse the tail of a transcript JSONL file.
 /// Returns (last_role, has_pending_tool, in_plan_mode).
 ///
 /// last_role: "user" | "assistant" | None
 /// has_pending_tool: true if last assistant message has unpaired tool_use
 /// in_plan_mode: true if EnterPlanMode completed but ExitPlanMode has not
-pub fn parse_transcript_tail(path: &str) -> (Option<String>, bool, bool) {
+///
+/// `metadata` is the caller's stat of `path`, so the file is not stat'ed twice.
+/// With `need_plan_mode` false, plan mode is not evaluated and reported as
+/// false, which lets the scan stop as soon as last_role and pending are known.
+/// Only then is the tail read in growing chunks (see TAIL_INITIAL_CHUNK), and
+/// the result is not cached. With it true, the whole window is read at once
+/// and the result is cached.
+pub fn parse_transcript_tail(
+    path: &str,
+    metadata: &fs::Metadata,
+    need_plan_mode: bool,
+) -> TailResult {
     if path.is_empty() {
         return (None, false, false);
     }
 
-    let content = match read_tail(path, 65536) {
-        Some(c) => c,
+    let key = tail_key(path, metadata);
+    if let Some(key) = &key {
+        if let Some(cached) = tail_cache().lock().unwrap().get(key) {
+            return cached;
+        }
+    }
+
+    let file = match fs::File::open(path) {
+        Ok(f) => f,
+        Err(_) => return (None, false, false),
+    };
+
+    let size = metadata.len();
+    if !need_plan_mode {
+        return scan_tail_growing(&file, size).unwrap_or((None, false, false));
+    }
+
+    // Plan mode can only be ruled out by checking the whole window for
+    // EnterPlanMode, so the window is read in one go
+    let buf = match read_tail(&file, size, TAIL_WINDOW) {
+        Some(b) => b,
         None => return (None, false, false),
     };
+    let result = scan_lines(complete_lines(&buf, size > TAIL_WINDOW));
 
-    parse_transcript_content(&content)
+    // Only complete results are cached; a later poll may need plan mode
+    if let Some(key) = key {
+        tail_cache().lock().unwrap().insert(key, result);
+    }
+    result
 }
 
-/// Read the last `max_bytes` of a file as a string.
-fn read_tail(path: &str, max_bytes: u64) -> Option<String> {
-    let mut file = fs::File::open(path).ok()?;
-    let size = file.metadata().ok()?.len();
-    let chunk = size.min(max_bytes);
-    if chunk == 0 {
-        return Some(String::new());
+/// Scan the tail of an open file of `size` bytes without evaluating plan mode.
+///
+/// Most decisions are made by the last few records, so this starts with a
+/// small chunk and only reads further back (up to TAIL_WINDOW) while
+/// undecided. Chunks are read back-to-front into one buffer and only the
+/// lines each one adds are scanned.
+fn scan_tail_growing(file: &fs::File, size: u64) -> Option<TailResult> {
+    let window = size.min(TAIL_WINDOW);
+    let buf_len = window + u64::from(size > window);
+    let mut buf = vec![0u8; buf_len as usize];
+    let mut chunk = window.min(TAIL_INITIAL_CHUNK);
+    let mut read = 0;
+    let mut scanner = TailScanner::new(false);
+    // Buffer offset of the complete lines scanned so far
+    let mut lines_start = buf.len();
+    loop {
+        // Include the byte before the chunk to tell whether its first line is complete
+        let want = chunk + u64::from(size > chunk);
+        let start = (buf_len - want) as usize;
+        let end = (buf_len - read) as usize;
+        file.read_exact_at(&mut buf[start..end], size - want).ok()?;
+        read = want;
+
+        let new_start = buf.len() - complete_lines(&buf[start..], size > chunk).len();
+        if scanner.scan(&buf[new_start..lines_start]) || chunk == window {
+            return Some(scanner.into_result());
+        }
+        lines_start = new_start;
+        chunk = (chunk * 4).min(window);
     }
-    file.seek(SeekFrom::Start(size - chunk)).ok()?;
+}
+
+/// Read the last `max_bytes` of an open file of `size` bytes (a single pread,
+/// without moving the file cursor).
+///
+/// When the file is larger, the byte before the tail is read as well so
+/// `complete_lines` can tell whether the first line is cut off.
+fn read_tail(file: &fs::File, size: u64, max_bytes: u64) -> Option<Vec<u8>> {
+    let chunk = size.min(max_bytes) + u64::from(size > max_bytes);
     let mut buf = vec![0u8; chunk as usize];
-    file.read_exact(&mut buf).ok()?;
-    Some(String::from_utf8_lossy(&buf).to_string())
+    file.read_exact_at(&mut buf, size - chunk).ok()?;
+    Some(buf)
+}
+
+/// Drop the leading partial line of a buffer that starts mid-file.
+///
+/// `buf` must then start with the byte preceding the region of interest, so
+/// a region that happens to begin on a line boundary loses nothing.
+fn complete_lines(buf: &[u8], starts_mid_file: bool) -> &[u8] {
+    if !starts_mid_file {
+        return buf;
+    }
+    match memchr::memchr(b'\n', buf) {
+        Some(nl) => &buf[nl + 1..],
+        None => &[],
+    }
+}
+
+/// What status detection needs from a message's content items.
+#[derive(Default)]
+struct ContentSummary {
+    has_tool_use: bool,
+    has_tool_result: bool,
+    has_error: bool,
+    /// Whether any tool_use is EnterPlanMode
+    has_enter_plan: bool,
+    /// The last EnterPlanMode / ExitPlanMode tool_use
+    last_plan_tool: Option<ToolName>,
+}
+
+impl ContentSummary {
+    /// Summarize a content array; items that are not objects, and fields of
+    /// an unexpected JSON type, are ignored.
+    fn from_items(items: &[serde_json::Value]) -> Self {
+        let mut summary = ContentSummary::default();
+        for item in items {
+            let item_type = item.get("type").and_then(|v| v.as_str());
+            match item_type.map(ItemType::from_name) {
+                Some(ItemType::ToolUse) => {
+                    summary.has_tool_use = true;
+                    let name = item.get("name").and_then(|v| v.as_str());
+                    match name.map(ToolName::from_name) {
+                        Some(ToolName::EnterPlanMode) => {
+                            summary.has_enter_plan = true;
+                            summary.last_plan_tool = Some(ToolName::EnterPlanMode);
+                        }
+                        Some(ToolName::ExitPlanMode) => {
+                            summary.last_plan_tool = Some(ToolName::ExitPlanMode);
+                        }
+                        _ => {}
+                    }
+                }
+                Some(ItemType::ToolResult) => summary.has_tool_result = true,
+                _ => {}
+            }
+            if item.get("is_error").and_then(|v| v.as_bool()) == Some(true) {
+                summary.has_error = true;
+            }
+        }
+        summary
+    }
+
+    /// Plan mode after these tool calls were completed by a tool_result with
+    /// `is_error`; a failed ExitPlanMode leaves plan mode unchanged, so the
+    /// last matching tool wins. None if no plan tool applies.
+    fn plan_mode_after(&self, is_error: bool) -> Option<bool> {
+        match self.last_plan_tool {
+            Some(ToolName::ExitPlanMode) if !is_error => Some(false),
+            Some(_) if self.has_enter_plan => Some(true),
+            _ => None,
+        }
+    }
+}
+
+/// Content item types that drive pending state.
+#[derive(Clone, Copy)]
+enum ItemType {
+    ToolUse,
+    ToolResult,
+    Other,
+}
+
+impl ItemType {
+    fn from_name(name: &str) -> Self {
+        match name {
+            "tool_use" => ItemType::ToolUse,
+            "tool_result" => ItemType::ToolResult,
+            _ => ItemType::Other,
+        }
+    }
+}
+
+/// Tool names that drive plan mode state.
+#[derive(Clone, Copy)]
+enum ToolName {
+    EnterPlanMode,
+    ExitPlanMode,
+    Other,
+}
+
+impl ToolName {
+    fn from_name(name: &str) -> Self {
+        match name {
+            "EnterPlanMode" => ToolName::EnterPlanMode,
+            "ExitPlanMode" => ToolName::ExitPlanMode,
+            _ => ToolName::Other,
+        }
+    }
 }
 
 /// Parse transcript content (JSONL lines) and determine last_role + pending + plan mode state.
 ///
 /// Returns (last_role, has_pending_tool, in_plan_mode).
 /// in_plan_mode: true if EnterPlanMode completed but ExitPlanMode has not.
-pub fn parse_transcript_content(content: &str) -> (Option<String>, bool, bool) {
-    let mut last_role: Option<String> = None;
-    let mut pending = false;
-    let mut in_plan_mode = false;
-    let mut last_assistant_tool_names: Vec<String> = Vec::new();
-
-    for line in content.lines() {
-        let line = line.trim();
-        if line.is_empty() {
-            continue;
+#[cfg(test)]
+pub fn parse_transcript_content(content: &str) -> TailResult {
+    scan_lines(content.as_bytes())
+}
+
+/// Scan complete transcript lines, including plan mode.
+fn scan_lines(content: &[u8]) -> TailResult {
+    // Without an EnterPlanMode record plan mode cannot be on, so the scan
+    // need not look for it
+    let mut scanner = TailScanner::new(ENTER_PLAN_MODE_FINDER.find(content).is_some());
+    scanner.scan(content);
+    scanner.into_result()
+}
+
+/// Newest-first scan state for a transcript tail; None means undecided.
+///
+/// The state survives between calls to `scan`, so when the tail is read
+/// further back only the newly exposed lines are parsed.
+struct TailScanner {
+    last_role: Option<&'static str>,
+    pending: Option<bool>,
+    in_plan_mode: Option<bool>,
+    /// is_error of the oldest tool_result seen since the last assistant message;
+    /// that result is the one that completes the assistant's tool calls
+    unmatched_result: Option<bool>,
+}
+
+impl TailScanner {
+    /// Plan mode is reported as false without scanning when `scan_plan_mode` is false.
+    fn new(scan_plan_mode: bool) -> Self {
+        TailScanner {
+            last_role: None,
+            pending: None,
+            in_plan_mode: if scan_plan_mode { None } else { Some(false) },
+            unmatched_result: None,
         }
-        let entry: serde_json::Value = match serde_json::from_str(line) {
+    }
+
+    /// Whether older lines can no longer change the result.
+    fn is_settled(&self) -> bool {
+        self.last_role.is_some() && self.pending.is_some() && self.in_plan_mode.is_some()
+    }
+
+    fn into_result(self) -> TailResult {
+        (
+            self.last_role,
+            self.pending.unwrap_or(false),
+            self.in_plan_mode.unwrap_or(false),
+        )
+    }
+
+    /// Scan the complete lines of `content` newest-first until settled.
+    ///
+    /// Returns whether the scan settled; if not, all of `content` was scanned
+    /// and a later call may continue with the lines before it.
+    fn scan(&mut self, content: &[u8]) -> bool {
+        // Resolve the lazily built prefilter once rather than per line
+        let (assistant, user): (&Finder, &Finder) = (&ASSISTANT_FINDER, &USER_FINDER);
+        let mut end = content.len();
+        while !self.is_settled() {
+            let start = memchr::memrchr(b'\n', &content[..end]).map_or(0, |nl| nl + 1);
+            let line = &content[start..end];
+            // Only lines mentioning an assistant or user role are parsed
+            if assistant.find(line).is_some() || user.find(line).is_some() {
+                self.scan_line(line);
+            }
+            if start == 0 {
+                break;
+            }
+            end = start - 1;
+        }
+        self.is_settled()
+    }
+
+    fn scan_line(&mut self, line: &[u8]) {
+        // serde_json parses bytes directly and skips surrounding whitespace
+        let entry: serde_json::Value = match serde_json::from_slice(line) {
             Ok(v) => v,
-            Err(_) => continue,
+            Err(_) => return,
         };
 
         let entry_type = entry.get("type").and_then(|v| v.as_str()).unwrap_or("");
         let msg = entry.get("message").unwrap_or(&serde_json::Value::Null);
         let role = msg.get("role").and_then(|v| v.as_str()).unwrap_or("");
-        let content_arr = msg.get("content").and_then(|v| v.as_array());
-
-        if entry_type == "assistant" && role == "assistant" {
-            last_role = Some("assistant".to_string());
-            last_assistant_tool_names.clear();
-            if let Some(items) = content_arr {
-                let types: Vec<&str> = items
-                    .iter()
-                    .filter_map(|c| c.get("type").and_then(|v| v.as_str()))
-                    .collect();
-                pending = types.contains(&"tool_use");
-
-                // Track tool names for plan mode detection
-                for item in items {
-                    if item.get("type").and_then(|v| v.as_str()) == Some("tool_use") {
-                        if let Some(name) = item.get("name").and_then(|v| v.as_str()) {
-                            last_assistant_tool_names.push(name.to_string());
-                        }
-                    }
+        // None unless the content is an array of items (it may also be a plain string)
+        let content = msg
+            .get("content")
+            .and_then(|v| v.as_array())
+            .map(|items| ContentSummary::from_items(items));
+        let content = content.as_ref();
+
+        if entry_type == ROLE_ASSISTANT && role == ROLE_ASSISTANT {
+            self.last_role.get_or_insert(ROLE_ASSISTANT);
+            if self.pending.is_none() {
+                if let Some(content) = content {
+                    self.pending = Some(content.has_tool_use);
                 }
             }
-        } else if entry_type == "user" && role == "user" {
-            last_role = Some("user".to_string());
-            if let Some(items) = content_arr {
-                let types: Vec<&str> = items
-                    .iter()
-                    .filter_map(|c| c.get("type").and_then(|v| v.as_str()))
-                    .collect();
-                if types.contains(&"tool_result") {
-                    pending = false;
-
-                    // Check if completed tool is plan mode related
-                    for name in &last_assistant_tool_names {
-                        match name.as_str() {
-                            "EnterPlanMode" => {
-                                in_plan_mode = true;
-                            }
-                            "ExitPlanMode" => {
-                                let is_error = items.iter().any(|c| {
-                                    c.get("is_error").and_then(|v| v.as_bool()).unwrap_or(false)
-                                });
-                                if !is_error {
-                                    in_plan_mode = false;
-                                }
-                            }
-                            _ => {}
-                        }
-                    }
-                    last_assistant_tool_names.clear();
+
+            // Check if the tools completed by the following tool_result are
+            // plan mode related; the last matching tool wins
+            if self.in_plan_mode.is_none() {
+                if let Some(is_error) = self.unmatched_result.take() {
+                    self.in_plan_mode = content.and_then(|c| c.plan_mode_after(is_error));
                 }
             }
+        } else if entry_type == ROLE_USER && role == ROLE_USER {
+            self.last_role.get_or_insert(ROLE_USER);
+            if let Some(content) = content.filter(|c| c.has_tool_result) {
+                self.pending.get_or_insert(false);
+                self.unmatched_result = Some(content.has_error);
+            }
         }
     }
-
-    (last_role, pending, in_plan_mode)
 }
 
 /// Get file mtime age in seconds (how long ago it was modified).
-pub fn get_mtime_age(path: &str) -> Option<f64> {
-    let metadata = fs::metadata(path).ok()?;
+pub fn get_mtime_age(metadata: &fs::Metadata) -> Option<f64> {
     let mtime = metadata.modified().ok()?;
     let age = SystemTime::now().duration_since(mtime).ok()?;
     Some(age.as_secs_f64())
@@ -132,50 +603,86 @@ pub fn determine_status(transcript: Option<&str>) -> Status {
         _ => return Status::Active,
     };
 
-    let age = match get_mtime_age(transcript) {
+    // One stat serves both the age check and the tail reader
+    let metadata = match fs::metadata(transcript) {
+        Ok(m) => m,
+        Err(_) => return Status::Active,
+    };
+    let age = match get_mtime_age(&metadata) {
         Some(a) => a,
         None => return Status::Active,
     };
 
-    let (last_role, pending, in_plan_mode) = parse_transcript_tail(transcript);
-
-    // Pending: tool_use waiting for user action
-    // 3s grace period filters auto-approved tools (complete in <2s)
-    // 120s timeout degrades to idle (session likely abandoned)
-    // In plan mode, no timeout (user may review plan for a long time)
-    if pending && age >= 3.0 {
-        if in_plan_mode {
-            return Status::Pending;
-        }
-        return if age < 120.0 {
-            Status::Pending
-        } else {
-            Status::Idle
-        };
-    }
-
-    // Recent activity -> active
-    if age < 10.0 {
+    // Inside the pending grace period every branch below resolves to active,
+    // so skip reading the tail entirely
+    let quiet = Quiet::from_age(age);
+    if matches!(quiet, Quiet::Grace) {
         return Status::Active;
     }
 
-    // User sent message, Claude processing (API call)
-    if last_role.as_deref() == Some("user") {
-        return if age < 120.0 {
-            Status::Active
+    // Plan mode only changes the outcome once the session has been quiet
+    // for 10s (see status_from_tail), so skip looking for it before that
+    let (last_role, pending, in_plan_mode) =
+        parse_transcript_tail(transcript, &metadata, !matches!(quiet, Quiet::Recent));
+    status_from_tail(quiet, last_role, pending, in_plan_mode)
+}
+
+/// How long a transcript has gone without writes, in the bands status cares about.
+#[derive(Clone, Copy)]
+enum Quiet {
+    /// Under 3s: auto-approved tools complete in <2s, so a tool_use is not pending yet
+    Grace,
+    /// Under 10s: recent activity
+    Recent,
+    /// Under 120s: waiting on the user or the API
+    Waiting,
+    /// 120s or more: session likely abandoned
+    Abandoned,
+}
+
+impl Quiet {
+    fn from_age(age: f64) -> Self {
+        if age < 3.0 {
+            Quiet::Grace
+        } else if age < 10.0 {
+            Quiet::Recent
+        } else if age < 120.0 {
+            Quiet::Waiting
         } else {
-            Status::Idle
-        };
+            Quiet::Abandoned
+        }
     }
+}
 
-    // In plan mode, show pending instead of idle
-    // (Claude is waiting for user input within a planning session)
-    if in_plan_mode {
-        return Status::Pending;
+/// Map how long a transcript has been quiet and its parsed tail state to a
+/// session status.
+///
+/// The match is the full decision table; its arms are checked in order.
+fn status_from_tail(
+    quiet: Quiet,
+    last_role: Option<&str>,
+    pending: bool,
+    in_plan_mode: bool,
+) -> Status {
+    use Quiet::*;
+
+    let user_turn = last_role == Some(ROLE_USER);
+    match (quiet, pending, in_plan_mode, user_turn) {
+        // Recent activity -> active (includes tool_use inside the grace period)
+        (Grace, ..) | (Recent, false, ..) => Status::Active,
+        // Pending: tool_use waiting for user action; in plan mode there is
+        // no timeout (user may review plan for a long time)
+        (_, true, true, _) | (Recent | Waiting, true, false, _) => Status::Pending,
+        (Abandoned, true, false, _) => Status::Idle,
+        // User sent message, Claude processing (API call)
+        (Waiting, false, _, true) => Status::Active,
+        (Abandoned, false, _, true) => Status::Idle,
+        // In plan mode, show pending instead of idle
+        // (Claude is waiting for user input within a planning session)
+        (_, false, true, false) => Status::Pending,
+        // Assistant finished -> idle
+        (_, false, false, false) => Status::Idle,
     }
-
-    // Assistant finished -> idle
-    Status::Idle
 }
 
 /// Determine status for an agent provider using provider-specific transcript semantics.
@@ -188,29 +695,61 @@ pub fn determine_status_for(provider: Provider, transcript: Option<&str>) -> Sta
 
 /// Parse the tail of a Codex session JSONL file.
 /// Returns (has_pending_function_call, has_pending_escalation_call).
-pub fn parse_codex_tail(path: &str) -> (bool, bool) {
+///
+/// `metadata` is the caller's stat of `path`; results are cached like
+/// Claude transcript tails.
+pub fn parse_codex_tail(path: &str, metadata: &fs::Metadata) -> (bool, bool) {
     if path.is_empty() {
         return (false, false);
     }
 
-    let content = match read_tail(path, 65536) {
+    let key = tail_key(path, metadata);
+    if let Some(key) = &key {
+        if let Some(cached) = codex_tail_cache().lock().unwrap().get(key) {
+            return cached;
+        }
+    }
+
+    let file = match fs::File::open(path) {
+        Ok(f) => f,
+        Err(_) => return (false, false),
+    };
+    let size = metadata.len();
+    let content = match read_tail(&file, size, TAIL_WINDOW) {
         Some(c) => c,
         None => return (false, false),
     };
-    parse_codex_content(&content)
+    let result = parse_codex_bytes(complete_lines(&content, size > TAIL_WINDOW));
+    if let Some(key) = key {
+        codex_tail_cache().lock().unwrap().insert(key, result);
+    }
+    result
 }
 
 /// Parse Codex JSONL event content and compute pending tool-call state.
+#[cfg(test)]
 pub fn parse_codex_content(content: &str) -> (bool, bool) {
+    parse_codex_bytes(content.as_bytes())
+}
+
+/// Parse raw Codex JSONL bytes; lines are parsed without decoding the tail first.
+fn parse_codex_bytes(content: &[u8]) -> (bool, bool) {
+    // Idle sessions usually have no tool call left in the tail at all
+    if FUNCTION_CALL_FINDER.find(content).is_none() {
+        return (false, false);
+    }
+
     let mut pending_calls: std::collections::HashMap<String, bool> =
         std::collections::HashMap::new();
 
-    for line in content.lines() {
-        let line = line.trim();
-        if line.is_empty() {
+    let call_event: &Finder = &CALL_EVENT_FINDER;
+    for line in content.split(|&b| b == b'\n') {
+        // Only call and call-output events affect the result; skip the
+        // JSON parse for messages, reasoning and session metadata
+        if call_event.find(line).is_none() {
             continue;
         }
-        let entry: serde_json::Value = match serde_json::from_str(line) {
+        let entry: serde_json::Value = match serde_json::from_slice(line) {
             Ok(v) => v,
             Err(_) => continue,
         };
@@ -263,12 +802,16 @@ pub fn determine_codex_status(transcript: Option<&str>) -> Status {
         _ => return Status::Active,
     };
 
-    let age = match get_mtime_age(transcript) {
+    let metadata = match fs::metadata(transcript) {
+        Ok(m) => m,
+        Err(_) => return Status::Active,
+    };
+    let age = match get_mtime_age(&metadata) {
         Some(a) => a,
         None => return Status::Active,
     };
 
-    let (has_pending_call, has_pending_escalation) = parse_codex_tail(transcript);
+    let (has_pending_call, has_pending_escalation) = parse_codex_tail(transcript, &metadata);
     if has_pending_escalation {
         return Status::Pending;
     }
@@ -294,34 +837,7 @@ pub fn determine_status_with_age(transcript_content: Option<&str>, age: Option<f
         _ => (None, false, false),
     };
 
-    if pending && age >= 3.0 {
-        if in_plan_mode {
-            return Status::Pending;
-        }
-        return if age < 120.0 {
-            Status::Pending
-        } else {
-            Status::Idle
-        };
-    }
-
-    if age < 10.0 {
-        return Status::Active;
-    }
-
-    if last_role.as_deref() == Some("user") {
-        return if age < 120.0 {
-            Status::Active
-        } else {
-            Status::Idle
-        };
-    }
-
-    if in_plan_mode {
-        return Status::Pending;
-    }
-
-    Status::Idle
+    status_from_tail(Quiet::from_age(age), last_role, pending, in_plan_mode)
 }
 
 /// Resolve the correct transcript file for a given TTY's session.
@@ -335,20 +851,20 @@ pub fn resolve_transcript(
     project_dir: &Path,
     active_ttys: &std::collections::HashSet<String>,
 ) -> String {
-    // 1) Try this TTY's state file
+    // 1) Try this TTY's state file (reading it fails if it does not exist,
+    //    so it is not stat'ed first)
     let state_file = state_dir.join(format!("session-{}.json", tty_short));
-    if state_file.is_file() {
-        if let Ok(content) = fs::read_to_string(&state_file) {
-            if let Ok(state) = serde_json::from_str::<crate::state::SessionState>(&content) {
-                if !state.transcript_path.is_empty() && Path::new(&state.transcript_path).is_file()
-                {
-                    return state.transcript_path;
-                }
+    if let Ok(content) = fs::read_to_string(&state_file) {
+        if let Ok(state) = serde_json::from_str::<crate::state::SessionState>(&content) {
+            if !state.transcript_path.is_empty() && Path::new(&state.transcript_path).is_file() {
+                return state.transcript_path;
             }
         }
     }
 
-    // 2) Collect transcripts claimed by OTHER active sessions
+    // 2) Collect transcripts claimed by OTHER active sessions; a claimed path
+    //    that no longer exists can never match the listing below, so the
+    //    paths are not stat'ed
     let mut claimed = std::collections::HashSet::new();
     if let Ok(entries) = fs::read_dir(state_dir) {
         for entry in entries.flatten() {
@@ -362,9 +878,7 @@ pub fn resolve_transcript(
             }
             if let Ok(content) = fs::read_to_string(entry.path()) {
                 if let Ok(state) = serde_json::from_str::<crate::state::SessionState>(&content) {
-                    if !state.transcript_path.is_empty()
-                        && Path::new(&state.transcript_path).is_file()
-                    {
+                    if !state.transcript_path.is_empty() {
                         claimed.insert(state.transcript_path);
                     }
                 }
@@ -503,15 +1017,16 @@ pub fn state_dir_for_cwd(cwd: &str) -> std::path::PathBuf {
 mod tests {
     use super::*;
     use std::fs;
-    use std::io::Write;
     use tempfile::TempDir;
 
     fn make_transcript(dir: &Path, name: &str, lines: &[serde_json::Value]) -> String {
         let path = dir.join(format!("{}.jsonl", name));
-        let mut f = fs::File::create(&path).unwrap();
+        let mut data = Vec::new();
         for line in lines {
-            writeln!(f, "{}", serde_json::to_string(line).unwrap()).unwrap();
+            serde_json::to_writer(&mut data, line).unwrap();
+            data.push(b'\n');
         }
+        fs::write(&path, data).unwrap();
         path.to_string_lossy().to_string()
     }
 
@@ -538,7 +1053,7 @@ mod tests {
         let content = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"Hello"}]}}"#;
         assert_eq!(
             parse_transcript_content(content),
-            (Some("assistant".into()), false, false)
+            (Some("assistant"), false, false)
         );
     }
 
@@ -547,7 +1062,7 @@ mod tests {
         let content = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"thinking","thinking":"..."},{"type":"text","text":"Done"}]}}"#;
         assert_eq!(
             parse_transcript_content(content),
-            (Some("assistant".into()), false, false)
+            (Some("assistant"), false, false)
         );
     }
 
@@ -556,7 +1071,7 @@ mod tests {
         let content = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"Read","input":{}}]}}"#;
         assert_eq!(
             parse_transcript_content(content),
-            (Some("assistant".into()), true, false)
+            (Some("assistant"), true, false)
         );
     }
 
@@ -567,7 +1082,7 @@ mod tests {
         let content = format!("{}\n{}", line1, line2);
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("user".into()), false, false)
+            (Some("user"), false, false)
         );
     }
 
@@ -581,7 +1096,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("assistant".into()), true, false)
+            (Some("assistant"), true, false)
         );
     }
 
@@ -595,7 +1110,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("assistant".into()), false, false)
+            (Some("assistant"), false, false)
         );
     }
 
@@ -608,7 +1123,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("user".into()), false, false)
+            (Some("user"), false, false)
         );
     }
 
@@ -621,7 +1136,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("assistant".into()), false, false)
+            (Some("assistant"), false, false)
         );
     }
 
@@ -630,19 +1145,84 @@ mod tests {
         let content = r#"{"type":"user","message":{"role":"user","content":[{"type":"text","text":"Hello"}]}}"#;
         assert_eq!(
             parse_transcript_content(content),
-            (Some("user".into()), false, false)
+            (Some("user"), false, false)
         );
     }
 
     // ─── plan mode detection tests ───
 
+    #[test]
+    fn test_string_content_user_message() {
+        let lines = [
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"Read","input":{"file_path":"/tmp/a"}}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":"Keep going"}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("user"), true, false)
+        );
+    }
+
+    #[test]
+    fn test_non_bool_is_error_ignored() {
+        let lines = [
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"Read","input":{}}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t1","is_error":"false"}]}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("user"), false, false)
+        );
+    }
+
+    #[test]
+    fn test_non_object_user_content_item_ignored() {
+        let lines = [
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"Hi"}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":["text"]}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("user"), false, false)
+        );
+    }
+
+    #[test]
+    fn test_duplicate_content_item_key_last_wins() {
+        let lines = [
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"Read","input":{}}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":[{"type":"text","type":"tool_result","tool_use_id":"t1"}]}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("user"), false, false)
+        );
+    }
+
+    #[test]
+    fn test_null_assistant_content_item_ignored() {
+        let lines = [
+            r#"{"type":"user","message":{"role":"user","content":"Hi"}}"#,
+            r#"{"type":"assistant","message":{"role":"assistant","content":[null,{"type":"text","text":"Done"}]}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("assistant"), false, false)
+        );
+    }
+
     #[test]
     fn test_enter_plan_mode_pending() {
         // EnterPlanMode called but not completed yet
         let content = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"EnterPlanMode","input":{}}]}}"#;
         assert_eq!(
             parse_transcript_content(content),
-            (Some("assistant".into()), true, false)
+            (Some("assistant"), true, false)
         );
     }
 
@@ -655,7 +1235,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("user".into()), false, true)
+            (Some("user"), false, true)
         );
     }
 
@@ -672,7 +1252,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("assistant".into()), false, true)
+            (Some("assistant"), false, true)
         );
     }
 
@@ -687,7 +1267,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("assistant".into()), true, true)
+            (Some("assistant"), true, true)
         );
     }
 
@@ -703,7 +1283,7 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("user".into()), false, false)
+            (Some("user"), false, false)
         );
     }
 
@@ -719,7 +1299,25 @@ mod tests {
         let content = lines.join("\n");
         assert_eq!(
             parse_transcript_content(&content),
-            (Some("user".into()), false, true)
+            (Some("user"), false, true)
+        );
+    }
+
+    #[test]
+    fn test_plan_mode_exit_completed_by_oldest_tool_result() {
+        // The first tool_result after ExitPlanMode completes it; later results
+        // do not re-evaluate the same tool call
+        let lines = [
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"EnterPlanMode","input":{}}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t1","content":"Entered plan mode."}]}}"#,
+            r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t2","name":"ExitPlanMode","input":{}}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t2","content":"Rejected.","is_error":true}]}}"#,
+            r#"{"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t3","content":"ok"}]}}"#,
+        ];
+        let content = lines.join("\n");
+        assert_eq!(
+            parse_transcript_content(&content),
+            (Some("user"), false, true)
         );
     }
 
@@ -924,6 +1522,193 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_determine_status_fresh_pending_is_active() {
+        let tmp = TempDir::new().unwrap();
+        let tp = make_transcript(
+            tmp.path(),
+            "fresh",
+            &[
+                serde_json::json!({"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"Read","input":{}}]}}),
+            ],
+        );
+        assert_eq!(determine_status(Some(&tp)), Status::Active);
+        set_mtime(&tp, 30.0);
+        assert_eq!(determine_status(Some(&tp)), Status::Pending);
+    }
+
+    #[test]
+    fn test_parse_transcript_tail_cached_until_modified() {
+        let tmp = TempDir::new().unwrap();
+        let text = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"Finished"}]}}"#;
+        let tool = r#"{"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","name":"Read"}]}}"#;
+        assert_eq!(text.len(), tool.len());
+
+        let path = tmp.path().join("cached.jsonl");
+        let tp = path.to_string_lossy().to_string();
+        fs::write(&path, text).unwrap();
+        set_mtime(&tp, 30.0);
+        let mtime = fs::metadata(&path).unwrap().modified().unwrap();
+        assert_eq!(
+            parse_transcript_tail(&tp, &fs::metadata(&tp).unwrap(), true),
+            (Some("assistant"), false, false)
+        );
+
+        // Same path, mtime and size -> served from the cache
+        fs::write(&path, tool).unwrap();
+        filetime::set_file_mtime(&path, filetime::FileTime::from_system_time(mtime)).unwrap();
+        assert_eq!(
+            parse_transcript_tail(&tp, &fs::metadata(&tp).unwrap(), true),
+            (Some("assistant"), false, false)
+        );
+
+        // New mtime -> re-parsed
+        set_mtime(&tp, 20.0);
+        assert_eq!(
+            parse_transcript_tail(&tp, &fs::metadata(&tp).unwrap(), true),
+            (Some("assistant"), true, false)
+        );
+    }
+
+    #[test]
+    fn test_parse_transcript_tail_reads_back_past_initial_chunk() {
+        let tmp = TempDir::new().unwrap();
+        let progress = serde_json::json!({"type":"progress","data":{"text":"x".repeat(200)}});
+        let mut lines = vec![
+            serde_json::json!({"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"EnterPlanMode","input":{}}]}}),
+            serde_json::json!({"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t1","content":"Entered plan mode."}]}}),
+            serde_json::json!({"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t2","name":"Read","input":{}}]}}),
+        ];
+        lines.extend(std::iter::repeat_n(progress, 40));
+        let tp = make_transcript(tmp.path(), "long", &lines);
+        assert!(fs::metadata(&tp).unwrap().len() > TAIL_INITIAL_CHUNK * 2);
+
+        // Without plan mode the tail is read in growing chunks
+        assert_eq!(
+            parse_transcript_tail(&tp, &fs::metadata(&tp).unwrap(), false),
+            (Some("assistant"), true, false)
+        );
+        assert_eq!(
+            parse_transcript_tail(&tp, &fs::metadata(&tp).unwrap(), true),
+            (Some("assistant"), true, true)
+        );
+    }
+
+    #[test]
+    fn test_determine_status_plan_mode_by_age() {
+        let tmp = TempDir::new().unwrap();
+        let tp = make_transcript(
+            tmp.path(),
+            "plan",
+            &[
+                serde_json::json!({"type":"assistant","message":{"role":"assistant","content":[{"type":"tool_use","id":"t1","name":"EnterPlanMode","input":{}}]}}),
+                serde_json::json!({"type":"user","message":{"role":"user","content":[{"type":"tool_result","tool_use_id":"t1","content":"Entered plan mode."}]}}),
+                serde_json::json!({"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"Here is my plan..."}]}}),
+            ],
+        );
+        set_mtime(&tp, 5.0);
+        assert_eq!(determine_status(Some(&tp)), Status::Active);
+        set_mtime(&tp, 30.0);
+        assert_eq!(determine_status(Some(&tp)), Status::Pending);
+    }
+
+    #[test]
+    fn test_complete_lines() {
+        assert_eq!(complete_lines(b"ab\ncd\n", false), b"ab\ncd\n");
+        assert_eq!(complete_lines(b"ab\ncd\n", true), b"cd\n");
+        // Region starting right after a newline keeps its first line
+        assert_eq!(complete_lines(b"\ncd\n", true), b"cd\n");
+        assert_eq!(complete_lines(b"abcd", true), b"");
+    }
+
+    #[test]
+    fn test_tail_cache_evicts_least_recently_used() {
+        let mut cache: TailCache<TailResult> = TailCache::new();
+        let key = |i: usize| (format!("/t/{}.jsonl", i), SystemTime::UNIX_EPOCH, 0);
+        for i in 0..TAIL_CACHE_CAPACITY {
+            cache.insert(key(i), (None, false, false));
+        }
+        assert!(cache.get(&key(0)).is_some());
+        cache.insert(key(TAIL_CACHE_CAPACITY), (None, true, false));
+        assert_eq!(cache.entries.len(), TAIL_CACHE_CAPACITY);
+        assert!(cache.get(&key(0)).is_some());
+        assert!(cache.get(&key(1)).is_none());
+    }
+
+    #[test]
+    fn test_tail_cache_hit_dirties_only_when_full() {
+        let mut cache: TailCache<TailResult> = TailCache::new();
+        let key = |i: usize| (format!("/t/{}.jsonl", i), SystemTime::UNIX_EPOCH, 0);
+        cache.restore((0..TAIL_CACHE_CAPACITY - 1).map(|i| (key(i), (None, false, false))));
+        assert!(cache.get(&key(0)).is_some());
+        assert!(!cache.dirty);
+
+        cache.restore([(key(TAIL_CACHE_CAPACITY), (None, false, false))]);
+        assert!(cache.get(&key(0)).is_some());
+        assert!(cache.dirty);
+    }
+
+    #[test]
+    fn test_tail_cache_persist_roundtrip() {
+        let key = |i: usize| (format!("/t/{}.jsonl", i), SystemTime::UNIX_EPOCH, i as u64);
+        let mut claude: TailCache<TailResult> = TailCache::new();
+        let mut codex: TailCache<(bool, bool)> = TailCache::new();
+        claude.insert(key(0), (Some("user"), false, false));
+        claude.insert(key(1), (Some("assistant"), true, true));
+        codex.insert(key(2), (true, false));
+        claude.get(&key(0));
+
+        let json = serde_json::to_vec(&PersistedTailCaches::from_caches(&claude, &codex)).unwrap();
+        let persisted: PersistedTailCaches = serde_json::from_slice(&json).unwrap();
+        let mut claude: TailCache<TailResult> = TailCache::new();
+        let mut codex: TailCache<(bool, bool)> = TailCache::new();
+        persisted.restore_into(&mut claude, &mut codex);
+
+        assert!(!claude.dirty && !codex.dirty);
+        let keys: Vec<_> = claude.oldest_first().into_iter().map(|(k, _)| k).collect();
+        assert_eq!(keys, vec![key(1), key(0)]);
+        assert_eq!(claude.get(&key(0)), Some((Some("user"), false, false)));
+        assert_eq!(claude.get(&key(1)), Some((Some("assistant"), true, true)));
+        assert_eq!(codex.get(&key(2)), Some((true, false)));
+    }
+
+    #[test]
+    fn test_tail_cache_load_and_save() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("claude-bar").join(TAIL_CACHE_FILE);
+        let key = ("/t/a.jsonl".to_string(), SystemTime::UNIX_EPOCH, 1);
+        let mut claude: TailCache<TailResult> = TailCache::new();
+        let mut codex: TailCache<(bool, bool)> = TailCache::new();
+
+        // Nothing added yet: no file is written
+        save_tail_caches_from(&path, &mut claude, &mut codex).unwrap();
+        assert!(!path.exists());
+
+        claude.insert(key.clone(), (Some("assistant"), true, false));
+        save_tail_caches_from(&path, &mut claude, &mut codex).unwrap();
+        assert!(path.exists() && !claude.dirty);
+        let files = fs::read_dir(path.parent().unwrap()).unwrap().count();
+        assert_eq!(files, 1, "temporary file left behind");
+
+        let mut loaded: TailCache<TailResult> = TailCache::new();
+        load_tail_caches_into(&path, &mut loaded, &mut codex);
+        assert_eq!(loaded.get(&key), Some((Some("assistant"), true, false)));
+
+        // Corrupt, outdated and missing files are ignored
+        for contents in [
+            "{\"claude\":[",
+            r#"{"claude":[[["/t/a.jsonl",{"secs_since_epoch":0,"nanos_since_epoch":0},1],"assistant",true,false]]}"#,
+        ] {
+            fs::write(&path, contents).unwrap();
+            let mut loaded: TailCache<TailResult> = TailCache::new();
+            load_tail_caches_into(&path, &mut loaded, &mut codex);
+            assert!(loaded.get(&key).is_none());
+        }
+        let mut loaded: TailCache<TailResult> = TailCache::new();
+        load_tail_caches_into(&tmp.path().join("missing.json"), &mut loaded, &mut codex);
+        assert!(loaded.entries.is_empty());
+    }
+
     // ─── resolve_transcript tests ───
 
     #[test]
@@ -1180,6 +1965,14 @@ mod tests {
         assert_eq!(parse_codex_content(content), (false, false));
     }
 
+    #[test]
+    fn test_parse_codex_content_without_calls() {
+        let content = r#"{"type":"session_meta","payload":{"cwd":"/Users/test/a"}}
+{"type":"response_item","payload":{"type":"function_call_output","call_id":"call_1","output":"ok"}}
+{"type":"response_item","payload":{"type":"message","role":"assistant","content":[]}}"#;
+        assert_eq!(parse_codex_content(content), (false, false));
+    }
+
     #[test]
     fn test_determine_codex_status_pending_escalation() {
         let tmp = TempDir::new().unwrap();
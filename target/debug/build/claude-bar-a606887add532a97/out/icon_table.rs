@@ -0,0 +1,368 @@
+{
+    match (count, key) {
+        (1, 0) => Some("iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAbklEQVR4Ad2R0QnAIBBDO1PX6ATu5FBu0VH8bPOg95kiih8qBI/DxOTu2PSc95WEItQP1KkprghZeAzyr4hI/OzI0fdOJIDVeOjuYl1IgMyOGP06VWA4wtgQyaY59K8RASARnBCHoQJqvz5I6+IFmg7DVRvDYcMAAAAASUVORK5CYII="),
+        (1, 1) => Some("iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAbElEQVR4Ad2RwQ3AIAwD++6G7MQOXYWteFKf1DxdIRAPQLKIImzs5Dr0tOdOQhHqB+rUFVeELDSD/CsiEj87cvS9EwlgNR66u1gXEiCzI0a/LhWYjjA3RLJpDuNrRABIBCfEYaiA2q8P0r54Aa/D4DW5dgzMAAAAAElFTkSuQmCC"),
+        (1, 2) => Some("iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAaklEQVR4Ad2RQQrAIBAD+03/JF76IX/lsc1A95giigcVgstiYrJ7HXpKuZNQhfaBOnXFFSELj0H+FRGJnx05+t6JBLAaD91drQsJkNkRo9+WCkxHmBsi2TSH8TUiACSCE+IwVEDt1wdpX7w+kuKd2vCVIQAAAABJRU5ErkJggg=="),
+        (2, 0) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAnElEQVR4Ae2T0QnAIAxEnalrdAJ3cii36Ch+tncSRbChcFD8sXAaJO+iqYb9Le3AcZ0RylAxMY5fm0KuxFVfwAm6HaWa9DIgX+KqFWDu2Cva1qeTq1wtygEGbGkr4M2ZuaNUrnvAgP/UK9jWSwcsUDnDQ1ANVG4svKzVay4Xj462Sc9C5VizCyY8OdvOy0Yxnp5RByxQOcP39E8HHgGvhriZG8u+AAAAAElFTkSuQmCC"),
+        (2, 3) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAv0lEQVR4Ae2TwQ3DIBAE/U45aSMV0BM9pBW6SCk8yQ7irEhkxSvhY8trTohlfMdxXM/WCrTnLUlFqkPEafVT99cjSUWqQ8RLX99XoCw1o9wXffkIlKVmZH19K8HI1EFjfspAMDJ10JiffB3KR2BKGgA3FtZ+SmBKGgA3Tr5zD4E5UweM+XoaRiAwZ+qAMT/5hv04doK3lXpPc1Fzlfv/1wkwEpzMKTvNhoj9dcAkqcm4VnQ4zYaIlz5Zr/d3FXgDyv+jmA8EHVIAAAAASUVORK5CYII="),
+        (2, 6) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAvklEQVR4Ae2TwQ3DIBAEXVPaSAX0hPxJQ3SRUng6O4izIpEVr5iPLa85IZbxHcd2P0srsO+vJBWpdhGn2U893s8kFal2EU99bV+BsnQY5bbox0egLB1G1te2EoxMHTTmhwwEI1MHjfnB16B8BKakAXBjYe23BKakAXDj4Dv3EJgzdcCYr6ehBwJzpg4Y84Ov27dtJXhZqdc0FzVXua+/ToCR4GRO2Wk2ROyvAyZJTca1osNpNkQ89cl6v/+rwAfTaqYAJ/w4GAAAAABJRU5ErkJggg=="),
+        (2, 1) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAv0lEQVR4Ae2TwQ3DIBAE/U45aSMV0BM9pBW6SCk8yQ7irEhkxSvhY8trTohlfMdxXM/WCtxfjyQVqQ4Rp9VPtectSUWqQ8RLX99XoCw1o9wXffkIlKVmZH19K8HI1EFjfspAMDJ10JiffB3KR2BKGgA3FtZ+SmBKGgA3Tr5zD4E5UweM+XoaRiAwZ+qAMT/5hv04doK3lXpPc1Fzlfv/1wkwEpzMKTvNhoj9dcAkqcm4VnQ4zYaIlz5Zr/d3FXgDeaWjmKmnRDMAAAAASUVORK5CYII="),
+        (2, 4) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAmklEQVR4Ae2T0QnAIAxE/e6G7uQOXcWt/LR3EkWwoXBQ/LFwGiTvoqmG823tQL2vCGWomBjHr00hV+KaL+AEVUepJb0MyJe4ZgWYO/aK9vXl5CrXinKAAVvaC3hzZu4slRseMOA/9Qr29TIAC1TO8BBUA5WbC29r9Z7LxaOjbdKzUDnWHIIJT86287JRjJdnNAALVM7wM/3TgQdDBMB4C5VTbwAAAABJRU5ErkJggg=="),
+        (2, 7) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAvElEQVR4Ae2TwQ3DIBAE/U6H9IT8SQFpha54kh3EWZHIilfCx5bXnBDL+I7juJ+tFTjPZ5KKVIeI0+qn2uuRpCLVIeKlr+8rUJaaUe6LvnwEylIzsr6+lWBk6qAxP2UgGJk6aMxPvg7lIzAlDYAbC2s/JTAlDYAbJ9+1h8CcqQPGfL0MIxCYM3XAmJ98w34cO8HbSr2nuai5yv3/6wQYCU7mlJ1mQ8T+OmCS1GRcKzqcZkPES5+s9/u7CrwBS2/C4P0Gxb4AAAAASUVORK5CYII="),
+        (2, 2) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAvklEQVR4Ae2TwQ3DIBAEXVPaSAX0hPxJQ3SRUng6O4izIpEVr5iPLa85IZbxHcd2P0sr8Hg/k1Sk2kWcZj+1768kFal2EU99bV+BsnQY5bbox0egLB1G1te2EoxMHTTmhwwEI1MHjfnB16B8BKakAXBjYe23BKakAXDj4Dv3EJgzdcCYr6ehBwJzpg4Y84Ov27dtJXhZqdc0FzVXua+/ToCR4GRO2Wk2ROyvAyZJTca1osNpNkQ89cl6v/+rwAf7QaYAgBhSLgAAAABJRU5ErkJggg=="),
+        (2, 5) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAvElEQVR4Ae2TwQ3DIBAE/U6H9IT8SQFpha54kh3EWZHIilfCx5bXnBDL+I7juJ+tFWivR5KKVIeI0+qnzvOZpCLVIeKlr+8rUJaaUe6LvnwEylIzsr6+lWBk6qAxP2UgGJk6aMxPvg7lIzAlDYAbC2s/JTAlDYAbJ9+1h8CcqQPGfL0MIxCYM3XAmJ98w34cO8HbSr2nuai5yv3/6wQYCU7mlJ1mQ8T+OmCS1GRcKzqcZkPES5+s9/u7CrwBxKDC4C7sQmUAAAAASUVORK5CYII="),
+        (2, 8) => Some("iVBORw0KGgoAAAANSUhEUgAAAB4AAAAQCAYAAAABOs/SAAAAmUlEQVR4Ae2TUQrAIAxDvaZ3En92IW/l55ZIFcGVQWD44yBapC/VTsP5tnYg5ytCBaomxvFrU8iVuOYLOEG3o9SSXgbkS1yzAswde0X7+nJylWtFOcCALe0FvLkwd5bKDQ8Y8J96Bft6HYAFKmd4CKqBys2Ft7V6z+Xi0dE26VmoHGsOwYQnZ9t52SjGyzMagAUqZ/iZ/unAA80LxUj79qahAAAAAElFTkSuQmCC"),
+        (3, 0) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAApElEQVR4Ae1U2wnAIBBzpq7RCbqTQ7lFR/GzTeQ8BHu0+HEgtRA95NKE+AjrWwl8SGA79wNIQBawPt6o6HXlFT8QjcBlIJamhwH9rrxiAaJMyDJb17ukvXnFLAcIc+urMWtO7G3hzVNtCPPMWkbrelaCFN48kQ3BW3hUrzU83ZGY69IxamyT6/M0qkevCvyESfN48BISrLvnTAlSePNEdk3/TuAGN1VKG8eq1z4AAAAASUVORK5CYII="),
+        (3, 9) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAyklEQVR4Ae2UwQ0DIQwEeaectJEK6Ike0gpdpBSeZAfhE9LFSh7cA4WT9rAQK0bGdtjfzsAPGajPW5SyVLqI4zfr/fWIUpZKF/FlvsYjwCRVR6kd+vATYJKqo+m+hiBIMuvB2v4pY4Iksx6s7U/zNVh+AubpDcxbM2dHCZinNzBvneY77hYwNeuB2n45DD0QMDXrgdr+NF+/NoQVgZcribWajtpQWawz1gBGgibTlAdNiIhPY4mzo9R8jDcmBk2IiC/zjXfv+G8z8Aa0T2b7YZXlXgAAAABJRU5ErkJggg=="),
+        (3, 18) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAyUlEQVR4Ae2UwQ3DIAxFmalrdAJ2Qrl0IbboKBzT/xCOkFKrPZADCpF+sBBfPBnbYX0rA39kYNteUcpSaSKOv6yP9zNKWSpNxJf5Ko8Ak7Q7SvXQl58Ak7Q7Gu6rCIIksx6s7Z8yJkgy68Ha/jBfheUnYJ7ewLw1c7aXgHl6A/PWYb7jbgFTsx6o7ZfD0AIBU7MeqO0P87VrQ5gReLqSmKvpqA2VxTxjDWAkaDJNedCEiPg0ljjbS83HeGNi0ISI+DJff/eKb5uBDzZlaWNrrDqdAAAAAElFTkSuQmCC"),
+        (3, 3) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA30lEQVR4Ae2U0Q3DIAxE891xukYnyE7s0FXYoqPwSe8hiJCoReWPVlGIdGAhjrsY4219KwNfZOD+euxCFFIF8T6j5udtF6KQKoinPGm49IofkYOQDYSy6cMgg0HIBkyedFx6xYLI/Klltq0PGZNJMmuZbesDz6tXzDLoAK6+GbPmyN4eMszVN2PWPPC8eoe2DqBmLaNtPR2EGsgwNWsZbesDz6tXZbfNe8A/DZ+uJM716KgNlYWrzagsft/WMAxkmkxTHjxCQDy0Jfb2kGnaGx2DRwiIpzyvXq+94stm4A1i9Wb73xHWAQAAAABJRU5ErkJggg=="),
+        (3, 12) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA30lEQVR4Ae2U0Q3DIAxE891xukYnYCd26Cps0VH4pPcQjipRi8rqTySiXLCQT3cxxsd+dgV+qEB73pJQhDpAnFZU5YZ499cjCUWoA8RLve5HolloDnJP+vJRfogng1loDly9bkGiVMgza/vTn0d5MkllPbO2P+l1s3wkzNGbMW8t5H4iypNhjt6Meeukd2pLmJ71jNp+PQkjiPJkmJ71jNr+pDdkjyMqHOX9w/DlWuJal47e0PGGxlOUp7aIjzUMA4lTadqDSwiI/fECSYjyZJrxxsTgEgLipZ4k97sr8Abf74PbIKZhtAAAAABJRU5ErkJggg=="),
+        (3, 21) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxk4z2eSilSHiNPM2l63JBWpDhFPfff3I0lFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMfYgWGQ+JH4uAAAAAASUVORK5CYII="),
+        (3, 6) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3klEQVR4Ae2U0Q3DIAxEM1PX6ATshPLThdiio/CZ3kMQIVGLyh+tohLpwEIcdzHG2/pWBj7IwO15D0IScgVxmFH3/RGEJOQK4ilPGi694kfkKBwGYtn0ZpDBKBwGTJ50XHrFgsj8qWW2rQ8Zk0kya5lt6wPPq1fMMugArr4Zs+bE3h4yzNU3Y9Y88Lx6p7YOoGYto209n4QayDA1axlt6wPPq1dlt817wC8NX64krvXoqA2VhavNqCy+39YwDGSaTFMePEJAPLQl9vaQadobHYNHCIinPK9er73iv83AC148aWNte6shAAAAAElFTkSuQmCC"),
+        (3, 15) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxlor1uSilSHiNPMep7PJBWpDhFPfff3I0lFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMf2zaGQya2rMEAAAAASUVORK5CYII="),
+        (3, 24) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3klEQVR4Ae2U0QnDMAxEM1PX6ATeyeSnC3mLjuLP9J6xQsEVLiI/AYdcLIyOu8iytvWsCvxRgX1/JaEItYM4zajKDfEe72cSilA7iKd6zY9Es3A4yC3px0f5IZ4MZuFw4Oo1CxKlQp5Z2x/+PMqTSSrrmbX9Qa+Z5SNhjt6MeWsh9xtRngxz9GbMWwe9U1vC9Kxn1PbrSehBlCfD9Kxn1PYHvS67bVHhKO8Kw7driXtdOnpDxxsaT1Ge2iI+1jAMJE6laQ8uISD2xwskIcqTacYbE4NLCIinepJc76rAB11MiKtD78jdAAAAAElFTkSuQmCC"),
+        (3, 1) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA30lEQVR4Ae2U0Q3DIAxE891xukYnYCd26Cps0VH4pPcQjipRi8rqTySiXLCQT3cxxsd+dgV+qMD99UhCEeoAcVpRlRvitectCUWoA8RLve5HolloDnJP+vJRfogng1loDly9bkGiVMgza/vTn0d5MkllPbO2P+l1s3wkzNGbMW8t5H4iypNhjt6Meeukd2pLmJ71jNp+PQkjiPJkmJ71jNr+pDdkjyMqHOX9w/DlWuJal47e0PGGxlOUp7aIjzUMA4lTadqDSwiI/fECSYjyZJrxxsTgEgLipZ4k97sr8AYRm2b7LWyDIgAAAABJRU5ErkJggg=="),
+        (3, 10) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA30lEQVR4Ae2U0Q3DIAxE891xukYnyE7s0FXYoqPwSe8hiJCoReWPVlGIdGAhjrsY4219KwNfZCA/b7sQhVRBvM+o99djF6KQKoinPGm49IofkYOQDYSy6cMgg0HIBkyedFx6xYLI/Klltq0PGZNJMmuZbesDz6tXzDLoAK6+GbPmyN4eMszVN2PWPPC8eoe2DqBmLaNtPR2EGsgwNWsZbesDz6tXZbfNe8A/DZ+uJM716KgNlYWrzagsft/WMAxkmkxTHjxCQDy0Jfb2kGnaGx2DRwiIpzyvXq+94stm4A2OlYPb/m705AAAAABJRU5ErkJggg=="),
+        (3, 19) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxk4z2eSilSHiNPMen8/klSkOkQ89bXXLUlFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMfEKuGQwpJwMMAAAAASUVORK5CYII="),
+        (3, 4) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAyklEQVR4Ae2UwQ0DIQwEeaectJEK6Ike0gpdpBSeZAfhE9LFSh7cA4WT9rAQK0bGdtjfzsAPGbi/HlHKUukijt+s9XmLUpZKF/FlvsYjwCRVR6kd+vATYJKqo+m+hiBIMuvB2v4pY4Iksx6s7U/zNVh+AubpDcxbM2dHCZinNzBvneY77hYwNeuB2n45DD0QMDXrgdr+NF+/NoQVgZcribWajtpQWawz1gBGgibTlAdNiIhPY4mzo9R8jDcmBk2IiC/zjXfv+G8z8AY9O4Pb5Ex2MgAAAABJRU5ErkJggg=="),
+        (3, 13) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAoUlEQVR4Ae1UWwrAIAzzezfcnbzDruKt/HSJ1CK4suFHQeYgWqRZQnyE/e0EPiRQruMEEpAFrM83KnpdedUPRCNQDMTa9DCg35VXLUCUCVlm2/qQtDevmuUAYW59M2bNib09vHmqDWGeWctoW89KkMKbJ7IheAvP6vWGlzsSa106Ro1tcn2eZvXoVYGfMGkeD15CgvXwnClBCm+eyO7p3wncujWgu88cIGEAAAAASUVORK5CYII="),
+        (3, 22) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAxklEQVR4Ae2UQQoDIQxFXfeG3klm0wP0Kt7Kpf1PzCBMQ7twFlIH/hjEj4+YJOxvZ+CHDBzHM0pZKl3E8Zu1vh5RylLpIr7N13gEmKTqKLVDH34CTFJ1NN3XEARJZj1Y279kTJBk1oO1/Wm+BstPwDy9gXlr5uwoAfP0Buat03zn3QKmZj1Q2y+noQcCpmY9UNuf5uvXhrAi8HIlsVbTURsqi3XGGsBI0GSa8qAJEfFlLHF2lJqP8cbEoAkR8W2+8e4d/20G3jxLoyOBTl1aAAAAAElFTkSuQmCC"),
+        (3, 7) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxm4vx9JKlIdIk4z63k+k1SkOkQ89bXXLUlFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMfOIKGQyUhQC4AAAAASUVORK5CYII="),
+        (3, 16) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3ElEQVR4Ae2UUQrDIBBE890b5k6Snx6gV/FWftp5okGwi2U/WkIMjC7iOJN13W19KwNfZCC/HrsQhVRBvM+ox/HchSikCuIpTxouveJH5CBkA6Fs+jDIYBCyAZMnHZdesSAyf2qZbetDxmSSzFpm2/rA8+oVsww6gKtvxqw5sreHDHP1zZg1Dzyv3qmtA6hZy2hbTyehBjJMzVpG2/rA8+pV2W3zHvBPw5criWs9OmpDZeFqMyqL37c1DAOZJtOUB48QEA9tib09ZJr2RsfgEQLiKc+r12uv+LYZeAO1fKMjchA+oQAAAABJRU5ErkJggg=="),
+        (3, 25) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3ElEQVR4Ae2UUQrDIBBE890beifJTw/Qq3grP+08cUPBLpalPwFDJi6yw0zWdY/97Ar8UIHzfCahCHWAOK2oyg3x2uuRhCLUAeKlXvcj0Sw0B7knffkoP8STwSw0B65etyBRKuSZtf3pz6M8maSynlnbn/S6WT4S5ujNmLcWcj8R5ckwR2/GvHXSu7QlTM96Rm2/XoQRRHkyTM96Rm1/0huyxxEVjvL+Yfh2LXGvS0dv6HhD4ynKU1vExxqGgcSpNO3BJQTE/niBJER5Ms14Y2JwCQHxUk+S+90VeAM3kqWLTNHMfAAAAABJRU5ErkJggg=="),
+        (3, 2) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3klEQVR4Ae2U0QnDMAxEM1PX6ATeyeSnC3mLjuLP9J6xQsEVLiI/AYdcLIyOu8iytvWsCvxRgcf7mYQi1A7iNKMqN8Tb91cSilA7iKd6zY9Es3A4yC3px0f5IZ4MZuFw4Oo1CxKlQp5Z2x/+PMqTSSrrmbX9Qa+Z5SNhjt6MeWsh9xtRngxz9GbMWwe9U1vC9Kxn1PbrSehBlCfD9Kxn1PYHvS67bVHhKO8Kw7driXtdOnpDxxsaT1Ge2iI+1jAMJE6laQ8uISD2xwskIcqTacYbE4NLCIinepJc76rAB4YTaWM4L4/aAAAAAElFTkSuQmCC"),
+        (3, 11) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxlor1uSilSHiNPMen8/klSkOkQ89Z3nM0lFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMfAxyGQ5ANOT8AAAAASUVORK5CYII="),
+        (3, 20) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3klEQVR4Ae2U0Q3DIAxEM1PX6ATshPLThdiio/CZ3kMQIVGLyh+tohLpwEIcdzHG2/pWBj7IwL4/gpCEXEEcZtTb8x6EJOQK4ilPGi694kfkKBwGYtn0ZpDBKBwGTJ50XHrFgsj8qWW2rQ8Zk0kya5lt6wPPq1fMMugArr4Zs+bE3h4yzNU3Y9Y88Lx6p7YOoGYto209n4QayDA1axlt6wPPq1dlt817wC8NX64krvXoqA2VhavNqCy+39YwDGSaTFMePEJAPLQl9vaQadobHYNHCIinPK9er73iv83AC4UjiKsQtXtpAAAAAElFTkSuQmCC"),
+        (3, 5) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA+ElEQVR4Ae2UwQ3DIAxFc+44XaMTsBPKpQN0FbboKBzpfwhHlVyLXpGo+oOF8sWLsX3s387AHxm4vx9JKlIdIk4za3vdklSkOkQ89Z3nM0lFqkPEU1/nEWCWWqDcX/rxEGCWWqDQJ8AstUChryMIksxGsLbvvlyQZDaCtX3nEySZjWBt3/k6LA8Bc/UGFq2Fd78lYK7ewKLV+QTM1RtYtDrfdbaAqdkI1PbrZRiBgKnZCNT2nU/A1GwEavvON449jhWBlyuJtZqO2lBZrDPWAEaCJtOUB02IiOPxgklS8zHemBg0ISKe+tR8jDcmBk2IiKc+Hbn/OwMfsbOGQ+ysCecAAAAASUVORK5CYII="),
+        (3, 14) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3ElEQVR4Ae2UUQrDIBBE890beifJTw/Qq3grP+08cUPBLpalPwFDJi6yw0zWdY/97Ar8UIH2eiShCHWAOK2oyg3xzvOZhCLUAeKlXvcj0Sw0B7knffkoP8STwSw0B65etyBRKuSZtf3pz6M8maSynlnbn/S6WT4S5ujNmLcWcj8R5ckwR2/GvHXSu7QlTM96Rm2/XoQRRHkyTM96Rm1/0huyxxEVjvL+Yfh2LXGvS0dv6HhD4ynKU1vExxqGgcSpNO3BJQTE/niBJER5Ms14Y2JwCQHxUk+S+90VeAMuvKMjPFkhTwAAAABJRU5ErkJggg=="),
+        (3, 23) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAA3ElEQVR4Ae2UUQrDIBBE890b5k6Snx6gV/FWftp5okGwi2U/WkIMjC7iOJN13W19KwNfZOA4nrsQhVRBvM+o+fXYhSikCuIpTxouveJH5CBkA6Fs+jDIYBCyAZMnHZdesSAyf2qZbetDxmSSzFpm2/rA8+oVsww6gKtvxqw5sreHDHP1zZg1Dzyv3qmtA6hZy2hbTyehBjJMzVpG2/rA8+pV2W3zHvBPw5criWs9OmpDZeFqMyqL37c1DAOZJtOUB48QEA9tib09ZJr2RsfgEQLiKc+r12uv+LYZeAOww6WLMS0azgAAAABJRU5ErkJggg=="),
+        (3, 8) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAyUlEQVR4Ae2UwQ3DIAxFmalrdAJ2Qrl0IbboKBzT/xCOkFKrPZADCpF+sBBfPBnbYX0rA39k4PF+RilLpYk4/rJu2ytKWSpNxJf5Ko8Ak7Q7SvXQl58Ak7Q7Gu6rCIIksx6s7Z8yJkgy68Ha/jBfheUnYJ7ewLw1c7aXgHl6A/PWYb7jbgFTsx6o7ZfD0AIBU7MeqO0P87VrQ5gReLqSmKvpqA2VxTxjDWAkaDJNedCEiPg0ljjbS83HeGNi0ISI+DJff/eKb5uBD6z6iKso0u5WAAAAAElFTkSuQmCC"),
+        (3, 17) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAxklEQVR4Ae2UQQoDIQxFXfeG3klm0wP0Kt7Kpf1PzCBMQ7twFlIH/hjEj4+YJOxvZ+CHDNTXI0pZKl3E8Zv1OJ5RylLpIr7N13gEmKTqKLVDH34CTFJ1NN3XEARJZj1Y279kTJBk1oO1/Wm+BstPwDy9gXlr5uwoAfP0Buat03zn3QKmZj1Q2y+noQcCpmY9UNuf5uvXhrAi8HIlsVbTURsqi3XGGsBI0GSa8qAJEfFlLHF2lJqP8cbEoAkR8W2+8e4d/20G3ioDpYvvj82QAAAAAElFTkSuQmCC"),
+        (3, 26) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAQCAYAAABtPJ3XAAAAoElEQVR4Ae1UWwrAIAzzmruT+LMLeSs/t0RqEVzZ8KMgcxAt0iwhPsL+dgIfEkjpPIAMFAHr442KXlde9QPRCFwGYm16GNDvyqsWIMqELLNtfUjam1fNcoAwt74Zs+bM3h7ePNWGMM+sZbStFyVI4c0T2RC8hWf1esPLHYm1Lh2jxja5Pk+zevSqwE+YNI8HLyHBenjOlCCFN09k9/TvBG6sCqfzZ5EFaAAAAABJRU5ErkJggg=="),
+        (4, 0) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABBUlEQVR4Ae2W0Q2DMAxEmalrdAJ2Yii26Ch8tvfSJEKkFlU+DJFc6Ugaxdxx2CZT/MKBPxx4vJ6zsApbBvP5LFR7XeOSHpEuwtvAkjb9uGi/a1ySIFIcssSW9cZp77gklouIefVFmDWu7N3DO65yi5ictYSW9a0G5Il3XKadJm/iXr694OFSYqyiw2q9Jtf21MuH1grdBKdJD4oQMG/aWQ3IE++4TBtDODC+A73Fc8mTS2xXW7tKLO2snBms8bS9uYmXu/RbS2hZb05rbgKPRBLMR6IIs8bmtHa8j9v/EQXXlJB4y+FbpcRYRUfuydlx2hqCgUTjNOlBEQLm92lniAyEA18HPtOpDX5wv6J4AAAAAElFTkSuQmCC"),
+        (4, 27) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w3CMAxF+804rMEE3ak7sEq3YJR+lntKXFUEq6hKH5aCdImJanK4tU2b+qoO/OHA+Ly1Ui8NScTtWur99WilXhqSiHfLm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxbnnLs2tcHQjtwNbmOeVHC3bTU9dZsIwl++/31tUxdRi83GVueqC2nz11HQb4fZCAGfYG5q3ZU9f39xz2OSLwXBKC9xy+VEnEajpqT87GGWsAI0HjNOVBEyLi64wzIKuqAx8H3uFLKl7YBjIHAAAAAElFTkSuQmCC"),
+        (4, 54) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w2DMAxFmalrdAJ2Qvx0IbboKHzSe9IYIVKLCoVHpFS6jRvh5vRiuzT1VR34w4G+f7XSII1RxO1W6uP9bKVBGqOID8sLPALspMlRFy768SbATpocZc8LCILEWQ/W9hPHBImzHqztZ8sLsLwJmFtvYN46cO1SAubWG5i3ZsubzxYwNeuB2v44J8RAwNSsB2r72fLisU1TInBxJVFW01EbKotyxhrASNA4TXnQhIg4GUtcu5Saj/HGxKAJEfFhecuza1wdKNqBvc1zyY8W7K6nrqtgGUv23++tm2PqNHi5y9z0QG0/eeo6DXB9kIAZ9gbmrclT1/p7TvtcIvBcEoL3HL5VSZTVdNSenC1nrAGMBI3TlAdNiIjvM86ArKoOfB34AK9qLMZv1P/dAAAAAElFTkSuQmCC"),
+        (4, 9) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPElEQVR4Ae2WwQ3CMAxFe2Yc1mCC7tQdWKVbMEqP5b8SVxXBCvIhbaQg/cZEdfxwHJOhf3oG/sjA/fUYpVlakrDHkuv6vI3SLC1J2EU/xQjF23jkPEmro2l76cdDgJO0OnL9FCcUb0OQM7/Ug7X5LGOCJLMerM1nftF4GywPLcDWG5g3zrx7lIDZegPzxswvGm+PrQWoWQ/U5pfdIRkCpmY9UJvP/KLxUthhiC5wJnBzJdHWoaM2VBahNqOyqN/WAEaCJtOUB4cQYWdtiXePEjTtjY7BIUTYRb9ovGPsbvcMNJ2Bpg6BYENt7ZQdEiztzO4M3lhsU9XgBUy/9UBtPrt1VQP8DiRg/iQMzBuzW9f3OtW+twi8l4TgvQxfqiTaOnTUnjLbTlsDGAmaTFMeHEKEfZ12BmRXz8AnA2+P8SpemqKWDAAAAABJRU5ErkJggg=="),
+        (4, 36) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPElEQVR4Ae2Wwa3CMBBEc/7l/DaoID2lB1pJF5SSY5gXshGSGQUtKIqREYMty8s81uslXXu1DLyRgfn610ujNK1i3u+Fam8q7v926aVRmlYx3/VbeGQ6SLPRsGx68aH9qTgBDtJsZP0WBJmSIQcb68Uvz8YJksw62Fgv/BZYPmTM0QeYG0f2PisbJ2COPsDcWPht3jKmZh1orE9bwDrJxgmYmnWgsV74rbZdlzXOxn0DuLqSqOvSURs63lR7ysapLPJtDWAkczJNeXAJEXPfXgiSsnGCpr3RMbiEiPmunyzbu2XgNzJQ1SUQ7Odt5qhzEyztJf7D3XiediNg+p8DjXX/9HRUZsNHwDTtAHOjf3qKLzpqrBF4KwnBuwyfqiTqunSUnjJbT1sDGAmaTFMeXELE/DztDMimloFHBu6dk0c+PpFjygAAAABJRU5ErkJggg=="),
+        (4, 63) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HBjHay9N0pxE3JdSl9uplyZpTiIu5p3vl16apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDD2uySaa3nooEAAAAAElFTkSuQmCC"),
+        (4, 18) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABO0lEQVR4Ae2WwQ2DMAxFmalrdAJ2Qly6EFt0FI70P4oRIrVS+RCIlEqfuBGOXx3HTdc+LQN/ZODxfvbSJM2bsPuc6zi+emmS5k3YWT/FCMVbeeQ8SIujYX3px0OAg7Q4cv0UJxRvRZAzv9SDtfkkY4Iksx6szSd+0XgrLA8twNYbmDdOvHuUgNl6A/PGxC8ab4+tBahZD9Tm591hMwRMzXqgNp/4ReNtYbsuusCVwNWVRF2HjtpQWYTajMqifFsDGAmaTFMeHEKEnbQl3j1K0LQ3OgaHEGFn/aLxjrGb3TJQdQaqOgSCDbW1S3ZIsLQzuzN4Y7ZNFYMXMP3WA7X55NZVDPAcSMD8SRiYNya3rvM6xb7XCLyXhOC9DN+qJOo6dNSeMltPWwMYCZpMUx4cQoR9n3YGZFPLwDcDH9dBLMbsiIHXAAAAAElFTkSuQmCC"),
+        (4, 45) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HFhup16apDmJuC+ljuO1lyZpTiIu5p3vl16apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDD+TjSabNxYllAAAAAElFTkSuQmCC"),
+        (4, 72) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2WUQ6CMBBEOZPX8ATcifDjhbiFR+ET5yFLTHCCWQ2hpsaxTdN1ntvtSlNfNQMfZKDvb600SOMi5u1eqPam4i73aysN0riI+a7fzCPTTpqMunnTmw/tT8UJsJMmI+s3I8iUDDnYWN/88mycIMmsg431jd8My4eMOfoAc+PA3ldl4wTM0QeYGzd+q7eMqVkHGuvjGrBMsnECpmYdaKxv/BbbpskaZ+N+AVxcSZR16agNHW+qPWXjVBb5tgYwkjmZpjy4hIi5by8ESdk4QdPe6BhcQsR810+W9V0z8B8ZKOoSCPb7NnPUuQmW9hL/4W48T7sRMP3Pgca6f3o6KrPhI2CadoC50T89xRcdNZYIvJaE4F2GT1USZV06Sk+ZLaetAYwETaYpDy4hYn6edgZkVc3AMwMPswJMDlT4orsAAAAASUVORK5CYII="),
+        (4, 3) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lnulrpDKKchC0KAgrrGiWHe9OG669msOvOHA+XbphVGYVhD3pVStTeXN11MvjMK0grjIt+gR6SDMBsOy6MVD61N5EjgIs4HlWySIFIec2JjfvXk2TyJx1omN+R3fIpaHiNn6EObGkbXPyOZJMFsfwty449u4RUzNOqExP20Ja5DNk2Bq1gmN+R3fStt1WeJs3icEV1cSdR06akPbm2pP2TyVRb6tIRiIHKcpDw4hIPbthSQhmyfRtDc6BocQEBf5RNn+zYH/cCB7eH7y9hKbamu/Eks7izuDG4/TbuQu/dYJjXl/e/q2zRLMRyKEudHfnprgggNyeCsJxc7hQ5VEXYeODZCz9bQ1BAOJxmnKg0MIiI/TzhDZ0Bx4OHAHPpcqXgS9LdMAAAAASUVORK5CYII="),
+        (4, 30) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPUlEQVR4Ae2WwQ2DMAxFOXecrtEJ2IkdugpbdBSO9D8aI9TUSuVDIFIqfeJGcfwwjmHov56BPzKwPm+jNEtLEvZYcr2/HqM0S0sSdtFPMULxNh45T9LqaNoW/bgIcJJWR66f4oTibQhy5k49WJvPMiZIMuvB2nzmF423wXLRBjx6A/PGmbVHCZhHb2DemPlF4+2xtQE164Ha/LI7JEPA1KwHavOZXzReCjsM0Q3OBG6uJNo6dNSGyiLUZlQW9dsawEjQZJry4BAi7KwtsfYoQdPe6BgcQoRd9IvGO8buds9A0xmIHp5TblqwofZ0Fixtyd793lhsU9XglV36pgdq89lXVzXA70ACptkbmDdmX13f+1T73yLwXhKC9zJ8qZJo69BRe8psO20NYCRoMk15cAgR9nXaGZBdPQOfDLwBTDlHPtWsJSkAAAAASUVORK5CYII="),
+        (4, 57) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHLheb700SlMScV9KPT8uvTRKUxJxMW++n3pplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA08aWEmmxhLR4gAAAABJRU5ErkJggg=="),
+        (4, 12) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w3CMAxF+804rMEE3ak7sEq3YJR+lntKXFUEq6hKH5aCdImJanK4tU2b+qoO/OHA/fVopV4akojbtdTxeWulXhqSiHfLm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxbnnLs2tcHQjtwNamO+VHC3bTWDsLlnFmzwzeujqmDoOXu8xbD9T2s6euwwC/DxIwfxIG5q3ZU9f39xz2OSLwXBKC9xy+VEnEajpqT87GGWsAI0HjNOVBEyLi64wzIKuqAx8H3vrQRz6EaWNXAAAAAElFTkSuQmCC"),
+        (4, 39) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABEElEQVR4Ae2W0Q3DIAxE891xukYnyE7Zoatki46Sz/QeBRSVWqnyYUAi0gUL4dzlsBHTeIYDfziwP2+zsApbBPF8lqq1rnlBj0gXYTewhEU/XlrvmhckiBSHLLFpvnDaOy+I5SVitj4Js8aVtUd452VuEVOzltA0v+WEGHjnRdpp8ia+yncU3F1J9NV0WK1tcj2ervKhNUMfwWnKgyYExMVxlhNi4J0XaccwHOjfgfvrMQursEUQnzZdlT+XwEXYDZi3tVpicdYSm+bbcVqusvVJmDUWt7Uq7kIqwdSsJTTNF7c1cqugR8G5JCQ+Ofo9NlUSfTUddShn+znWEAwkGqcpD5oQELdznCFyYDjwceANCIFkHjm683MAAAAASUVORK5CYII="),
+        (4, 66) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cOB+f4zSLC1JxONeanheRmmWliTiw/IijwAnKTia4qIfHwFOUnBUPC8iCBJnPVibzxwTJM56sDZfLC/C8hEwR29g3jizdisBc/QG5o3F8ta9BUzNeqA2v6wJKRAwNeuB2nyxvLTtMLQI3FxJtNV01IbKop1rDWAkaJymPGhCRJxdS6zdSs3H9caNQRMi4sPytnv3uDvQtAPX122UZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceAN1pFmhmThek0AAAAASUVORK5CYII="),
+        (4, 21) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHDg/Lr00SlMScV9KvV5vvTRKUxJxMW++n3pplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA09CL0mmiTOtXwAAAABJRU5ErkJggg=="),
+        (4, 48) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cGB7XEZpkdYo4jGXOs/3UVqkNYo4m6caRfUCj5InaXM0hYu+/AlwkjZHbp7qFNULCErmST1Y208cEyTOerC2n+SV1guw/OkGvHoD89aFa48SMK/ewLw1ySutt9fWDehZD9T21z0hBgKmZz1Q20/ySuvFssNQeoOawM21RFuHjt5QWxSNGbXF/8cawEjQOE17cAgRcTKWuPYoQTPemBgcQkSczSutd6zd4+5A0w5cn7dRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AE/RZoYz6EpuAAAAAElFTkSuQmCC"),
+        (4, 75) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvOND351YYhDGBuN1L1dlQ3nQ5tMIgjAnEu3yzHpF2wuSgmw89eeh8KE8CO2Fy4PLNEkSKQ55Y29+8eTRPInHWE2v7G75ZLA8Rc/UmzFsHzq4RzZNgrt6EeeuGb+EWMTXrCbX9cUlIQTRPgqlZT6jtb/gSbdNEiaN5nxBcXEmU1XTUhq43NJ6ieSqL+FhDMBA5TlMeNCEg9scLSUI0T6IZb0wMmhAQ7/KJsv6rA//hwPF6aoVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAMd8GjulTKD6gAAAABJRU5ErkJggg=="),
+        (4, 6) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2W0Q3CMAxEOxNrMEF3qvrDQt2CUfpZ7oW4QgpWkIVog4K4xopi3fXiuBn6rzvwgQOX+3UUFmHNIB5rqVobypvn2ygswppBXOVLekQ6CZuDKS1689D6UJ4ETsLmwOVLEkSKQ55Ymy/ePJonkTjribX5gi+J5SFitt6EeePC2ldE8ySYrTdh3ljw7dwipmY9oTa/7gk5iOZJMDXrCbX5gi/TDkOUOJr3DcHNlURbh47a0PaG2lM0T2URb2sIBiLHacqDQwiI/fZCkhDNk2jaGx2DQwiIq3yi7P/uwH84ED08h7y9xIba2lFiaWd2Z/DG87QbuUu/9YTavH97+rXNEsxHwoR5o3976oIrDsjhvSQUew6fqiTaOnRsgJxtp60hGEg0TlMeHEJAfJ52hsiO7sDTgQf/GCzGrR/0sQAAAABJRU5ErkJggg=="),
+        (4, 33) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHJjvp14apSmJuC+lnh+XXhqlKYm4mHe93npplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA08MyUmmtO9b2gAAAABJRU5ErkJggg=="),
+        (4, 60) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABO0lEQVR4Ae2WwQ2DMAxFmalrdAJ2Qly6EFt0FI70P4oRIrVS+RCIlEqfuFEcP4xj6NqvZeCPDIzjq5cmad6E3edcH+9nL03SvAk766cYoXgrj5wHaXE0rIt+XAQ4SIsj109xQvFWBDlzpx6szScZEySZ9WBtPvGLxlthuWgDHr2BeePE2qMEzKM3MG9M/KLx9tjagJr1QG1+3h02Q8DUrAdq84lfNN4WtuuiG1wJXF1J1HXoqA2VRajNqCzKtzWAkaDJNOXBIUTYSVti7VGCpr3RMTiECDvrF413jN3sloGqMxA9PJfctGBD7ekqWNqSvfu9MdumisEru/RND9Tmk6+uYoDnQAKm2RuYNyZfXed9iv2vEXgvCcF7Gb5VSdR16Kg9ZbaetgYwEjSZpjw4hAj7Pu0MyKaWgW8GPtrZTA4wMsDyAAAAAElFTkSuQmCC"),
+        (4, 15) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHDg/Lr00SlMScV9Kne+nXhqlKYm4mHe93npplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA0+7YEmmT1D17gAAAABJRU5ErkJggg=="),
+        (4, 42) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvODBdDq0wCGMCcbuXqrOhvL4/t8IgjAnEu3yzHpF2wuSgmw89eeh8KE8CO2Fy4PLNEkSKQ55Y29+8eTRPInHWE2v7G75ZLA8Rc/UmzFsHzq4RzZNgrt6EeeuGb+EWMTXrCbX9cUlIQTRPgqlZT6jtb/gSbdNEiaN5nxBcXEmU1XTUhq43NJ6ieSqL+FhDMBA5TlMeNCEg9scLSUI0T6IZb0wMmhAQ7/KJsv6rA//hwPF6aoVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAPJAmaG8q2YLQAAAABJRU5ErkJggg=="),
+        (4, 69) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cGCe76O0SGsU8ZhL3R6XUVqkNYo4m6caRfUCj5InaXM0hYu+/AlwkjZHbp7qFNULCErmST1Y208cEyTOerC2n+SV1guw/OkGvHoD89aFa48SMK/ewLw1ySutt9fWDehZD9T21z0hBgKmZz1Q20/ySuvFssNQeoOawM21RFuHjt5QWxSNGbXF/8cawEjQOE17cAgRcTKWuPYoQTPemBgcQkSczSutd6zd4+5A0w5cn7dRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AJchaO6GjqiUAAAAAElFTkSuQmCC"),
+        (4, 24) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w2DMAxFmalrdAJ2Qvx0IbboKHzSe9IYIVKLCoVHpFS6jRvh5vRiuzT1VR34w4HH+9lKgzRGEbdbqX3/aqVBGqOID8sLPALspMlRFy768SbATpocZc8LCILEWQ/W9hPHBImzHqztZ8sLsLwJmFtvYN46cO1SAubWG5i3ZsubzxYwNeuB2v44J8RAwNSsB2r72fLisU1TInBxJVFW01EbKotyxhrASNA4TXnQhIg4GUtcu5Saj/HGxKAJEfFhecuza1wdKNqBvU13yY8W7K6xdhUs48yeGbx1c0ydBi93mbceqO0nT12nAa4PEjB/EgbmrclT1/p7TvtcIvBcEoL3HL5VSZTVdNSenC1nrAGMBI3TlAdNiIjvM86ArKoOfB34AAK/TA5g8BxOAAAAAElFTkSuQmCC"),
+        (4, 51) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cCA8L6M0S0sS8biXer8/RmmWliTiw/IijwAnKTia4qIfHwFOUnBUPC8iCBJnPVibzxwTJM56sDZfLC/C8hEwR29g3jizdisBc/QG5o3F8ta9BUzNeqA2v6wJKRAwNeuB2nyxvLTtMLQI3FxJtNV01IbKop1rDWAkaJymPGhCRJxdS6zdSs3H9caNQRMi4sPytnv3uDvQtAPX122UZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceANEGFo7qxrkIEAAAAASUVORK5CYII="),
+        (4, 78) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABD0lEQVR4Ae2WUQ6DIBBEPVOv0RN4J+NPL+QtehQ/7TwKxJRuNH4skmAysiGsMw67hKE/3YETDszzaxQWYY0gHo9StdY1L+gR6SRsBqaw6M9L613zggSR4pAlNs0XTnvnBbG8RMzWJ2HWuLB2D++8zC1iatYSmubXnBAD77xIOwzexFf59oKbK4m2mg6rtU2ux9NVPrRm6CM4TXnQhIC4OM5yQgy88yJtH7oD7TvweD9HYRHWCOLDpqvy5xI4CZsB87ZWSyzOWmLT/H2clqtsfRJmjcVtrYq7kEowNWsJTfPFbY3cKmhRcC4JiU+O/o63Kom2mo46lLPtHGsIBhKN05QHTQiI73OcIbKjO/B14APecWtWsdPrYAAAAABJRU5ErkJggg=="),
+        (4, 1) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABEElEQVR4Ae2W0Q3DIAxE891xukYnyE7Zoatki46Sz/QeBRSVWqnyYUAi0gUL4dzlsBHTeIYDfzhwfz1mYRW2COL5LFVrXfOCHpEuwm5gCYt+vLTeNS9IECkOWWLTfOG0d14Qy0vEbH0SZo0ra4/wzsvcIqZmLaFpfssJMfDOi7TT5E18le8ouLuS6KvpsFrb5Ho8XeVDa4Y+gtOUB00IiIvjLCfEwDsv0o5hONC/A/vzNgursEUQnzZdlT+XwEXYDZi3tVpicdYSm+bbcVqusvVJmDUWt7Uq7kIqwdSsJTTNF7c1cqugR8G5JCQ+Ofo9NlUSfTUddShn+znWEAwkGqcpD5oQELdznCFyYDjwceANULIqXllXoEQAAAAASUVORK5CYII="),
+        (4, 28) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w3CMAxF+804rMEE3ak7sEq3YJR+lntKXFUEq6hKH5aCdImJanK4tU2b+qoO/OHA+Ly1Ui8NScTtWur99WilXhqSiHfLm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxbnnLs2tcHQjtwNamO+VHC3bTWDsLlnFmzwzeujqmDoOXu8xbD9T2s6euwwC/DxIwfxIG5q3ZU9f39xz2OSLwXBKC9xy+VEnEajpqT87GGWsAI0HjNOVBEyLi64wzIKuqAx8H3l5URz4vuJLjAAAAAElFTkSuQmCC"),
+        (4, 55) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cOB+f4zSLC1JxONe6vV1G6VZWpKID8uLPAKcpOBoiot+fAQ4ScFR8byIIEic9WBtPnNMkDjrwdp8sbwIy0fAHL2BeePM2q0EzNEbmDcWy1v3FjA164Ha/LImpEDA1KwHavPF8tK2w9AicHMl0VbTURsqi3auNYCRoHGa8qAJEXF2LbF2KzUf1xs3Bk2IiA/L2+7d4+5A0w6E52WUZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceANLHNJpsWxd24AAAAASUVORK5CYII="),
+        (4, 10) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPUlEQVR4Ae2WwQ2DMAxFOXecrtEJ2IkdugpbdBSO9D8aI9TUSuVDIFIqfeJGcfwwjmHov56BPzJwfz1GaZaWJOyx5Lo+b6M0S0sSdtFPMULxNh45T9LqaNoW/bgIcJJWR66f4oTibQhy5k49WJvPMiZIMuvB2nzmF423wXLRBjx6A/PGmbVHCZhHb2DemPlF4+2xtQE164Ha/LI7JEPA1KwHavOZXzReCjsM0Q3OBG6uJNo6dNSGyiLUZlQW9dsawEjQZJry4BAi7KwtsfYoQdPe6BgcQoRd9IvGO8buds9A0xmIHp5TblqwofZ0Fixtyd793lhsU9XglV36pgdq89lXVzXA70ACptkbmDdmX13f+1T73yLwXhKC9zJ8qZJo69BRe8psO20NYCRoMk15cAgR9nXaGZBdPQOfDLwBDPpHPvs67cAAAAAASUVORK5CYII="),
+        (4, 37) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lnulrpDKKchC0KAgrrGiWHe9OG669msOvOHAfD31wihMK4j7UqrWpvLOt0svjMK0grjIt+gR6SDMBsOy6MVD61N5EjgIs4HlWySIFIec2JjfvXk2TyJx1omN+R3fIpaHiNn6EObGkbXPyOZJMFsfwty449u4RUzNOqExP20Ja5DNk2Bq1gmN+R3fStt1WeJs3icEV1cSdR06akPbm2pP2TyVRb6tIRiIHKcpDw4hIPbthSQhmyfRtDc6BocQEBf5RNn+zYH/cCB7eH7y9hKbamu/Eks7izuDG4/TbuQu/dYJjXl/e/q2zRLMRyKEudHfnprgggNyeCsJxc7hQ5VEXYeODZCz9bQ1BAOJxmnKg0MIiI/TzhDZ0Bx4OHAHGpxkHu8pE0MAAAAASUVORK5CYII="),
+        (4, 64) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHLheb700SlMScV9Kne+nXhqlKYm4mHd+XHpplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA0/orGaGkJeGKwAAAABJRU5ErkJggg=="),
+        (4, 19) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cOD6vI3SIq1RxGMudZ7vo7RIaxRxNk81iuoFHiVP0uZoChd9+RPgJG2O3DzVKaoXEJTMk3qwtp84Jkic9WBtP8krrRdg+dMNePUG5q0L1x4lYF69gXlrkldab6+tG9CzHqjtr3tCDARMz3qgtp/kldaLZYeh9AY1gZtribYOHb2htigaM2qL/481gJGgcZr24BAi4mQsce1Rgma8MTE4hIg4m1da71i7x92Bph3YHpdRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AFRKSaZMOd8pAAAAAElFTkSuQmCC"),
+        (4, 46) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHJjvp14apSmJuC+lXq+3XhqlKYm4mHd+XHpplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA09h7GaGpnDK1wAAAABJRU5ErkJggg=="),
+        (4, 73) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvOND351YYhDGBuN1L1dlQ3vF6aoVBGBOId/lmPSLthMlBNx968tD5UJ4EdsLkwOWbJYgUhzyxtr9582ieROKsJ9b2N3yzWB4i5upNmLcOnF0jmifBXL0J89YN38ItYmrWE2r745KQgmieBFOznlDb3/Al2qaJEkfzPiG4uJIoq+moDV1vaDxF81QW8bGGYCBynKY8aEJA7I8XkoRonkQz3pgYNCEg3uUTZf1XB/7DgelyaIVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAMwC2juKiX+uwAAAABJRU5ErkJggg=="),
+        (4, 4) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPElEQVR4Ae2Wwa3CMBBEc/7l/DaoID2lB1pJF5SSY5gXshGSGQUtKIqREYMty8s81uslXXu1DLyRgf/bpZdGaVrFvN8L1d5U3Hz966VRmlYx3/VbeGQ6SLPRsGx68aH9qTgBDtJsZP0WBJmSIQcb68Uvz8YJksw62Fgv/BZYPmTM0QeYG0f2PisbJ2COPsDcWPht3jKmZh1orE9bwDrJxgmYmnWgsV74rbZdlzXOxn0DuLqSqOvSURs63lR7ysapLPJtDWAkczJNeXAJEXPfXgiSsnGCpr3RMbiEiPmunyzbu2XgNzJQ1SUQ7Odt5qhzEyztJf7D3XiediNg+p8DjXX/9HRUZsNHwDTtAHOjf3qKLzpqrBF4KwnBuwyfqiTqunSUnjJbT1sDGAmaTFMeXELE/DztDMimloFHBu67kUc+Wi7ikwAAAABJRU5ErkJggg=="),
+        (4, 31) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPElEQVR4Ae2WwQ3CMAxFe2Yc1mCC7tQdWKVbMEqP5b8SVxXBCvIhbaQg/cZEdfxwHJOhf3oG/sjA+ryN0iwtSdhjyfX+eozSLC1J2EU/xQjF23jkPEmro2l76cdDgJO0OnL9FCcUb0OQM7/Ug7X5LGOCJLMerM1nftF4GywPLcDWG5g3zrx7lIDZegPzxswvGm+PrQWoWQ/U5pfdIRkCpmY9UJvP/KLxUthhiC5wJnBzJdHWoaM2VBahNqOyqN/WAEaCJtOUB4cQYWdtiXePEjTtjY7BIUTYRb9ovGPsbvcMNJ2Bpg6BYENt7ZQdEiztzO4M3lhsU9XgBUy/9UBtPrt1VQP8DiRg/iQMzBuzW9f3OtW+twi8l4TgvQxfqiTaOnTUnjLbTlsDGAmaTFMeHEKEfZ12BmRXz8AnA2/JM2QeCWJ+2wAAAABJRU5ErkJggg=="),
+        (4, 58) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HBjHay9N0pxE3JdSz/dLL03SnERczFtup16apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDD5dSZoYaqdMQAAAAAElFTkSuQmCC"),
+        (4, 13) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w3CMAxF+804rMEE3ak7sEq3YJR+lntKXFUEq6hKH5aCdImJanK4tU2b+qoO/OHA/fVopV4akojbtdTxeWulXhqSiHfLm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxbnnLs2tcHQjtwNbmOeVHC3bTU9dZsIwl++/31tUxdRi83GVueqC2nz11HQb4fZCAGfYG5q3ZU9f39xz2OSLwXBKC9xy+VEnEajpqT87GGWsAI0HjNOVBEyLi64wzIKuqAx8H3nfZZB4peA9AAAAAAElFTkSuQmCC"),
+        (4, 40) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABA0lEQVR4Ae2W0Q2DMAxE+e6G7MQOXYWt+KT30iRCpBZVPgyRXOlIGsXccdgmU/zCgT8c2N+vWViFLYP5fBWqva5xSY9IF2E3sKRNPy7a7xqXJIgUhyyxZb1x2jsuieUiYl59EWaNK3uP8I6r3CImZy2hZX2rAXniHZdpp8mbuJfvKHi4lBir6LBar8m1PfXyobVCN8Fp0oMiBMybdlYD8sQ7LtPGEA6M70Bv8dzy5BLb1dbuEks7K2cGa7xsb27i5S791hJa1pvTmpvAM5EE85EowqyxOa2d7+P2f0TBNSUk3nL4USkxVtGRe3J2nLaGYCDROE16UISA+XPaGSID4cDXgQ+Fe4D+YNV2/gAAAABJRU5ErkJggg=="),
+        (4, 67) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJklEQVR4Ae2WWw6CQAxF+XaH7In44wLcCrviE+/BKSGMDYYMjyZjcp06oc7x0laa+qoO/OHA8/lqpV4akojbrdTx/WilXhqSiA/Lm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxYXnLs2tcHQjtwN7mueRHC3bXU9dVsIwl++/31s0xdRq83GVueqC2nz11nQa4PkjADHsD89bsqWv9Pad9jgg8l4TgPYdvVRKxmo7ak7NxxhrASNA4TXnQhIj4PuMMyKrqwNeBD1Oag2a5zR51AAAAAElFTkSuQmCC"),
+        (4, 22) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HDjfL700SXMScV9KHcdrL03SnERczFtup16apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDD78pZoaIC3OPAAAAAElFTkSuQmCC"),
+        (4, 49) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2WwQ2DMAxFOXdDdkK9dICuwlYc6X80RojUSuVDIFIqfeJGOH51HDdD//QM/JGB9f0YpVlakrDHkuvz+RqlWVqSsIt+ihGKt/HIeZJWR9P20o+HACdpdeT6KU4o3oYgZ36pB2vzWcYESWY9WJvP/KLxNlgeWoCtNzBvnHn3KAGz9QbmjZlfNN4eWwtQsx6ozS+7QzIETM16oDaf+UXjpbDDEF3gSuDmSqKtQ0dtqCxCbUZlUb+tAYwETaYpDw4hws7aEu8eJWjaGx2DQ4iwi37ReMfY3e4ZaDoDTR0CwYba2iU7JFjamd0ZvLHYpqrBC5h+64HafHbrqgZ4DiRg/iQMzBuzW9d5nWrfWwTeS0LwXoZvVRJtHTpqT5ltp60BjARNpikPDiHCvk87A7KrZ+CbgQ/My4NmRAVWVAAAAABJRU5ErkJggg=="),
+        (4, 76) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOElEQVR4Ae2WUQ6CMBBE+faG3In44wG8CrfiE+chS0zqBLMaQk2NY5um6zy325WuvVoGPsjA9XrrpVGaVjHv90K1NxU33y+9NErTKua7fguPTAdpNhqWTW8+tD8VJ8BBmo2s34IgUzLkYGO9+OXZOEGSWQcb64XfAsuHjDn6AHPjyN5XZeMEzNEHmBsLv81bxtSsA431aQtYJ9k4AVOzDjTWC7/Vtuuyxtm4XwBXVxJ1XTpqQ8ebak/ZOJVFvq0BjGROpikPLiFi7tsLQVI2TtC0NzoGlxAx3/WTZXu3DPxHBqq6BIL9vs0cdW6Cpb3Ef7gbz9NuBEz/c6Cx7p+ejsps+AiYph1gbvRPT/FFR401Am8lIXiX4VOVRF2XjtJTZutpawAjQZNpyoNLiJifp50B2dQy8MzAA5rqhc4vVVWrAAAAAElFTkSuQmCC"),
+        (4, 7) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvOHC8nlphEMYE4nYvVWdDeX1/boVBGBOId/lmPSLthMlBNx968tD5UJ4EdsLkwOWbJYgUhzyxtr9582ieROKsJ9b2N3yzWB4i5upNmLcOnF0jmifBXL0J89YN38ItYmrWE2r745KQgmieBFOznlDb3/Al2qaJEkfzPiG4uJIoq+moDV1vaDxF81QW8bGGYCBynKY8aEJA7I8XkoRonkQz3pgYNCEg3uUTZf1XB/7DgelyaIVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAN8IUmmu+efhgAAAABJRU5ErkJggg=="),
+        (4, 34) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHJjvp14apSmJuC+lnh+XXhqlKYm4mHe93npplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA0+Jw2aGnPQo3wAAAABJRU5ErkJggg=="),
+        (4, 61) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cGCe76O0SGsU8ZhLvT5vo7RIaxRxNk81iuoFHiVP0uZoChd9+RPgJG2O3DzVKaoXEJTMk3qwtp84Jkic9WBtP8krrRdg+dMNePUG5q0L1x4lYF69gXlrkldab6+tG9CzHqjtr3tCDARMz3qgtp/kldaLZYeh9AY1gZtribYOHb2htigaM2qL/481gJGgcZr24BAi4mQsce1Rgma8MTE4hIg4m1da71i7x92Bph3YHpdRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AFfiaO6t0npWAAAAAElFTkSuQmCC"),
+        (4, 16) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHDg/Lr00SlMScV9Kne+nXhqlKYm4mHe93npplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA084aWaGQGZnbgAAAABJRU5ErkJggg=="),
+        (4, 43) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABN0lEQVR4Ae2WUQ6CMBBE+faG3In44wG8CrfiE+chS0xwUrMxQk2NQzdNNzNMt0u79msOfODAfL/0wihMK4j7UqrWpvKu11svjMK0grjIt+gR6SDMBsOy6M1D61N5EjgIs4HlWySIFIec2JjfvXk2TyJx1omN+R3fIpaHiNn6EObGkbWvyOZJMFsfwty449u4RUzNOqExP20Ja5DNk2Bq1gmN+R3fStt1WeJs3jcEV1cSdR06akPbm2pP2TyVRb6tIRiIHKcpDw4hIPbthSQhmyfRtDc6BocQEBf5RNn+zYH/cCB7eA55e4lNtbWjxNLO4s7gxvO0G7lLv3VCY97fnn5tswTzkQhhbvS3pya44IAc3kpCsXP4VCVR16FjA+RsPW0NwUCicZry4BAC4vO0M0Q2NAeeDjwARguDZsHQNlsAAAAASUVORK5CYII="),
+        (4, 70) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2WwQ2DMAxFOXdDdkK9dICuwlYc6X80RojUSuVDIFIqfeJGcfwwjmHov56BPzLwfL5GaZaWJOyx5Lq+H6M0S0sSdtFPMULxNh45T9LqaNoW/bgIcJJWR66f4oTibQhy5k49WJvPMiZIMuvB2nzmF423wXLRBjx6A/PGmbVHCZhHb2DemPlF4+2xtQE164Ha/LI7JEPA1KwHavOZXzReCjsM0Q2uBG6uJNo6dNSGyiLUZlQW9dsawEjQZJry4BAi7KwtsfYoQdPe6BgcQoRd9IvGO8buds9A0xmIHp5LblqwofZ0FSxtyd793lhsU9XglV36pgdq89lXVzXAcyAB0+wNzBuzr67zPtX+twi8l4TgvQzfqiTaOnTUnjLbTlsDGAmaTFMeHEKEfZ92BmRXz8A3Ax8UKoXOdiTsIAAAAABJRU5ErkJggg=="),
+        (4, 25) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cOD6uo3SLC1JxONe6v3+GKVZWpKID8uLPAKcpOBoiot+fAQ4ScFR8byIIEic9WBtPnNMkDjrwdp8sbwIy0fAHL2BeePM2q0EzNEbmDcWy1v3FjA164Ha/LImpEDA1KwHavPF8tK2w9AicHMl0VbTURsqi3auNYCRoHGa8qAJEXF2LbF2KzUf1xs3Bk2IiA/L2+7d4+5A0w6E52WUZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceANf7lo7oL3BuIAAAAASUVORK5CYII="),
+        (4, 52) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJklEQVR4Ae2WWw6CQAxF+XaH7In44wLcCrviE+/BKSGMDYYMjyZjcp06oc7x0laa+qoO/OHA+H60Ui8NScTtVurz+WqlXhqSiA/Lm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxYXnLs2tcHQjtwN6mu+RHC3bXWLsKlnFmzwzeujmmToOXu8xbD9T2s6eu0wDXBwmYPwkD89bsqWv9Pad9jgg8l4TgPYdvVRKxmo7ak7NxxhrASNA4TXnQhIj4PuMMyKrqwNeBD41bhc6kmbtrAAAAAElFTkSuQmCC"),
+        (4, 79) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABDUlEQVR4Ae2WUQ6DIBBE/e4NvZPxpwfoVbyVn3YeBWJKNzZ+LJBgMrIhrDMOu4RpPMOBPxxY1+csbMIeQTxfpWqta17QI9JFOAwsYdGPl9a75gUJIsUhS2yaL5z2zgtieYmYrU/CrHFj7RneeZlbxNSsJTTN7zkhBt55kXaavInv8p0Fd1cSfTUdVmubXI+nu3xozdBHcJryoAkBcXGc5YQYeOdF2jEMB/p34Hg9ZmET9gjiy6ar8ucSuAiHAfO2Vksszlpi03w7TstVtj4Js8bitlbFXUglmJq1hKb54rZGbhX0KDiXhMQnR7/Hpkqir6ajDuVsP8cagoFE4zTlQRMC4naOM0QODAc+DrwBW3qINm9qCEgAAAAASUVORK5CYII="),
+        (4, 2) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABD0lEQVR4Ae2WUQ6DIBBEPVOv0RN4J+NPL+QtehQ/7TwKxJRuNH4skmAysiGsMw67hKE/3YETDjzez1FYhDWCeDxK1VrXvKBHpJOwGZjCoj8vrXfNCxJEikOW2DRfOO2dF8TyEjFbn4RZ48LaPbzzMreIqVlLaJpfc0IMvPMi7TB4E1/l2wturiTaajqs1ja5Hk9X+dCaoY/gNOVBEwLi4jjLCTHwzou0fegOtO/APL9GYRHWCOLDpqvy5xI4CZsB87ZWSyzOWmLT/H2clqtsfRJmjcVtrYq7kEowNWsJTfPFbY3cKmhRcC4JiU+O/o63Kom2mo46lLPtHGsIBhKN05QHTQiI73OcIbKjO/B14APSuSzGi4OWBgAAAABJRU5ErkJggg=="),
+        (4, 29) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cCA8L6M0S0sS8biXen3dRmmWliTiw/IijwAnKTia4qIfHwFOUnBUPC8iCBJnPVibzxwTJM56sDZfLC/C8hEwR29g3jizdisBc/QG5o3F8ta9BUzNeqA2v6wJKRAwNeuB2nyxvLTtMLQI3FxJtNV01IbKop1rDWAkaJymPGhCRJxdS6zdSs3H9caNQRMi4sPytnv3uDvQtAP3+2OUZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceAN4FtJpvX4vFQAAAAASUVORK5CYII="),
+        (4, 56) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w2DMAxFmalrdAJ2Qvx0IbboKHzSe9IYIVKLCoVHpFS6jRvh5vRiuzT1VR34w4G+f7XSII1RxO1W6uP9bKVBGqOID8sLPALspMlRFy768SbATpocZc8LCILEWQ/W9hPHBImzHqztZ8sLsLwJmFtvYN46cO1SAubWG5i3ZsubzxYwNeuB2v44J8RAwNSsB2r72fLisU1TInBxJVFW01EbKotyxhrASNA4TXnQhIg4GUtcu5Saj/HGxKAJEfFhecuza1wdKNqBvU13yY8W7K6xdhUs48yeGbx1c0ydBi93mbceqO0nT12nAa4PEjB/EgbmrclT1/p7TvtcIvBcEoL3HL5VSZTVdNSenC1nrAGMBI3TlAdNiIjvM86ArKoOfB34AK56TA5xu/4YAAAAAElFTkSuQmCC"),
+        (4, 11) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cOD6vI3SIq1RxGMudXtcRmmR1ijibJ5qFNULPEqepM3RFC768ifASdocuXmqU1QvICiZJ/VgbT9xTJA468HafpJXWi/A8qcb8OoNzFsXrj1KwLx6A/PWJK+03l5bN6BnPVDbX/eEGAiYnvVAbT/JK60Xyw5D6Q1qAjfXEm0dOnpDbVE0ZtQW/x9rACNB4zTtwSFExMlY4tqjBM14Y2JwCBFxNq+03rF2j7sDTTswz/dRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AI8BSabLKLZZAAAAAElFTkSuQmCC"),
+        (4, 38) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvODBdDq0wCGMCcbuXqrOhvOP11AqDMCYQ7/LNekTaCZODbj705KHzoTwJ7ITJgcs3SxApDnlibX/z5tE8icRZT6ztb/hmsTxEzNWbMG8dOLtGNE+CuXoT5q0bvoVbxNSsJ9T2xyUhBdE8CaZmPaG2v+FLtE0TJY7mfUJwcSVRVtNRG7re0HiK5qks4mMNwUDkOE150ISA2B8vJAnRPIlmvDExaEJAvMsnyvqvDvyHA31/boVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAOco2aGKH0haQAAAABJRU5ErkJggg=="),
+        (4, 65) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHLheb700SlMScV9Kne+nXhqlKYm4mHd+XHpplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA09qwmjunh1yKgAAAABJRU5ErkJggg=="),
+        (4, 20) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABO0lEQVR4Ae2WwQ2DMAxFmalrdAJ2Qly6EFt0FI70P4oRIrVS+RCIlEqfuFEcP4xj6NqvZeCPDDzez16apHkTdp9zHcdXL03SvAk766cYoXgrj5wHaXE0rIt+XAQ4SIsj109xQvFWBDlzpx6szScZEySZ9WBtPvGLxlthuWgDHr2BeePE2qMEzKM3MG9M/KLx9tjagJr1QG1+3h02Q8DUrAdq84lfNN4WtuuiG1wJXF1J1HXoqA2VRajNqCzKtzWAkaDJNOXBIUTYSVti7VGCpr3RMTiECDvrF413jN3sloGqMxA9PJfctGBD7ekqWNqSvfu9MdumisEru/RND9Tmk6+uYoDnQAKm2RuYNyZfXed9iv2vEXgvCcF7Gb5VSdR16Kg9ZbaetgYwEjSZpjw4hAj7Pu0MyKaWgW8GPtZRTA67kbS9AAAAAElFTkSuQmCC"),
+        (4, 47) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHJjvp14apSmJuC+lXq+3XhqlKYm4mHd+XHpplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA0/j82ju/ck8sQAAAABJRU5ErkJggg=="),
+        (4, 74) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2W0Q3CMAxEOxNrMEF3qvrDQt2CUfpZ7oW4QgpWkIVog4K4xopi3fXiuBn6rzvwgQPzfBuFRVgziMdaqtaG8i736ygswppBXOVLekQ6CZuDKS1689D6UJ4ETsLmwOVLEkSKQ55Ymy/ePJonkTjribX5gi+J5SFitt6EeePC2ldE8ySYrTdh3ljw7dwipmY9oTa/7gk5iOZJMDXrCbX5gi/TDkOUOJr3DcHNlURbh47a0PaG2lM0T2URb2sIBiLHacqDQwiI/fZCkhDNk2jaGx2DQwiIq3yi7P/uwH84ED08h7y9xIba2lFiaWd2Z/DG87QbuUu/9YTavH97+rXNEsxHwoR5o3976oIrDsjhvSQUew6fqiTaOnRsgJxtp60hGEg0TlMeHEJAfJ52hsiO7sDTgQeyEmtWVjCP1gAAAABJRU5ErkJggg=="),
+        (4, 5) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABRUlEQVR4Ae2W0Q3CMAxE+804rMEE3anqDwOwSrdglH6WeyWuKoopshAkKIhrrCjWXS+21ab+qgNvOHC8nlphEMYE4nYvVWdDedPl0AqDMCYQ7/LNekTaCZODbj705KHzoTwJ7ITJgcs3SxApDnlibX/z5tE8icRZT6ztb/hmsTxEzNWbMG8dOLtGNE+CuXoT5q0bvoVbxNSsJ9T2xyUhBdE8CaZmPaG2v+FLtE0TJY7mfUJwcSVRVtNRG7re0HiK5qks4mMNwUDkOE150ISA2B8vJAnRPIlmvDExaEJAvMsnyvqvDvyHA31/boVBGBOI82wCCeyEycHrr6dv35dE4qwn1vbzcVqCuXoT5q3+19MPHKZmPaG27389VcE7DqxLQrE5+rhmVRJlNR0XIGfLGWsIBhKN00wMmhAQ5zPOEFlRHbg7cAM9p0mm7ikIlwAAAABJRU5ErkJggg=="),
+        (4, 32) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WwQ2DMAxFOXecrtEJ2Alx6QBdhS06Ckf6Xxoj1NRKlUNDpFT6jRVh/Pg4FkP/dQd+cGB7XEZpkdYo4jGXen3eRmmR1ijibJ5qFNULPEqepM3RFC768ifASdocuXmqU1QvICiZJ/VgbT9xTJA468HafpJXWi/A8qcb8OoNzFsXrj1KwLx6A/PWJK+03l5bN6BnPVDbX/eEGAiYnvVAbT/JK60Xyw5D6Q1qAjfXEm0dOnpDbVE0ZtQW/x9rACNB4zTtwSFExMlY4tqjBM14Y2JwCBFxNq+03rF2j7sDTTswz/dRWqQ1ijh7eKo8tAAnaXPkfnXVgsVZD9b2z+O0XOXVG5i3Jl9dVdylqIDpWQ/U9pOvLnKrqEXgvSUEb45+rqdqibYOHX0oZ9sZawAjQeM07cEhRMTnGWdAdnUH3g68AEtJZoZrE1x3AAAAAElFTkSuQmCC"),
+        (4, 59) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHLheb700SlMScV9KPT8uvTRKUxJxMW++n3pplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtTbfL0wt201jbC5ZxFu8Mbj3OuJG7zFsHGvv+7enXNguYP4kAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA08ZaGju0i3vogAAAABJRU5ErkJggg=="),
+        (4, 14) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABMUlEQVR4Ae2WwQ3DIAxFc+44XaMTZKeolw7QVbJFR8mR/kdxFJVa6YGIIFHpBwth8fqxEUP/dQf+cOD6uo3SLC1JxONeanheRmmWliTiw/IijwAnKTia4qIfHwFOUnBUPC8iCBJnPVibzxwTJM56sDZfLC/C8hEwR29g3jizdisBc/QG5o3F8ta9BUzNeqA2v6wJKRAwNeuB2nyxvLTtMLQI3FxJtNV01IbKop1rDWAkaJymPGhCRJxdS6zdSs3H9caNQRMi4sPytnv3uDvQtAP3+2OUZmlJIt5tnip/WoCTFBy5r65asDjrwdr8eZyWqxy9gXlj9uqq4i6bCpia9UBtPnt1kVtFLQKvJSF4c/R7PFVJtNV01KGcbedaAxgJGqcpD5oQEZ/nOgOyqzvwceAN+eBmhsonWUoAAAAASUVORK5CYII="),
+        (4, 41) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABDUlEQVR4Ae2WUQ6DIBBE/e4NvZPxpwfoVbyVn3YeBWJKNzZ+LJBgMrIhrDMOu4RpPMOBPxw4Xo9Z2IQ9gni+StVa17ygR6SLcBhYwqIfL613zQsSRIpDltg0XzjtnRfE8hIxW5+EWePG2jO88zK3iKlZS2ia33NCDLzzIu00eRPf5TsL7q4k+mo6rNY2uR5Pd/nQmqGP4DTlQRMC4uI4ywkx8M6LtGMYDvTvwLo+Z2ET9gjiy6ar8ucSuAiHAfO2Vksszlpi03w7TstVtj4Js8bitlbFXUglmJq1hKb54rZGbhX0KDiXhMQnR7/Hpkqir6ajDuVsP8cagoFE4zTlQRMC4naOM0QODAc+DrwBB5GDZg3ewIIAAAAASUVORK5CYII="),
+        (4, 68) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJklEQVR4Ae2WWw6CQAxF+XaH7In44wLcCrviE+/BKSGMDYYMjyZjcp06oc7x0laa+qoO/OHA8/lqpV4akojbrdTx/WilXhqSiA/Lm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxYXnLs2tcHQjtwN6mu+RHC3bXWLsKlnFmzwzeujmmToOXu8xbD9T2s6eu0wDXBwmYPwkD89bsqWv9Pad9jgg8l4TgPYdvVRKxmo7ak7NxxhrASNA4TXnQhIj4PuMMyKrqwNeBD9Whhc6rs4BCAAAAAElFTkSuQmCC"),
+        (4, 23) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2WwQ2CQBBFOVuObVgBPREvFmArdGEpHPE/3CEm688aDsKaNX53smHC4+/MSNc+zYEvHDg/Lr00SlMScV9KvV5vvTRKUxJxMW++n3pplKYk4mLewiPAQZqNhuWiDz8CHKTZyOYJcJBmI5u3IAgSZx1s7GdPLkicdbCxn+UJEmcdbOxneQssPwLm6APMrSPXvkvAHH2AuTXLEzBHH2BuzfLWewuYmnWgsT+tCSkQMDXrQGM/yxMwNetAYz/LS7ftuhqBqyuJupqO2lBZ1DPWAEaCxmnKgyZExH68kCSp+RhvTAyaEBEX89R8jDcmBk2IiIt5umX7Ngf+w4GtzbPL0wt201vXXrCMpfjvd+txxo3cZW460Nj3b0+/tlnADPsAc6t/e2rABQfk8FoSip3DhyqJupqOA5Cz9Yw1gJGgcZryoAkR8XHGGZBNzYGXA09BP2jupUHV/wAAAABJRU5ErkJggg=="),
+        (4, 50) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2WwQ2DMAxFOXdDdkK9dICuwlYc6X80RojUSuVDIFIqfeJGcfwwjmHov56BPzKwvh+jNEtLEvZYcn0+X6M0S0sSdtFPMULxNh45T9LqaNoW/bgIcJJWR66f4oTibQhy5k49WJvPMiZIMuvB2nzmF423wXLRBjx6A/PGmbVHCZhHb2DemPlF4+2xtQE164Ha/LI7JEPA1KwHavOZXzReCjsM0Q2uBG6uJNo6dNSGyiLUZlQW9dsawEjQZJry4BAi7KwtsfYoQdPe6BgcQoRd9IvGO8buds9A0xmIHp5LblqwofZ0FSxtyd793lhsU9XglV36pgdq89lXVzXAcyAB0+wNzBuzr67zPtX+twi8l4TgvQzfqiTaOnTUnjLbTlsDGAmaTFMeHEKEfZ92BmRXz8A3Ax9O4YXOSVIgBwAAAABJRU5ErkJggg=="),
+        (4, 77) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABN0lEQVR4Ae2WUQ6CMBBE+faG3In44wG8CrfiE+chS0xwUrMxQk2NQzdNNzNMt0u79msOfODA9XrrhVGYVhD3pVStTeXN90svjMK0grjIt+gR6SDMBsOy6M1D61N5EjgIs4HlWySIFIec2JjfvXk2TyJx1omN+R3fIpaHiNn6EObGkbWvyOZJMFsfwty449u4RUzNOqExP20Ja5DNk2Bq1gmN+R3fStt1WeJs3jcEV1cSdR06akPbm2pP2TyVRb6tIRiIHKcpDw4hIPbthSQhmyfRtDc6BocQEBf5RNn+zYH/cCB7eA55e4lNtbWjxNLO4s7gxvO0G7lLv3VCY97fnn5tswTzkQhhbvS3pya44IAc3kpCsXP4VCVR16FjA+RsPW0NwUCicZry4BAC4vO0M0Q2NAeeDjwAHQCINthcSKEAAAAASUVORK5CYII="),
+        (4, 8) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2WUQ6CMBBEOZPX8ATcifDjhbiFR+ET5yFLTHCCWQ2hpsaxTdN1ntvtSlNfNQMfZOByv7bSII2LmLd7odqbiuv7WysN0riI+a7fzCPTTpqMunnTmw/tT8UJsJMmI+s3I8iUDDnYWN/88mycIMmsg431jd8My4eMOfoAc+PA3ldl4wTM0QeYGzd+q7eMqVkHGuvjGrBMsnECpmYdaKxv/BbbpskaZ+N+AVxcSZR16agNHW+qPWXjVBb5tgYwkjmZpjy4hIi5by8ESdk4QdPe6BhcQsR810+W9V0z8B8ZKOoSCPb7NnPUuQmW9hL/4W48T7sRMP3Pgca6f3o6KrPhI2CadoC50T89xRcdNZYIvJaE4F2GT1USZV06Sk+ZLaetAYwETaYpDy4hYn6edgZkVc3AMwMP/ihMDrxplLcAAAAASUVORK5CYII="),
+        (4, 35) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HFhup16apDmJuC+lnu+XXpqkOYm4mDeO116apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDDwvZaO6a7mW5AAAAAElFTkSuQmCC"),
+        (4, 62) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABO0lEQVR4Ae2WwQ2DMAxFmalrdAJ2Qly6EFt0FI70P4oRIrVS+RCIlEqfuBGOXx3HTdc+LQN/ZGAcX700SfMm7D7n+ng/e2mS5k3YWT/FCMVbeeQ8SIujYX3px0OAg7Q4cv0UJxRvRZAzv9SDtfkkY4Iksx6szSd+0XgrLA8twNYbmDdOvHuUgNl6A/PGxC8ab4+tBahZD9Tm591hMwRMzXqgNp/4ReNtYbsuusCVwNWVRF2HjtpQWYTajMqifFsDGAmaTFMeHEKEnbQl3j1K0LQ3OgaHEGFn/aLxjrGb3TJQdQaqOgSCDbW1S3ZIsLQzuzN4Y7ZNFYMXMP3WA7X55NZVDPAcSMD8SRiYNya3rvM6xb7XCLyXhOC9DN+qJOo6dNSeMltPWwMYCZpMUx4cQoR9n3YGZFPLwDcDH9npa1Y95riDAAAAAElFTkSuQmCC"),
+        (4, 17) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ2CQBBFOVuObVgBPREuFmArdGEpHPE/3CEk688aD8qaNX52smHC8+/MSNc+zYE3HDjfL700SXMScV9KXW6nXpqkOYm4mDeO116apDmJuJi38ghwkBajYb3pxUWAg7QY2TwBDtJiZPNWBEHirION/eyXCxJnHWzsZ3mCxFkHG/tZ3grLRcAcfYC5deLevQTM0QeYW7M8AXP0AebWLG97toCpWQca+/OWkAIBU7MONPazPAFTsw409rO89NiuqxG4upKoq+moDZVFPWMNYCRonKY8aEJE7McLSZKaj/HGxKAJEXExT83HeGNi0ISIuJinR7Zvc+A/HKiqCQT7+dvTt89LsIyX+A9363HGjYCZfw409v3b0w8cZmgHmFv921MDLjiwLwnFzuFDlURdTccByNl6xhrASNA4zcSgCRHxccYZkE3NgacDD7pwaO7cs2V+AAAAAElFTkSuQmCC"),
+        (4, 44) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOElEQVR4Ae2WUQ6CMBBE+faG3In44wG8CrfiE+chS0zqBLMaQk2NY5um6zy325WuvVoGPsjAfL/00ihNq5j3e6Ham4q7Xm+9NErTKua7fguPTAdpNhqWTW8+tD8VJ8BBmo2s34IgUzLkYGO9+OXZOEGSWQcb64XfAsuHjDn6AHPjyN5XZeMEzNEHmBsLv81bxtSsA431aQtYJ9k4AVOzDjTWC7/Vtuuyxtm4XwBXVxJ1XTpqQ8ebak/ZOJVFvq0BjGROpikPLiFi7tsLQVI2TtC0NzoGlxAx3/WTZXu3DPxHBqq6BIL9vs0cdW6Cpb3Ef7gbz9NuBEz/c6Cx7p+ejsps+AiYph1gbvRPT/FFR401Am8lIXiX4VOVRF2XjtJTZutpawAjQZNpyoNLiJifp50B2dQy8MzAA8gShc6UOLJ7AAAAAElFTkSuQmCC"),
+        (4, 71) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOUlEQVR4Ae2WwQ2DMAxFOXdDdkK9dICuwlYc6X80RojUSuVDIFIqfeJGOH51HDdD//QM/JGB5/M1SrO0JGGPJdf1/RilWVqSsIt+ihGKt/HIeZJWR9P20o+HACdpdeT6KU4o3oYgZ36pB2vzWcYESWY9WJvP/KLxNlgeWoCtNzBvnHn3KAGz9QbmjZlfNN4eWwtQsx6ozS+7QzIETM16oDaf+UXjpbDDEF3gSuDmSqKtQ0dtqCxCbUZlUb+tAYwETaYpDw4hws7aEu8eJWjaGx2DQ4iwi37ReMfY3e4ZaDoDTR0CwYba2iU7JFjamd0ZvLHYpqrBC5h+64HafHbrqgZ4DiRg/iQMzBuzW9d5nWrfWwTeS0LwXoZvVRJtHTpqT5ltp60BjARNpikPDiHCvk87A7KrZ+CbgQ+WMYg24ZsVqwAAAABJRU5ErkJggg=="),
+        (4, 26) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABKUlEQVR4Ae2W2w2DMAxFmalrdAJ2Qvx0IbboKHzSe9IYIVKLCoVHpFS6jRvh5vRiuzT1VR34w4HH+9lKgzRGEbdbqX3/aqVBGqOID8sLPALspMlRFy768SbATpocZc8LCILEWQ/W9hPHBImzHqztZ8sLsLwJmFtvYN46cO1SAubWG5i3ZsubzxYwNeuB2v44J8RAwNSsB2r72fLisU1TInBxJVFW01EbKotyxhrASNA4TXnQhIg4GUtcu5Saj/HGxKAJEfFhecuza1wdKNqBvc1zyY8W7K6nrqtgGUv23++tm2PqNHi5y9z0QG0/eeo6DXB9kIAZ9gbmrclT1/p7TvtcIvBcEoL3HL5VSZTVdNSenC1nrAGMBI3TlAdNiIjvM86ArKoOfB34AAHPa1bTdlSmAAAAAElFTkSuQmCC"),
+        (4, 53) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJklEQVR4Ae2WWw6CQAxF+XaH7In44wLcCrviE+/BKSGMDYYMjyZjcp06oc7x0laa+qoO/OHA+H60Ui8NScTtVurz+WqlXhqSiA/Lm3gE2Emjo2666MebADtpdFQ8b0IQJM56sLafOSZInPVgbb9Y3gTLm4C59QbmrT3XLiVgbr2BeWuxvPlsAVOzHqjtD3NCCgRMzXqgtl8sLx3bNBGBw5VErKajNlQWccYawEjQOE150ISIOBtLXLuUmo/xxsSgCRHxYXnLs2tcHQjtwN7mueRHC3bXU9dVsIwl++/31s0xdRq83GVueqC2nz11nQa4PkjADHsD89bsqWv9Pad9jgg8l4TgPYdvVRKxmo7ak7NxxhrASNA4TXnQhIj4PuMMyKrqwNeBDw9xiDas/vNzAAAAAElFTkSuQmCC"),
+        (4, 80) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABAklEQVR4Ae2WUQ6DMAxDuSZ3QvzsQtyKz82vaytEFzH1I1Apk0y7qsHGJKFT/MKBPxxY19csbMKewXy+CtVe17ikR6SL8DawpE0/LtrvGpckiBSHLLFlvXHaOy6J5SJiXn0RZo0be4/wjqvcIiZnLaFlfa8BeeIdl2mnyZu4l+8oeLiUGKvosFqvybU99fKhtUI3wWnSgyIEzJt2VgPyxDsu08YQDozvQG/x3PLkEtvV1u4SSzsrZwZrvGxvbuLlLv3WElrWm9Oam8AzkQTzkSjCrLE5rZ3v4/Z/RME1JSTecvhRKTFW0ZF7cnactoZgINE4TXpQhID5c9oZIgPhwNeBD92Bip4notVMAAAAAElFTkSuQmCC"),
+        (5, 0) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABCklEQVR4Ae2W4QnDIBSEnalrdILslKGyRUfJz/Y+URHso62GRwULFyV4ueN8vhrWbyXwRQK3x30TDuFMYL59omqtKy/6keguPA3scdGbh9a78qIFiZKQZTa/b5L25kWzPCTM1mdj1niwtoY3r2hLmJq1jOb3ZyGkiTcvyYbgLdyrVxueriTmOnRErW1ybU+9engt0EdImvLgEALmTTsrhDTx5iXZNawE5k9gqsMjs65tbWh7ZZZ2lu8M1ti0t17ekFnIEqbfWkbz+8tua2gOQYb5k8jGrPGy29qQWcgzGi4lIfNWwn9VEnMdulQW87Q1DAOVA0lTHhxCwLxpZ6yt0curv7HmK4EfE3gBN8rQ0jVt2fYAAAAASUVORK5CYII="),
+        (5, 81) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVHEUKFjQKCEtBOmJFMXm62qbT+AwHPnBgv19maZW2JOL5Xer1cZulVdqSiL+Wd/AIcJF2R8tx6MWXABdpd9Q970AQJM56sLZfOSZInPVgbb9b3gHLl4B59AbmrStnSwmYR29g3totL98tYGrWA7X9LSekQMDUrAdq+93y0rXTFBE4XEnEajpqQ2URZ6wBjASN05QHTYiIq7HE2VJqPsYbE4MmRMRfyyvvHvFwILQDoZpHsL9/62p9vIJlLNl/v7dWY6o1r5Uz5+li5qYHavv937oywclAwAx7A/PW/m9dJznz8YjAuSQE7zn8VyURq+moDTkbZ6wBjASN05QHTYiIq3HG2VKteeVvjHg4cNKBJ0Vs7bJz7kjrAAAAAElFTkSuQmCC"),
+        (5, 162) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9F6IjMEVbYxTKnDhamGs+nGR1Az90x34woF5fozSIq2HiMdPqbfnfZQWaT1EfFneziPASdocTfuhN18CnKTNUfO8HUGQOOvB2n7hmCBx1oO1/WZ5OyxfAubRG5i3LpzNJWAevYF5a7O8dLeAqVkP1PbXlHAEAqZmPVDbb5Z3XDsMEYHDlUSspqM2VBZxxhrASNA4TXnQhIi4GEuczaXmY7wxMWhCRHxZXn53j7sDoR0I1TyC/f1bV+3jFSxjyf77vbUYU7V5tZwpTxczNz1Q22//1pUITgYCZtgbmLe2f+s6yZmORwROJSF4z+G/KolYTUdtyNk4Yw1gJGicpjxoQkRcjDPO5qrNy3+jx92Bkw68ABOL8BqOjkhbAAAAAElFTkSuQmCC"),
+        (5, 27) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsII6TUojqqtpFS6YgV5bjDcdx07dcy8EYGro9bL4zCtIK4P6LO90svjMK0gviQJw1Lb/Ej8iDMCYZl0YuHDA7CnCDlScfSWyyIzJdmZmO+yJhMktnMbMwXPFdvMctDL2Drw1g2jqzdQ4bZ+jCWjQXP1du09QJqNjMa89NGWAMZpmYzozFf8Fy9Vbbr3Bf80nB1JVHXoaM2VBZWm1FZfL+tYRjINJmmPDiEgLhoS6zdQ6Zpb3QMDiEgPuS5envtFrcMVJ0B9xC4vFPJkqjV1lzeWbO0s7gzZGPRpmTW4p0yC1nC9NvMaMx//taFuAMZ5k8ijGXj529djlk4NRreSkLmswz/VUlYh0cfZ/HY1dOQeD1tLb5WpskY5cEhBMRFO4v1Mbq84LexZcDIwBP0A+2yAbfQxQAAAABJRU5ErkJggg=="),
+        (5, 108) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVXCEFq+jCB0VBXGNFOd3FcdwO/dcz8EEG1vtlFGZhKSAej6haa/Guj9sozMJSQHyot/mR6CSsCaZt0ZuH1ls8GZyENUGqt1mQKBnKzMZ8tXOXJ5NkNjMb85XeZpaHhDn6MJaNM2tf4fJkmKMPY9lY6e3aEqZmM6Mxv+yEErg8GaZmM6MxX+kV2WFwhV3eNwyfriTOdemoDR2v1Z5cnsrCb2sYBhIn05QHlxAQ5+0FkuDyZJr2RsfgEgLiQz1J9n/PwH9kwL0ELq8paxK12ozLazVLe4l3eDZW7UZmLV6TWcgSpv9lRmO++npyeWg2QcI07TCWjdXXk8trMgvZFXZ5aDZBwntJKM4y/FMlYV0ebc7iNWU3yBI/T1t7MU3GKA8uISCu2lmsj1GbtXjB72PPgJGBJwG0CqFrTRz3AAAAAElFTkSuQmCC"),
+        (5, 189) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s+9fbLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA8/EDQkUmkgdAAAAAElFTkSuQmCC"),
+        (5, 54) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABSklEQVR4Ae2WUQ6CMBBEOZPX8ATcifjjhbiFR+FT5xGWkNQNZiBqk5oM3TQdZthu13bt1zLwQQYuj2svjMK0gLjfo95u914YhWkB8S5PGpbe7EfkQXgmGOZFbx4yOAjPBClPOpbebEFkvjQzG/NFxmSSzGZmY77guXqzWR56AVsfxrJxZO0WMszWh7FsLHiu3qqtF1CzmdGYn1bCEsgwNZsZjfmC5+otsl3nvuCXhqsriboOHbWhsrDajMri+20Nw0CmyTTlwSEExEVbYu0WMk17o2NwCAHxLs/V22q3uGWg6gy4h8DlHUqWRK225vKOmqWdxZ0hG4s2JbMW75BZyBKm32ZGY/78WxfiDmSYP4kwlo3n37ocs3BqNLyWhMxnGf6rkrAOjz7O4rGrhyHxetpafK1MkzHKg0MIiIt2FutjdHnBb2PLgJGBFzti8BpckRdXAAAAAElFTkSuQmCC"),
+        (5, 135) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++sj8fnLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA0kEDQma8r+YAAAAAElFTkSuQmCC"),
+        (5, 216) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2W0Q2DMAxEmalrdAJ2Qvx0IbboKHzSewgjpNSiuvSjVKl6xIpyuovjGLr2axn4IAPj+OiFSZg3EPdnVK21eLfnvRcmYd5AfKq3+pHoICwJhnXRm4fWWzwZHIQlQaq3WpAoGcrMxnyxc5cnk2Q2Mxvzhd5qloeEOfowlo0Ta49weTLM0YexbCz0dm0JU7OZ0Zifd8IWuDwZpmYzozFf6G2yXecKu7xvGL5cSVzr0lEbOl6rPbk8lYXf1jAMJE6mKQ8uISDO2wskweXJNO2NjsElBMSnepJs/5aB/8iAewlcXlXWJGq1GZdXa5b2Eu/wbCzajcxavCqzkCVM/8uMxnzx9eTy0KyChGnaYSwbi68nl1dlFrIr7PLQrIKE95JQnGX4p0rCujzanMWrym6QJX6dtnYwTcYoDy4hIC7aWayPUZu1eMFvY8uAkYEXFyMPcbmQq+wAAAAASUVORK5CYII="),
+        (5, 9) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsII6TUorpUValS9YgV5XQX45h07dcy8EYGro9bL4zCtIK4P6JqrcWb75deGIVpBfGh3uJHooMwJxiWRS8eWm/xZHAQ5gSp3mJBomQoMxvzxc5dnkyS2cxszBd6i1keEubVh7FsHFm7h8uTYV59GMvGQm/TljA1mxmN+WkjrIHLk2FqNjMa84XeKtt1rrDL+4Th05XEuQ4dtaHXa7Unl6ey8NsahoHEyTTlwSEExHl7gSS4PJmmvdExOISA+FBPku3fMvAfGXAPj8uryppEv9rWas3SzuLOkI1Fu9EmLV6VWcgSpt9mRmO+uD25PDSrIGE+EmEsG4vbk8urMgvZFXZ5aFZBwltJKM4y/FMlYR0ebc7iVWU3yBI/T1vbmSZjlAeHEBAX7SzWx6jNWrzgt7FlwMjAE6Kp7bJYCq4zAAAAAElFTkSuQmCC"),
+        (5, 90) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2W0Y2DMBBE+b5yro2rgJ7o4VqhiyuFT24eYhHSZkU0lpIgOdLgleXxjJf1hqH/egaeyMD6+zUKs7DsIB6vqN9/P6MwC8sO4kueNCy9zY/Ik7AWmLZFDx4yOAlrgZInHUtvsyAyJ63MxnzKmEyS2cpszCeeq7eZ5aENePVhrBpn1p4hw7z6MFaNiefqHdragJqtjMb8chD2QIap2cpozCeeq7fLDoO7wTsN364k7nXpqA2VhdVmVBavb2sYBjJNpikPLiEgTm2JtWfINO2NjsElBMSXPFfvrN3jnoFbZ8C9PC6vKVkStdqTy2s1S1uK//5qTG1KZi1ek1nIEqZvVkZjPn11uTw0myBhmn0Yq8b01eXymsxCdoVdHppNkPBREoqrDH9USViXR4ezeE3ZDbLE79PWTqbJGOXBJQTEqZ3F+hh1WIsX/D72DBgZ+AewSwqhQNsclwAAAABJRU5ErkJggg=="),
+        (5, 171) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s798fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA35qDQk83i/HAAAAAElFTkSuQmCC"),
+        (5, 36) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABQUlEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/ResILBFS2yAzW4cLEwPnS5SKqn8RsO/ODA/fWYhVXYEojnb9T9eZuFVdgSiC/jHXokcBF2B8tx6MNDAhdhd9Ccd0iQSJz1xNp+4ZhE4qwn1vab8Q6xPCSYT2/CvHXlbA4J5tObMG9txjtzSzA16wm1/e0kpECCqVlPqO0346W009Sj4O5Koq+mozZUFv2MNQQDicZpyoMmBMTFWOJsDjUf442JQRMC4st4ee4RDwe6diDadFFelVlKGhprUV6tWMaZ3Rm8tRhTEhviVYmFrMTMW0+o7Re3riiPnFVQYv4kTJi3FreuKK9KLORo4iiPnFVQ4rMkFHsO/1VJhJpHLxfiVblrZCXvZ6xlonGM8qAJAXExzuy8rXrZEM/4Yx0OBBx4A17xCqHeY9q3AAAAAElFTkSuQmCC"),
+        (5, 117) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae1WwQ2DMBDj3XG6RidgJ3boKmzRUXhSG+UiRHqi9UmnIqWSyTWKsTGXiKH/egJfJLA+byMwA0sB6/GMirWpvM0PRCdgdTBtiz5csD6Vt1mAKBPyzNp8k3Q2bzPLC4T56s2YN85cu0c2r2pDmD3rGbX5pRJKkc0rssOQLazq7Q1friWutekYNV5T6vGk6tFrBW7CpNke3IQE6+Y4q4RSZPOKbB96AtdP4P56jMAMLAWsTzcd1kq8UGIQnYDVgfu1hvUSL2qWCXlmbb5JGmYlXsgsyRDmqzdj3th8rak8aoYAYfasZ9Tmm681lRcyS7IqrPKoGQKEa0ugtkSP41+1hLR58HASL5SukSEuHU8qz3RDI8SZGNuDm5Bg3RxnRxGVd7xP/98T+CGBN2yTJ4Eldmi0AAAAAElFTkSuQmCC"),
+        (5, 198) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJHC93nphFKYE6v4ddb6femEUpgTqn/EWPzI4CLODYVn04iGDgzA7OJy3WJBJkvXM2nyWmEySrGfW5g/jLWZ5yDCv3ox548jaLWSYV2/GvPEw3qotw/SsZ9Tmp5WQChmmZz2jNn8YL8l2XY2Gq2uJujYdvaG2qOdYwzCQaZKmPdiEgDo7lli7hTYfxxsnBpsQUP+Mt9VudUug6gTOj0svjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4AjqyKelH2KBzAAAAAElFTkSuQmCC"),
+        (5, 63) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6zPh6fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA6ZBDQk0SnIOAAAAAElFTkSuQmCC"),
+        (5, 144) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EEC68fLKMzCUkA9XlEfj/dRmIWlgPqSJw1Lb/Mj8iSsCaZt0TcXGZyENUHKk46lt1kQmSfNzMZ8lZhMkmxmNuYrnqu3meWiG/Dqw1g2zqw9QoZ59WEsGyueq7dr6wb0bGY05pedUAoZpmczozFf8Vy9IjsM7g3+0/DtWuJem47eUFtYx4za4u+PNQwDmSZp2oNNCKirY4m1R8g0xxsnBpsQUF/yXL2jdq97ArdO4PXzbRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBL7PjKekWv15uAAAAAElFTkSuQmCC"),
+        (5, 225) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96AjckcLl8j8IsLAXU4xlVay3e+vMxCrOwFFCf6m1+JDoJa4JpW3TlovUWTwYnYU2Q6m0WJEpCmdmYr+7c5ckkyWZmY77S28xykTCPPoxl48za/3B5MsyjD2PZWOnt2hKmZzOjMb/shFK4PBmmZzOjMV/pFdlhcIVd3iMMv1xLvNamozf0eK3jyeWpLfxjDcNA4iRNe7AJAXV+vEASXJ5Mc7xxYrAJAfWpniT7tyfwHgl8/n6NwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHggIsUb2lZPMAAAAASUVORK5CYII="),
+        (5, 18) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2WUQ6CMBBEOZPX8ATcifjjhbiFR+ET5xGWkNQNZmqMmBqHbppOZrpsl3bt1zLwRgYuj2svjMK0grg/omqtxbvd7r0wCtMK4kO9xY9EB2FOMCyLXjy03uLJ4CDMCVK9xYJEyVBmNuaLnbs8mSSzmdmYL/QWszwkzKsPY9k4snYPlyfDvPowlo2F3qYtYWo2Mxrz00ZYA5cnw9RsZjTmC71VtutcYZf3CcOnK4lzHTpqQ6/Xak8uT2XhtzUMA4mTacqDQwiI8/YCSXB5Mk17o2NwCAHxoZ4k279l4D8y4B4el1eVNYl+ta3VmqWdxZ0hG4t2o01avCqzkCVMv82Mxnxxe3J5aFZBwnwkwlg2Frcnl1dlFrIr7PLQrIKEt5JQnGX4p0rCOjzanMWrym6QJX6etrYzTcYoDw4hIC7aWayPUZu1eMFvY8uAkYEnYznwGp7VOlYAAAAASUVORK5CYII="),
+        (5, 99) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++s798fs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA3DbDQk3WrDeAAAAAElFTkSuQmCC"),
+        (5, 180) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0YnDMBBEXdO1cRW4J5Ofa8hdXCn+TOYZrzFsFocRJDEoMNYiNJrRerXx0H89Ay9k4Hb7G4VZWDYQj2fUn//fUZiFZQPxKU8alt7qR+RJuBeY1kVPHjI4CfcCJU86lt5qQWROWpmN+ZQxmSSzldmYTzxXbzXLQxvw6sNYNc6sPUKGefVhrBoTz9XbtbUBNVsZjfllJ2yBDFOzldGYTzxXb5MdBneDTxq+XElc69JRGyoLq82oLN7f1jAMZJpMUx5cQkCc2hJrj5Bp2hsdg0sIiE95rt5Ru8c9A5fOgHt5XF5TsiRqtSeX12qWthT//dWY2pTMWrwms5AlTN+sjMZ8+upyeWg2QcI0+zBWjemry+U1mYXsCrs8NJsg4b0kFFcZ/qqSsC6PDmfxmrIbZIlfp60dTJMxyoNLCIhTO4v1MeqwFi/4fewZMDLwAD76D3FxR3BEAAAAAElFTkSuQmCC"),
+        (5, 45) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6z7l9vs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwAx+BDQn2OX6jAAAAAElFTkSuQmCC"),
+        (5, 126) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96AjcksP58jMIsLAXU4xlVay3e5fI9CrOwFFCf6m1+JDoJa4JpW3TlovUWTwYnYU2Q6m0WJEpCmdmYr+7c5ckkyWZmY77S28xykTCPPoxl48za/3B5MsyjD2PZWOnt2hKmZzOjMb/shFK4PBmmZzOjMV/pFdlhcIVd3iMMv1xLvNamozf0eK3jyeWpLfxjDcNA4iRNe7AJAXV+vEASXJ5Mc7xxYrAJAfWpniT7tyfwHgl8/n6NwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHLSMp6T0ynPgAAAAASUVORK5CYII="),
+        (5, 207) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EECj8f7KMzCUkA9XlHXj5dRmIWlgPqSJw1Lb/Mj8iSsCaZt0TcXGZyENUHKk46lt1kQmSfNzMZ8lZhMkmxmNuYrnqu3meWiG/Dqw1g2zqw9QoZ59WEsGyueq7dr6wb0bGY05pedUAoZpmczozFf8Vy9IjsM7g3+0/DtWuJem47eUFtYx4za4u+PNQwDmSZp2oNNCKirY4m1R8g0xxsnBpsQUF/yXL2jdq97ArdO4PXzbRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBL/szLFHi2W6oAAAAAElFTkSuQmCC"),
+        (5, 72) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABQElEQVR4Ae2W0QnDMAxEM1PX6ATZKfSnC2WLjpLP9F6wgsEVLbIDNbhwsTA+dLlIqqfxGw784MDtdZ+FVdgSiOdv1MfjOQursCUQX8Y79EjgIuwOluPQh4cELsLuoDnvkCCROOuJtf3CMYnEWU+s7TfjHWJ5SDCf3oR568rZHBLMpzdh3tqMd+aWYGrWE2r720lIgQRTs55Q22/GS2mnqUfB3ZVEX01Hbags+hlrCAYSjdOUB00IiIuxxNkcaj7GGxODJgTEl/Hy3CMeDnTtQLTporwqs5Q0NNaivFqxjDO7M3hrMaYkNsSrEgtZiZm3nlDbL25dUR45q6DE/EmYMG8tbl1RXpVYyNHEUR45q6DEZ0ko9hz+q5IINY9eLsSrctfISt7PWMtE4xjlQRMC4mKc2Xlb9bIhnvHHOhwIOPAGZtEPcQCqE8UAAAAASUVORK5CYII="),
+        (5, 153) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJDDfT70wClMCdf+Oer3eemEUpgTqn/EWPzI4CLODYVn04iGDgzA7OJy3WJBJkvXM2nyWmEySrGfW5g/jLWZ5yDCv3ox548jaLWSYV2/GvPEw3qotw/SsZ9Tmp5WQChmmZz2jNn8YL8l2XY2Gq2uJujYdvaG2qOdYwzCQaZKmPdiEgDo7lli7hTYfxxsnBpsQUP+Mt9VudUug6gTOj0svjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4AnRzLFF2A/XGAAAAAElFTkSuQmCC"),
+        (5, 234) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLklEQVR4Ae1WwQ2DMBBjpq7RCdgJ9dOF2KKj8KQ2ykWI9ETrk05FSiWTaxRjYy4RQ//1BL5I4PF4jsAMLAWsxzMq1qbyNj8QnYDVwbQt+nDB+lTeZgGiTMgza/NN0tm8zSwvEOarN2PeOHPtHtm8qg1h9qxn1OaXSihFNq/IDkO2sKq3N3y5lrjWpmPUeE2px5OqR68VuAmTZntwExKsm+OsEkqRzSuyfegJXD+B2+s+AjOwFLA+3XRYK/FCiUF0AlYH7tca1ku8qFkm5Jm1+SZpmJV4IbMkQ5iv3ox5Y/O1pvKoGQKE2bOeUZtvvtZUXsgsyaqwyqNmCBCuLYHaEj2Of9US0ubBw0m8ULpGhrh0PKk80w2NEGdibA9uQoJ1c5wdRVTe8T79f0/ghwTeQpIuucUYNAwAAAAASUVORK5CYII="),
+        (5, 3) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJUlEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lnuVEyGCVdQUi0hBusaKcvh0cSwP/dcd+MKB6+M2CrOwGIjHParOhvI2PUo6CauDaTv04aPzobxNgpLikCc27RdOR/M2sXyUmKtPwrx15uwronk5txJTs57QtL9kggXRPEs7DNGJj+Z7FdxcSbT16LBa1xTano7mQ2uG/gSnKQ8eISAu2lkmWBDNs7R96Q6078B6v4zCLCwG4p89uirHJHASVgenT2u1YnHWE5v2C6etnaVZw1sLXpVYyHKVq0/CvPW0aY2cVZBgatYTmvZPm9aqxEJuUXAuCYlPjr6vf1USbT06K4t22hqCgcoBpykPHiEg3m1L1t6Y7JjwAPEuj5wd3YGDDjwBtMTtshgDxqkAAAAASUVORK5CYII="),
+        (5, 84) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOElEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80ntRjJBSiwoCwlIqHbEirDwdtpuu/ZoDfzgwvx+9NEpTFnG/lfr8vHpplKYs4tPyEo8AB2l2NKSXfjwEOEizo+p5CUGQOOvB2n7hmCBx1oO1/Wp5CZaHgPn0BuatI++uJWA+vYF5a7W85WwBU7MeqO1PS0IOBEzNeqC2Xy0vH9t1EYHDlUSspqM2VBZxxhrASNA4TXnQhIi4GEu8u5aaj/HGxKAJEfFpeeuzW9wcCO3A1U13yCzBXjrWjsIyzuzO4K3FmMrjzO4M3lrkHYIlWe4ybz1Q269/6+LwPRIwfxIG5q31b117YMmJCLyUhOA9h29VErGaLpdFnLEGMFI54DTlQRMi4s2xlMcbNzRuaoh4M48zm5oDOx34AsJmCqGA+Q55AAAAAElFTkSuQmCC"),
+        (5, 165) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HBjHZy9N0hxF3G+l3t+PXpqkOYr4tLzAI8BBWhwNYdGPnwAHaXFUPC8gCBJnPVibzxwTJM56sDZfLC/A8hMwR29g3jixdi0Bc/QG5o3F8tLeAqZmPVCbn1NCDARMzXqgNl8sL27bdTUCV1cSdV06akNlUU9bAxgJGqcpDy4hIs7aEmvX0uWjvdExuISI+LS89d4tbg5U7cDyuvXSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBD5CFDQmCMhasAAAAAElFTkSuQmCC"),
+        (5, 30) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ3CMAxFe2Yc1mCC7tQdWKVbMEqP5b8qrioZK8VCQKQg/caK4vrhOG6G/usZOJGB6+M2SrO0FGGPNdf1fhmlWVqKsKt+ipGKt/HIeZLWQNO26MVDgJO0Bgr9FCcVb0OQM/80grV5lzFBktkI1uadXzbeBstDL2DrDSwaZ9YeJWC23sCi0fll4+2x9QJqNgK1+WV3KIaAqdkI1OadXzZeCTsM2Rf8Eri5kmjr0FEbKotUm1FZfL+tAYwETaYpDw4hwnZtibVHCZr2RsfgECLsql823jF2t3sGms5AU4dHsL9rT+9us2BpS/btj0bXpkpbsrtGNDq/d/ncegHTNyNQm//8rcuRnJwQMM3ewKLx87euk3xuWYvAe0kIPsrwX5VEW4eOGlFm22lrACNBk2nKg0OIsKttqbQ3bnbc8BB21Y+YXT0DyQw8AXEMCqEIWzuLAAAAAElFTkSuQmCC"),
+        (5, 111) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABbElEQVR4Ae2W0W3DMAxE/d1xukYn8E7eoat4i47iT/eeYRoF2INqNkCgQEEuEgQRfKGos6fxGRX4QwX2z7dZWqXtFPO5Faq9pbj3r49ZWqXtFPNmvoNHSRdpN1qOTb/8aH8pToCLtBvZfAeCklIhBxvr6Z9X4wRJZR1srKd8Byw/SszRB5gbV/b+VDVOwBx9gLkx5btyKzE960BjfbsCzkk1TsD0rAON9ZTvTDtN1cTVuEcAd9cSfV06ekPHW7Knapzaom5rACMlp9K0B5cQMff2QpBUjRM09oZjcAkR82Y+pRzfUYHXqEBXl0ewJVvTTf+/Pd09b8FiZ/HO4MZkN4LFluLZ78YUd5cv7RcwfutAYz29PQkY33SgsZ7iEsDdBQHzkAgwN6a3JwFj9gHmxhR3ly/t7xH4agnBuwqno1WFn9YSfV06ekSV7cfWAEaCptK0B5cQMW/akloDe6M9uISIeTOOnEOjAsUKfAN+rieBFKP+egAAAABJRU5ErkJggg=="),
+        (5, 192) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9k4HL5n6VV2oqI55Z1v/7M0iptRcRN3+/tb5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHUzNKeno6nXNAAAAAElFTkSuQmCC"),
+        (5, 57) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjA/+UwSrO0JGGPNdfj8TRKs7QkYVf9FCMUb+OR8yStjqZt0Z2PACdpdeT6KU4o3oYgZ/6pB2vzRcYESWY9WJsv/KLxNlg+2oCjNzBvnFm7l4A5egPzxsIvGi/H1gbUrAdq80t2SIaAqVkP1OYLv2i8FHYYoht8E7i5kmjr0lEbKotQm1FZfL6tAYwETaYpDy4hwi7aEmv3EjTtjY7BJUTYVb9ovH3sbvcMNJ2B9fw3SrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANXuFwNCXG04GMAAAAASUVORK5CYII="),
+        (5, 138) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Pz7WqVdOoqI15b1dvtdpV06ioibvu//n1XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHcX+KelFubjJAAAAAElFTkSuQmCC"),
+        (5, 219) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQGTqf/UZqlpYj9WHPV2ZTf7+VvlGZpKWJfjbfxKOgkrYGm7dCDh86n/AQ4SWugMN6GoKBkKII1u/vlWT9BktkI1uwu3gbLQ4G5egOL1pmzt8r6CZirN7BodfH22ApMzUagZl92h7LJ+gmYmo1Aze7ilbDDkA2c9XsHcHMl0VbTURu63tR4yvqpLPJjDWCk4GSa8qAJEft4vOAkZf0EzXhjYtCEiH01nkL2b8/Ad2RgPf+M0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq6UHSxR95LZAQAAAABJRU5ErkJggg=="),
+        (5, 12) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaUlEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVXCEZK8hBQkFBHIminO5wnGun8RkV+KAC18dtFlZhK2A+16jam+Lt98ssrMJWwLyqd/iR6CLsAZZj05sf7U/xZHAR9gCh3mFBolQoMmvr7p9neTJJZSOztu70DrP8SJijN2PRuLL3FVmeDHP0Ziwand6pLWF6NjJq69tJKJMsT4bp2ciorTu9IjtNWeEs7xuGu2uJvi4dvaHjTcVTlqe2yMcahoHEqTTtwSUEzON4gSRkeTJNvJEYXELAvKonyfEdFfiPCmQvQfbSNVVNZlMxI7OpOGw1S7zYMzwaXdzILDFo7xrR6HhNZiGruuRfZNTW3duTDJPTkVFbdzw0myDDhLYZi0b39iTDPFzMWDQ6XpNZyD0aPltC5qMKu6NVhX/WEn1dutIW/cQahoHagUrTHlxCwLwaS2oN4o324BIC5lUemgOjAskKPAEfsgqhbwq5egAAAABJRU5ErkJggg=="),
+        (5, 93) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXElEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsoRkiuReVIoEipdCSKMH49HJOh/7oDfziwvh+jNEtLEfPxLPT5eY3SLC1FzE/jlCOVb+NR8CStgabtph8XAU7SGiiMU55Uvg1BwfzTCNbWnWOCxNkI1tZdXDbfBstFD+DVG1g0ztx7lIB59QYWjS4um2/PrQdQsxGorS97QJkImJqNQG3dxWXzlbTDkH3AncDNlURbm47aUFmk2ozK4vq2BjASNE5THmxCxNy1Je49StC0NzoGmxAxP43L5jvm7vPuQNMOZDdBdtNVmSXYS9taLSztzM4M0ejaVHHWzgzR6OKqYAmWu/TbCNTW3alLwPTbCNTWXRw5qyRgPhIGFo3u1CVgPhIGFo0urgqW4BaB95IQfOSwe7Vy+LaSaGvTlbJop60BjFQOOE15sAkR89O2pNJIndbI2dUdSDrwBS1UJ4EO/UFeAAAAAElFTkSuQmCC"),
+        (5, 174) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBh6Pz1XapaOIeK1Z378/VmmXjiLiqu/8elulXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8APtkKen9QeWQAAAAAElFTkSuQmCC"),
+        (5, 39) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/SesUJAFSm2SzG4cLUwEX5cJMXT+A0HvnDg/nrM0iptWcTzVer+vM3SKm1ZxD/LSzwCXKQ90JIe+vAnwEXaAzXPSwiCxNkI1vadY4LE2QjW9pvlJVj+BMyrN7BoXXn2LAHz6g0sWpvlHWcLmJqNQG1/OxJyIGBqNgK1/WZ5+dhp6hG4u5Loq+moDZVFP2MNYCRonKY8aEJE7MYSz56l5mO8MTFoQkT8s7zz2SMeDnTtQGnzlDZrlVmCLbp1CbZoHNbCMpbs2x+tbkwJljFod41odXlVsCTLXeZmBGr77tYlYOZ0BGr7Lo8zqyRghr2BRau7dQmYj4uBRavLq4IluUfgoyQEHznsXq0c/ltJ9NV0uSz6GWsAI5UDTlMeNCEivhxLKg3GG+VBEyLiyzzOHBoOFDrwBtvrJ4EtE098AAAAAElFTkSuQmCC"),
+        (5, 120) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPklEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/ResExBFS42uBhcuFoYX3WcJdXL/EwHfnDgfN5WYReOBOK1RNXZrrxLj5Juwhlguw59+dL5rrxLgpLiUCTW9p3TvXmXWL6UmKs3YdG6c/YTvXk5txJTs5FQ2z8yIQW9eSntsvROXJvvU/BwJTFW02G1rqnreKrNh9YM/QhOUx40ISB24ywTUtCbl9LOZTowvgO1zXN/PVZhF44E4mKzNjkmsVVjTQI34QwQvvJaxTLO7M0Qrc4xicTZSKztO16TWMhyl3kbCbV991qTYK7ehEWr45GzCRLMn4QJi1b3WpNgajYSavuO1yQW8oiCc0lIfOSwu1o5/LeSGKvpUlmMM9YQDFQOOE150ISAuDiWVBqMN8qDJgTERR45J6YDlQ68AemNRGFIoCNEAAAAAElFTkSuQmCC"),
+        (5, 201) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScceDy+R2mWliLi8Sx1/fkYpVlaiohflrfxCHCSVqNpe+mfhwAnaTW6PW9DECTOOtjYT44JEmcdbOzflrfB8hAwnz7A3Drz7lEC5tMHmFtvy9vPFjA160Bjf9kTSiBgataBxv5teeXYYWgRuLmSaKvpqA2VRTtjDWAkaJymPGhCRJzGEu8epeZjvDExaEJE/LK849k97g407cDV5vn8/RqlWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBt6xGyTPd10MAAAAASUVORK5CYII="),
+        (5, 66) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBt6/P1Zpl44i4rVmfTw+V2mXjiLiqu/8elulXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/I0op6cPkxZsAAAAASUVORK5CYII="),
+        (5, 147) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYG9vvPLK3SVoQ911xvt/9ZWqWtCLvqpxipeAePnBdpD7QcD734EuAi7YFCP8VJxTsQ5MwvjWBt32VMkGQ2grV955eNd8DypRdw9AYWrSvPXiVgjt7AotX5ZeOdsfUCajYCtf3tdCiGgKnZCNT2nV82Xgk7TdkXfBO4u5Loq+moDZVFasyoLD4/1gBGgibTlAdNiLDdWOLZqwTNeGNi0IQIu+qXjXeNPeyRga4zkG2C38ffLK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8AQw7EbJB0C7XAAAAABJRU5ErkJggg=="),
+        (5, 228) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAqfT/yyt0lZEPLdS9Wwqbz//zNIqbUXETb+DR6aLtAdajofufOj5VJ4AF2kPFPodCDKlQhGs7btvns0TJJWNYG3f+R2wfMiYozewaF159lbZPAFz9AYWrc6vesuYno1AbX+rCSXI5gmYno1Abd/5Fdtpyhpn814B3F1L9HXp6A0db2o8ZfPUFvmxBjCSOZWmPbiEiDgeLyRJ2TxBM96YGFxCRNz0k+X4HxX4jgpkL8Hv5W+WVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AF/vxJMZnP3v8AAAAASUVORK5CYII="),
+        (5, 21) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA9//P7OwClsB8Vyj6t0U73L5nYVV2AqIq3qHH4kuwh5gOV568ND7KZ4MLsIeINQ7LEiUDEVmbd/98ixPJslsZNb2nd5hloeEOXozFq0r794iy5Nhjt6MRavTO7UlTM1GRm1/OwklyPJkmJqNjNq+0yuy05QVzvJeYbi7kuir6agNHW9qPGV5Kov8WMMwkDiZpjxoQkAcjxdIQpYn04w3JgZNCIirepIc35GBz8jA/vc1C6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcAeAzDQlf2xVPAAAAAElFTkSuQmCC"),
+        (5, 102) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwP73NUurtBUxn2vW7/+fWVqlrYh51Xe5/M7SKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwB7dUp6cCejF8AAAAASUVORK5CYII="),
+        (5, 183) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcycLv9ztIqbUXYc831+/9nllZpK8Ku+ilGKt7BI+dF2gMtx0NPvgS4SHug0E9xUvEOBDnzSyNY23cZEySZjWBt3/ll4x2wfOkFHL2BRevKs1cJmKM3sGh1ftl4Z2y9gJqNQG1/Ox2KIWBqNgK1feeXjVfCTlP2BZ8E7q4k+mo6akNlkRozKov3jzWAkaDJNOVBEyJsN5Z49ipBM96YGDQhwq76ZeNdYw97ZKDrDOx/X7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDrv0LFEt0BtpAAAAAElFTkSuQmCC"),
+        (5, 48) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBt6/P1Zpl44i4rVmPb/eVmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/nHsp6TxJ1RkAAAAASUVORK5CYII="),
+        (5, 129) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAvv5Z5ZWaSsinlupejaVdzr9z9IqbUXETb+DR6aLtAdajofufOj5VJ4AF2kPFPodCDKlQhGs7btvns0TJJWNYG3f+R2wfMiYozewaF159lbZPAFz9AYWrc6vesuYno1AbX+rCSXI5gmYno1Abd/5Fdtpyhpn814B3F1L9HXp6A0db2o8ZfPUFvmxBjCSOZWmPbiEiDgeLyRJ2TxBM96YGFxCRNz0k+X4HxX4jgpkL8/v5W+WVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYErqh1GyQRbPZ8AAAAASUVORK5CYII="),
+        (5, 210) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0Hbrf/WVqlrYh4rqXu959ZWqWtiLiapxqpegePkhdpD7QcF734EuAi7YHCPNVJ1TsQlMwvjWBt3zkmSJyNYG3f5WXrHbB86QY8egOL1pVrrxIwj97AotXlZeudtXUDejYCtf3tTCiBgOnZCNT2XV62Xik7TdkbfBO4u5bo69DRG2qL1JhRW3x+rAGMBI3TtAeHEBG7scS1Vwma8cbE4BAi4mpett619oiHA107kD08v4+/WVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeAJ4PEkxGv8H7gAAAABJRU5ErkJggg=="),
+        (5, 75) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD1deulUZqSiPu91Pv90UujNCURn5a38AhwkOZAw/LSl4cAB2kOVDxvQRAkzkawtu8cEyTORrC2XyxvgeUhYD69gUXryLtbCZhPb2DRWixvPVvA1GwEavvTmpACAVOzEajtF8tLx3ZdjcDVlURdTUdtqCzqGWsAI0HjNOVBEyJiN5Z4dys1H+ONiUETIuLT8rZnt7g5ULUD8/PSS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOAN48ssUS333CQAAAAASUVORK5CYII="),
+        (5, 156) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgSccWH8+RmmWliLi8Sz18fgepVlaiohflrfxCHCSVqNpe+mfhwAnaTW6PW9DECTOOtjYT44JEmcdbOzflrfB8hAwnz7A3Drz7lEC5tMHmFtvy9vPFjA160Bjf9kTSiBgataBxv5teeXYYWgRuLmSaKvpqA2VRTtjDWAkaJymPGhCRJzGEu8epeZjvDExaEJE/LK849k97g407cDVpvv8/RqlWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwB8W1JMZft7T8AAAAASUVORK5CYII="),
+        (5, 237) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXzhwvd5mYRW2BOK5RNXeprxDj4ouwh5gOTZ9+Gh/U94hQUVxKBJreed0a94hlo8Kc/QmLFpX9r6iNS/XVmF6NhJq+S0TUtCal8pOU+vCZ+u9Cu6uJfoaOqzWMTW9ns7WQ2uG/gSnaQ+GEBC76ywTUtCal8qOZTjQvwP7/W8WVmFLIC4O3f/jMgursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeAK/jEuZSUzxpQAAAABJRU5ErkJggg=="),
+        (5, 6) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJElEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9J6RTagrUuLU1ODCxcL4quMsCw391x34woHb8z4Ki7AaiMcjqs5W5QU9SjoJm4MpHPrw0fmqvCBBSXHIExv3M6dr84JYPkrM1Udh3rpwdo/avJRbialZT2jcXxPBgto8SzsMtROfzbcX3FxJtPXosFrXVLU9nc2H1gT9CU5THjxCQJy1s0SwoDbP0valO9C+A/P8GIVFWA3EP3t0RY5J4CRsDi6f1krF4qwnNu5nTls7i7OGt2a8IrGQ5SpXH4V562XTGjmLIMHUrCc07l82rRWJhdyi4FQSEh8dfV//qiTaenRWFu20NQQDlQNOUx48QkB82JasvTHZMeEB4kMeOTu6AycdeAE22vAaSMxY3wAAAABJRU5ErkJggg=="),
+        (5, 87) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HFhet16apDmKuN9Kvb8fvTRJcxTxaXmBR4CDtDgawqIfPwEO0uKoeF5AECTOerA2nzkmSJz1YG2+WF6A5Sdgjt7AvHFi7VoC5ugNzBuL5aW9BUzNeqA2P6eEGAiYmvVAbb5YXty262oErq4k6rp01IbKop62BjASNE5THlxCRJy1JdaupctHe6NjcAkR8Wl5671b3Byo2oFxfPbSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBD0R8DQkA2uJgAAAAAElFTkSuQmCC"),
+        (5, 168) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABN0lEQVR4Ae2WYQqDMAyFPdOusRN4J/HPLuQtdhR/uveVRoQuOLTKAh08G4qhH88ka9d+zYEfHBjHVy9N0pxF3O+lPt7PXpqkOYv4srzEI8BBWhwN6aUvDwEO0uKoel5CECTOerC2XzgmSJz1YG2/Wl6C5SFgPr2BeevEu1sJmE9vYN5aLW89W8DUrAdq+/OakAMBU7MeqO1Xy8vHdl1E4HAlEavpqA2VRZyxBjASNE5THjQhIi7GEu9upeZjvDExaEJEfFne9uwWNwdCO3B3050yS7C3jrWzsIwzuzN4azGm8jizO4O3FnmnYEmWu8xbD9T269+6OPyIBMyfhIF5a/1b1xFYciICryUheM/hvyqJWE2XyyLOWAMYqRxwmvKgCRHx7ljK440bGjc1RLybx5lNzYGDDnwAEpsPcaBVUv8AAAAASUVORK5CYII="),
+        (5, 33) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjA/+UwSrO0JGGPNdf1/DdKs7QkYVf9FCMUb+OR8yStjqZt0Z2PACdpdeT6KU4o3oYgZ/6pB2vzRcYESWY9WJsv/KLxNlg+2oCjNzBvnFm7l4A5egPzxsIvGi/H1gbUrAdq80t2SIaAqVkP1OYLv2i8FHYYoht8E7i5kmjr0lEbKotQm1FZfL6tAYwETaYpDy4hwi7aEmv3EjTtjY7BJUTYVb9ovH3sbvcMNJ2B4/E0SrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANX8xMNCZ+W5HAAAAAASUVORK5CYII="),
+        (5, 114) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQG1vPPKM3SUsR+rLnqbMrv9/I3SrO0FLGvxtt4FHSS1kDTdujBQ+dTfgKcpDVQGG9DUFAyFMGa3f3yrJ8gyWwEa3YXb4PlocBcvYFF68zZW2X9BMzVG1i0unh7bAWmZiNQsy+7Q9lk/QRMzUagZnfxSthhyAbO+r0DuLmSaKvpqA1db2o8Zf1UFvmxBjBScDJNedCEiH08XnCSsn6CZrwxMWhCxL4aTyH7t2fgOzJwOv2P0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq4AxCnpsfMCwQAAAABJRU5ErkJggg=="),
+        (5, 195) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Hb7XaVdOoqI15b1/PtapV06ioibvu//n1XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHc7ULFGDmgIBAAAAAElFTkSuQmCC"),
+        (5, 60) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABT0lEQVR4Ae2WUQrCMAyGdyav4Ql2p+GLF9otPMoe9f9GMwYxdAZxFir8ayjN8pmmWYf+6xk4kIHL4zpKs7QUYY8119vtPkqztBRhV/0UIxVv5ZHzJD0DTeuiNw8BTtIzUOinOKl4K4Kc+acRrM27jAmSzEawNu/8svFWWB56AVtvYNE4s3YvAbP1BhaNzi8bb4utF1CzEajNL5tDMQRMzUagNu/8svFK2GHIvuBM4OZKoq1DR22oLFJtRmXx+7YGMBI0maY8OIQI27Ul1u4laNobHYNDiLCrftl4+9jd7hloOgNNHR7BnteePt1mwdKW7Nsfja5NlbZkd41odH6f8rn1AqZvRqA2//1blyM5OCFgmr2BReP3b10H+dyyFoG3khB8lOG/Kom2Dh01osy209YARoIm05QHhxBhV9tSaW/c7LjhIeyqHzG7egaSGXgBOnIPcXtnDK0AAAAASUVORK5CYII="),
+        (5, 141) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9kYL/+zNIqbUXEc8t6ufzP0iptRcRN3+/tb5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHUgULFFqQKfiAAAAAElFTkSuQmCC"),
+        (5, 222) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABa0lEQVR4Ae2W0W3DMAxEPVPX6ATeychPF/IWHcWf6T3DNAqwB9VMgECBglwkCCL4QlFnT+MzKvCPCtxuX7O0Stsh5nMrVHtLcR/fn7O0Stsh5s18O4+SLtLdaNk3/fGj/aU4AS7S3cjm2xGUlAo52FhP/7waJ0gq62BjPeXbYflRYo4+wNy4sve3qnEC5ugDzI0p35lbielZBxrr2xlwTKpxAqZnHWisp3xH2mmqJq7GPQO4u5bo69LRGzrekj1V49QWdVsDGCk5laY9uISIubcXgqRqnKCxNxyDS4iYN/Mp5fiOCrxHBbq6PIIt2Zpu+uP2dPW8BYudxTuDG5PdCBZbime/G1PcVb60X8D4rQON9fT2JGB804HGeopLAFcXBMxDIsDcmN6eBIzZB5gbU9xVvrS/R+CzJQTvKpyOVhV+WUv0denoEVW2H1sDGAmaStMeXELEvGlLag3sjfbgEiLmzThyDo0KFCvwAxYzLrlzhjQxAAAAAElFTkSuQmCC"),
+        (5, 15) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA9//P7OwClsB8Vyj6t0Ub//7moVV2AqIq3qHH4kuwh5gOV568ND7KZ4MLsIeINQ7LEiUDEVmbd/98ixPJslsZNb2nd5hloeEOXozFq0r794iy5Nhjt6MRavTO7UlTM1GRm1/OwklyPJkmJqNjNq+0yuy05QVzvJeYbi7kuir6agNHW9qPGV5Kov8WMMwkDiZpjxoQkAcjxdIQpYn04w3JgZNCIirepIc35GBz8jA5fI7C6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcAaG5DQn1Ej16AAAAAElFTkSuQmCC"),
+        (5, 96) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcysP99zdIqbUXYc831+/9nllZpK8Ku+ilGKt7BI+dF2gMtx0NPvgS4SHug0E9xUvEOBDnzSyNY23cZEySZjWBt3/ll4x2wfOkFHL2BRevKs1cJmKM3sGh1ftl4Z2y9gJqNQG1/Ox2KIWBqNgK1feeXjVfCTlP2BZ8E7q4k+mo6akNlkRozKov3jzWAkaDJNOVBEyJsN5Z49ipBM96YGDQhwq76ZeNdYw97ZKDrDNxuv7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDq9bKelJm5fYAAAAAElFTkSuQmCC"),
+        (5, 177) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwOXyO0urtBUxn2vW7/+fWVqlrYh51bf/fc3SKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwBfXosUfno8ToAAAAASUVORK5CYII="),
+        (5, 42) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD1deulUZqSiPu91Pl56aVRmpKIT8tbeAQ4SHOgYXnpy0OAgzQHKp63IAgSZyNY23eOCRJnI1jbL5a3wPIQMJ/ewKJ15N2tBMynN7BoLZa3ni1gajYCtf1pTUiBgKnZCNT2i+WlY7uuRuDqSqKupqM2VBb1jDWAkaBxmvKgCRGxG0u8u5Waj/HGxKAJEfFpeduzW9wcqNqB+/3RS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOANXgEp6Y2gnsEAAAAASUVORK5CYII="),
+        (5, 123) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXziw3/9mYRW2BOK5RNXeprxDj4ouwh5gOTZ9+Gh/U94hQUVxKBJreed0a94hlo8Kc/QmLFpX9r6iNS/XVmF6NhJq+S0TUtCal8pOU+vCZ+u9Cu6uJfoaOqzWMTW9ns7WQ2uG/gSnaQ+GEBC76ywTUtCal8qOZTjQvwPX620WVmFLIC4O3f/jMgursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeAJro0bJiZNP6QAAAABJRU5ErkJggg=="),
+        (5, 204) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScceDy+R2mWliLi8Sx1/fkYpVlaiohflrfxCHCSVqNpe+mfhwAnaTW6PW9DECTOOtjYT44JEmcdbOzflrfB8hAwnz7A3Drz7lEC5tMHmFtvy9vPFjA160Bjf9kTSiBgataBxv5teeXYYWgRuLmSaKvpqA2VRTtjDWAkaJymPGhCRJzGEu8epeZjvDExaEJE/LK849k97g407cDVpvv8/RqlWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBOcJJMfnB3KQAAAAASUVORK5CYII="),
+        (5, 69) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBt6/P1Zpl44i4rVmfTw+V2mXjiLiqu/8elulXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/pVEsUWD7YRwAAAAASUVORK5CYII="),
+        (5, 150) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0H9vvPLK3SVkQ811Jvt/9ZWqWtiLiapxqpegePkhdpD7QcF734EuAi7YHCPNVJ1TsQlMwvjWBt3zkmSJyNYG3f5WXrHbB86QY8egOL1pVrrxIwj97AotXlZeudtXUDejYCtf3tTCiBgOnZCNT2XV62Xik7TdkbfBO4u5bo69DRG2qL1JhRW3x+rAGMBI3TtAeHEBG7scS1Vwma8cbE4BAi4mpett619oiHA107kD08v4+/WVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeAKy80kxv2gipAAAAABJRU5ErkJggg=="),
+        (5, 231) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAqfT/yyt0lZEPLdS9Wwqbz//zNIqbUXETb+DR6aLtAdajofufOj5VJ4AF2kPFPodCDKlQhGs7btvns0TJJWNYG3f+R2wfMiYozewaF159lbZPAFz9AYWrc6vesuYno1AbX+rCSXI5gmYno1Abd/5Fdtpyhpn814B3F1L9HXp6A0db2o8ZfPUFvmxBjCSOZWmPbiEiDgeLyRJ2TxBM96YGFxCRNz0k+X4HxX4jgpkL8/v5W+WVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYErgRJLmUF8nWUAAAAASUVORK5CYII="),
+        (5, 24) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2WUQrCMBBEeyav4Ql6p+KPF+otPEo/67ySLcK6RDaCRCKOCSHDjJvNtNP4jAp8UIHL4zoLq7AVMJ9rVO1N8W63+yyswlbAvKp3+JHoIuwBlmPTmx/tT/FkcBH2AKHeYUGiVCgya+vun2d5MkllI7O27vQOs/xImKM3Y9G4svcVWZ4Mc/RmLBqd3qktYXo2Mmrr20kokyxPhunZyKitO70iO01Z4SzvG4a7a4m+Lh29oeNNxVOWp7bIxxqGgcSpNO3BJQTM43iBJGR5Mk28kRhcQsC8qifJ8R0V+I8KZC9B9tI1VU1mUzEjs6k4bDVLvNgzPBpd3MgsMWjvGtHoeE1mIau65F9k1Nbd25MMk9ORUVt3PDSbIMOEthmLRvf2JMM8XMxYNDpek1nIPRo+W0Lmowq7o1WFf9YSfV260hb9xBqGgdqBStMeXELAvBpLag3ijfbgEgLmVR6aA6MCyQo8AWJJD3FnG7CZAAAAAElFTkSuQmCC"),
+        (5, 105) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBs6vt1XapaOIeK1Z378/VmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8AG/rLFGkwLX/AAAAAElFTkSuQmCC"),
+        (5, 186) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABW0lEQVR4Ae2WYQqDMAyFPdOusRN4J9mfXchb7Cj+dO+TRoQsOFJQCh08W4ox355p7NB/3YE/HHi93qM0S0sR8/Es9PF5jtIsLUXMT+OUI5Vv41HwJK2Bpu2mHxcBTtIaKIxTnlS+DUHB/NMI1tadY4LE2QjW1l1cNt8Gy0UP4NUbWDTO3HuUgHn1BhaNLi6bb8+tB1CzEaitL3tAmQiYmo1Abd3FZfOVtMOQfcCdwM2VRFubjtpQWaTajMri+rYGMBI0TlMebELE3LUl7j1K0LQ3OgabEDE/jcvmO+bu8+5A0w5kN0F201WZJdhL21otLO3MzgzR6NpUcdbODNHo4qpgCZa79NsI1NbdqUvA9NsI1NZdHDmrJGA+EgYWje7UJWA+EgYWjS6uCpbgFoH3khB85LB7tXL4tpJoa9OVsminrQGMVA44TXmwCRHz07ak0kid1sjZ1R1IOvAFPgouudERDWoAAAAASUVORK5CYII="),
+        (5, 51) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBt6/P1Zpl44i4rVmPb/eVmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/HpEsUaQy/y4AAAAASUVORK5CYII="),
+        (5, 132) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAvv5Z5ZWaSsinlupejaVdzr9z9IqbUXETb+DR6aLtAdajofufOj5VJ4AF2kPFPodCDKlQhGs7btvns0TJJWNYG3f+R2wfMiYozewaF159lbZPAFz9AYWrc6vesuYno1AbX+rCSXI5gmYno1Abd/5Fdtpyhpn814B3F1L9HXp6A0db2o8ZfPUFvmxBjCSOZWmPbiEiDgeLyRJ2TxBM96YGFxCRNz0k+X4HxX4jgpkL8Hv5W+WVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AFLDNJMWjsntEAAAAASUVORK5CYII="),
+        (5, 213) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYGbrf/WVqlrQh7rrnu959ZWqWtCLvqpxipeAePnBdpD7QcD734EuAi7YFCP8VJxTsQ5MwvjWBt32VMkGQ2grV955eNd8DypRdw9AYWrSvPXiVgjt7AotX5ZeOdsfUCajYCtf3tdCiGgKnZCNT2nV82Xgk7TdkXfBO4u5Loq+moDZVFasyoLD4/1gBGgibTlAdNiLDdWOLZqwTNeGNi0IQIu+qXjXeNPeyRga4zkG2C38ffLK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8AT6Q0uZok+w9QAAAABJRU5ErkJggg=="),
+        (5, 78) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2WYQqDMAyFPdOusRN4J/HPLuQtdhR/uvdJI0IWHG1lFDp4ayiGfjyT2KH/ugM/OPB4P0dpkdYk4vEqdZ5fo7RIaxLxbXk7jwAnaQs07Q99+RPgJG2BquftCILE2QjW9p1jgsTZCNb2q+XtsPwJmFdvYNG68OxZAubVG1i0Vss7zhYwNRuB2v56JKRAwNRsBGr71fLSscPQInBzJdFW01EbKot2xhrASNA4TXnQhIjYjSWePUvNx3hjYtCEiPi2vPPZPe4ONO1AbvPkNmuRWYLNunUJNmsclsIyluzbH61uTAmWMWh3jWh1eUWwJMtd5mYEavvu1iVg5nQEavsujzOLJGCGvYFFq7t1CZiPi4FFq8srgiW5ReCjJAQfOexerRz+W0m01XSpLNoZawAjlQNOUx40ISK+HEsqDcYb5UETIuLLPM7s6g5kOvABZeEuuXkgEOkAAAAASUVORK5CYII="),
+        (5, 159) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgSccWH8+RmmWliLi8Sz18fgepVlaiohflrfxCHCSVqNpe+mfhwAnaTW6PW9DECTOOtjYT44JEmcdbOzflrfB8hAwnz7A3Drz7lEC5tMHmFtvy9vPFjA160Bjf9kTSiBgataBxv5teeXYYWgRuLmSaKvpqA2VRTtjDWAkaJymPGhCRJzGEu8epeZjvDExaEJE/LK849k97g407cDV5vn8/RqlWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBc4NLmSjXbVkAAAAASUVORK5CYII="),
+        (5, 240) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPUlEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9F6wTEAVKTa4GFy4WhhfdZwl1dP4DAd+cGBdX7OwCXsC8XxH1dmmvFOPki7CEWA5D3350vmmvFOCkuJQJNb2ndOteadYvpSYqzdh0bpx9orWvJxbianZSKjt75mQgta8lHaaWicuzXcV3F1J9NV0WK1rajqeSvOhNUM/gtOUB00IiN04y4QUtOaltGMZDvTvQGnzPN7PWdiEPYH4tlmrHJPYorEmgYtwBAhfebViGWf2ZohW55hE4mwk1vYdr0osZLnLvI2E2r57rUkwV2/CotXxyFkFCeZPwoRFq3utSTA1Gwm1fcerEgu5R8G5JCQ+cthdrRz+W0n01XSpLPoZawgGKgecpjxoQkB8O5ZUGow3yoMmBMS3PHIODAcKHfgAQaJOAYi9zgoAAAAASUVORK5CYII="),
+        (5, 1) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPklEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/ResExBFS42uBhcuFoYX3WcJdXL/EwHfnDg/nqswi4cCcRriaqzXXmXHiXdhDPAdh368qXzXXmXBCXFoUis7Tune/MusXwpMVdvwqJ15+wnevNybiWmZiOhtn9kQgp681LaZemduDbfp+DhSmKspsNqXVPX8VSbD60Z+hGcpjxoQkDsxlkmpKA3L6Wdy3RgfAdqm+d83lZhF44E4mKzNjkmsVVjTQI34QwQvvJaxTLO7M0Qrc4xicTZSKztO16TWMhyl3kbCbV991qTYK7ehEWr45GzCRLMn4QJi1b3WpNgajYSavuO1yQW8oiCc0lIfOSwu1o5/LeSGKvpUlmMM9YQDFQOOE150ISAuDiWVBqMN8qDJgTERR45J6YDlQ68AWNq7bLcBkqIAAAAAElFTkSuQmCC"),
+        (5, 82) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/SesUJAFSm2SzG4cLUwEX5cJMXT+A0HvnBgf95maZW2LOL5KvX+eszSKm1ZxD/LSzwCXKQ90JIe+vAnwEXaAzXPSwiCxNkI1vadY4LE2QjW9pvlJVj+BMyrN7BoXXn2LAHz6g0sWpvlHWcLmJqNQG1/OxJyIGBqNgK1/WZ5+dhp6hG4u5Loq+moDZVFP2MNYCRonKY8aEJE7MYSz56l5mO8MTFoQkT8s7zz2SMeDnTtQGnzlDZrlVmCLbp1CbZoHNbCMpbs2x+tbkwJljFod41odXlVsCTLXeZmBGr77tYlYOZ0BGr7Lo8zqyRghr2BRau7dQmYj4uBRavLq4IluUfgoyQEHznsXq0c/ltJ9NV0uSz6GWsAI5UDTlMeNCEivhxLKg3GG+VBEyLiyzzOHBoOFDrwBnEMCqGwbSzjAAAAAElFTkSuQmCC"),
+        (5, 163) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScceDy+R2mWliLi8Sz18/drlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm2f9+RilWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBPysNCQtpiJ4AAAAASUVORK5CYII="),
+        (5, 28) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXElEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsoRkiuReVIoEipdCSKMH49HJOh/7oDfzjw/LxGaZaWIubjWej6fozSLC1FzE/jlCOVb+NR8CStgabtph8XAU7SGiiMU55Uvg1BwfzTCNbWnWOCxNkI1tZdXDbfBstFD+DVG1g0ztx7lIB59QYWjS4um2/PrQdQsxGorS97QJkImJqNQG3dxWXzlbTDkH3AncDNlURbm47aUFmk2ozK4vq2BjASNE5THmxCxNy1Je49StC0NzoGmxAxP43L5jvm7vPuQNMOZDdBdtNVmSXYS9taLSztzM4M0ejaVHHWzgzR6OKqYAmWu/TbCNTW3alLwPTbCNTWXRw5qyRgPhIGFo3u1CVgPhIGFo0urgqW4BaB95IQfOSwe7Vy+LaSaGvTlbJop60BjFQOOE15sAkR89O2pNJIndbI2dUdSDrwBR+yCqGS8EqbAAAAAElFTkSuQmCC"),
+        (5, 109) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaUlEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVXCEZK8hBQkFBHIminO5wnGun8RkV+KAC+/0yC6uwFTCfa1TtTfGuj9ssrMJWwLyqd/iR6CLsAZZj05sf7U/xZHAR9gCh3mFBolQoMmvr7p9neTJJZSOztu70DrP8SJijN2PRuLL3FVmeDHP0Ziwand6pLWF6NjJq69tJKJMsT4bp2ciorTu9IjtNWeEs7xuGu2uJvi4dvaHjTcVTlqe2yMcahoHEqTTtwSUEzON4gSRkeTJNvJEYXELAvKonyfEdFfiPCmQvQfbSNVVNZlMxI7OpOGw1S7zYMzwaXdzILDFo7xrR6HhNZiGruuRfZNTW3duTDJPTkVFbdzw0myDDhLYZi0b39iTDPFzMWDQ6XpNZyD0aPltC5qMKu6NVhX/WEn1dutIW/cQahoHagUrTHlxCwLwaS2oN4o324BIC5lUemgOjAskKPAEtVCeBpuxpcQAAAABJRU5ErkJggg=="),
+        (5, 190) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBh6Pz1XapaOIeK1Zz6+3Vdqlo4i46nv//lilXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8APtkKem0V5A8AAAAAElFTkSuQmCC"),
+        (5, 55) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYGfh9/s7RKWxH2XHO93f5naZW2Iuyqn2Kk4h08cl6kPdByPPTiS4CLtAcK/RQnFe9AkDO/NIK1fZcxQZLZCNb2nV823gHLl17A0RtYtK48e5WAOXoDi1bnl413xtYLqNkI1Pa306EYAqZmI1Dbd37ZeCXsNGVf8E3g7kqir6ajNlQWqTGjsvj8WAMYCZpMUx40IcJ2Y4lnrxI0442JQRMi7KpfNt419rBHBrrOQLYJ9vvPLK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8ARnAg0JXFv0OgAAAABJRU5ErkJggg=="),
+        (5, 136) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBs6vt1XapaOIeK1ZH4/PVdqlo4i46nv//lilXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/dKQp6QHJx0AAAAAASUVORK5CYII="),
+        (5, 217) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAqfT/yyt0lZEPLdS9Wwq7/fyN0urtBURN/0OHpku0h5oOR6686HnU3kCXKQ9UOh3IMiUCkWwtu++eTZPkFQ2grV953fA8iFjjt7AonXl2Vtl8wTM0RtYtDq/6i1jejYCtf2tJpQgmydgejYCtX3nV2ynKWuczXsFcHct0delozd0vKnxlM1TW+THGsBI5lSa9uASIuJ4vJAkZfMEzXhjYnAJEXHTT5bjf1TgOyqQvQT7+WeWVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AFQsMsUYcBDP4AAAAASUVORK5CYII="),
+        (5, 10) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABbElEQVR4Ae2W0W3DMAxE/d1xukYn8E7eoat4i47iT/eeYRoF2INqNkCgQEEuEgQRfKGos6fxGRX4QwXevz5maZW2U8znVqj2luL2z7dZWqXtFPNmvoNHSRdpN1qOTb/8aH8pToCLtBvZfAeCklIhBxvr6Z9X4wRJZR1srKd8Byw/SszRB5gbV/b+VDVOwBx9gLkx5btyKzE960BjfbsCzkk1TsD0rAON9ZTvTDtN1cTVuEcAd9cSfV06ekPHW7Knapzaom5rACMlp9K0B5cQMff2QpBUjRM09oZjcAkR82Y+pRzfUYHXqEBXl0ewJVvTTf+/Pd09b8FiZ/HO4MZkN4LFluLZ78YUd5cv7RcwfutAYz29PQkY33SgsZ7iEsDdBQHzkAgwN6a3JwFj9gHmxhR3ly/t7xH4agnBuwqno1WFn9YSfV06ekSV7cfWAEaCptK0B5cQMW/akloDe6M9uISIeTOOnEOjAsUKfAPOSQqhMUTITwAAAABJRU5ErkJggg=="),
+        (5, 91) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WwQ3CMAxFe2Yc1mCC7tQdWKVbMEqP5b8qrioZK8VCQKQg/caK4vrhOG6G/usZOJGB9X4ZpVlairDHmuv1cRulWVqKsKt+ipGKt/HIeZLWQNO26MVDgJO0Bgr9FCcVb0OQM/80grV5lzFBktkI1uadXzbeBstDL2DrDSwaZ9YeJWC23sCi0fll4+2x9QJqNgK1+WV3KIaAqdkI1OadXzZeCTsM2Rf8Eri5kmjr0FEbKotUm1FZfL+tAYwETaYpDw4hwnZtibVHCZr2RsfgECLsql823jF2t3sGms5AU4dHsL9rT+9us2BpS/btj0bXpkpbsrtGNDq/d/ncegHTNyNQm//8rcuRnJwQMM3ewKLx87euk3xuWYvAe0kIPsrwX5VEW4eOGlFm22lrACNBk2nKg0OIsKttqbQ3bnbc8BB21Y+YXT0DyQw8AdvrJ4Glb4fjAAAAAElFTkSuQmCC"),
+        (5, 172) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9k4HL5n6VV2oqI55b19/Y3S6u0FRE3ffv1Z5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHaoKKekZWd59AAAAAElFTkSuQmCC"),
+        (5, 37) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOElEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80ntRjJBSiwoCwlIqHbEirDwdtpuu/ZoDfzjw/Lx6aZSmLOJ+K3V+P3pplKYs4tPyEo8AB2l2NKSXfjwEOEizo+p5CUGQOOvB2n7hmCBx1oO1/Wp5CZaHgPn0BuatI++uJWA+vYF5a7W85WwBU7MeqO1PS0IOBEzNeqC2Xy0vH9t1EYHDlUSspqM2VBZxxhrASNA4TXnQhIi4GEu8u5aaj/HGxKAJEfFpeeuzW9wcCO3A1U13yCzBXjrWjsIyzuzO4K3FmMrjzO4M3lrkHYIlWe4ybz1Q269/6+LwPRIwfxIG5q31b117YMmJCLyUhOA9h29VErGaLpdFnLEGMFI54DTlQRMi4s2xlMcbNzRuaoh4M48zm5oDOx34AoqRJ4Et4SHsAAAAAElFTkSuQmCC"),
+        (5, 118) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJUlEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lnuVEyGCVdQUi0hBusaKcvh0cSwP/dcd+MKB9X4ZhVlYDMTjHlVnQ3mbHiWdhNXBtB368NH5UN4mQUlxyBOb9guno3mbWD5KzNUnYd46c/YV0bycW4mpWU9o2l8ywYJonqUdhujER/O9Cm6uJNp6dFitawptT0fzoTVDf4LTlAePEBAX7SwTLIjmWdq+dAfad+D6uI3CLCwG4p89uirHJHASVgenT2u1YnHWE5v2C6etnaVZw1sLXpVYyHKVq0/CvPW0aY2cVZBgatYTmvZPm9aqxEJuUXAuCYlPjr6vf1USbT06K4t22hqCgcoBpykPHiEg3m1L1t6Y7JjwAPEuj5wd3YGDDjwBmDNEYTrbikcAAAAASUVORK5CYII="),
+        (5, 199) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HBjHZy9N0hxF3G+lLq9bL03SHEV8Wl7gEeAgLY6GsOjHT4CDtDgqnhcQBImzHqzNZ44JEmc9WJsvlhdg+QmYozcwb5xYu5aAOXoD88ZieWlvAVOzHqjNzykhBgKmZj1Qmy+WF7ftuhqBqyuJui4dtaGyqKetAYwEjdOUB5cQEWdtibVr6fLR3ugYXEJEfFreeu8WNweqduD+fvTSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBD2ZSRsmDKXJ6AAAAAElFTkSuQmCC"),
+        (5, 64) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Pv/Z5V26SgiXlvW2+13lXbpKCJu+s6/r1XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHdHhKen9VwCiAAAAAElFTkSuQmCC"),
+        (5, 145) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjAev4bpVlakrDHmuvxeBqlWVqSsKt+ihGKt/HIeZJWR9O26M5HgJO0OnL9FCcUb0OQM//Ug7X5ImOCJLMerM0XftF4GywfbcDRG5g3zqzdS8AcvYF5Y+EXjZdjawNq1gO1+SU7JEPA1KwHavOFXzReCjsM0Q2+CdxcSbR16agNlUWozagsPt/WAEaCJtOUB5cQYRdtibV7CZr2RsfgEiLsql803j52t3sGms7A/+UwSrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANX34NGyRh3fyQAAAAASUVORK5CYII="),
+        (5, 226) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQGTqf/UZqlpYj9WHPV2ZTfev4ZpVlaithX4208CjpJa6BpO/TgofMpPwFO0hoojLchKCgZimDN7n551k+QZDaCNbuLt8HyUGCu3sCidebsrbJ+AubqDSxaXbw9tgJTsxGo2ZfdoWyyfgKmZiNQs7t4JewwZANn/d4B3FxJtNV01IauNzWesn4qi/xYAxgpOJmmPGhCxD4eLzhJWT9BM96YGDQhYl+Np5D92zPwHRn4vfyN0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq6tokkxhI6zOQAAAABJRU5ErkJggg=="),
+        (5, 19) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAr+Xv1lapa2IeG6l6tlU3un0P0urtBURN/0OHpku0h5oOR6686HnU3kCXKQ9UOh3IMiUCkWwtu++eTZPkFQ2grV953fA8iFjjt7AonXl2Vtl8wTM0RtYtDq/6i1jejYCtf2tJpQgmydgejYCtX3nV2ynKWuczXsFcHct0delozd0vKnxlM1TW+THGsBI5lSa9uASIuJ4vJAkZfMEzXhjYnAJEXHTT5bjf1TgOyqQvTz7+WeWVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYErjtkNCRv5odwAAAAASUVORK5CYII="),
+        (5, 100) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBs6vt1XapaOIeK1Z378/VmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/nHsp6e6aDF4AAAAASUVORK5CYII="),
+        (5, 181) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0Hbrf/WVqlrYh4rqX+Pv5maZW2IuJqnmqk6h08Sl6kPdByXPTiS4CLtAcK81QnVe9AUDK/NIK1feeYIHE2grV9l5etd8DypRvw6A0sWleuvUrAPHoDi1aXl6131tYN6NkI1Pa3M6EEAqZnI1Dbd3nZeqXsNGVv8E3g7lqir0NHb6gtUmNGbfH5sQYwEjRO0x4cQkTsxhLXXiVoxhsTg0OIiKt52XrX2iMeDnTtQPbw7PefWVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeAJqmixRdUaksgAAAABJRU5ErkJggg=="),
+        (5, 46) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwPf/zyyt0lbEfK5Z97+vWVqlrYh51Xe5/M7SKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwBSyEp6fpEHucAAAAASUVORK5CYII="),
+        (5, 127) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA/vf1yyswlZAPNeoejfFu1x+Z2EVtgLiqt7hR6KLsAdYjpcePPR+iieDi7AHCPUOCxIlQ5FZ23e/PMuTSTIbmbV9p3eY5SFhjt6MRevKu7fI8mSYozdj0er0Tm0JU7ORUdvfTkIJsjwZpmYjo7bv9IrsNGWFs7xXGO6uJPpqOmpDx5saT1meyiI/1jAMJE6mKQ+aEBDH4wWSkOXJNOONiUETAuKqniTHd2TgMzLw/f8zC6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcAVjDRsm3vyXrAAAAAElFTkSuQmCC"),
+        (5, 208) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcycLv9ztIqbUXYc811//uapVXairCrfoqRinfwyHmR9kDL8dCTLwEu0h4o9FOcVLwDQc780gjW9l3GBElmI1jbd37ZeAcsX3oBR29g0bry7FUC5ugNLFqdXzbeGVsvoGYjUNvfTodiCJiajUBt3/ll45Ww05R9wSeBuyuJvpqO2lBZpMaMyuL9Yw1gJGgyTXnQhAjbjSWevUrQjDcmBk2IsKt+2XjX2MMeGeg6A9//P7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDibiSTFkEQWkAAAAAElFTkSuQmCC"),
+        (5, 73) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScc+Pz9GqVZWoqIx7PUx+N7lGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm279+RilWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBknEsUXa+sakAAAAASUVORK5CYII="),
+        (5, 154) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD8vPTSKE1JxP1e6v3+6KVRmpKIT8tbeAQ4SHOgYXnpy0OAgzQHKp63IAgSZyNY23eOCRJnI1jbL5a3wPIQMJ/ewKJ15N2tBMynN7BoLZa3ni1gajYCtf1pTUiBgKnZCNT2i+WlY7uuRuDqSqKupqM2VBb1jDWAkaBxmvKgCRGxG0u8u5Waj/HGxKAJEfFpeduzW9wcqNqB6+vWS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOANoBNJMUj3w1UAAAAASUVORK5CYII="),
+        (5, 235) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXzhwvd5mYRW2BOK5RNXeprxDj4ouwh5gOTZ9+Gh/U94hQUVxKBJreed0a94hlo8Kc/QmLFpX9r6iNS/XVmF6NhJq+S0TUtCal8pOU+vCZ+u9Cu6uJfoaOqzWMTW9ns7WQ2uG/gSnaQ+GEBC76ywTUtCal8qOZTjQvwP/j8ssrMKWQFwcuv3+NwursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeAJuMkuZBLgExgAAAABJRU5ErkJggg=="),
+        (5, 4) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae1WwQ2DMBDj3XG6RidgJ3boKmzRUXhSG+UiRHqi9UmnIqWSyTWKsTGXiKH/egJfJHB/PUZgBpYC1uMZFWtTeZsfiE7A6mDaFn24YH0qb7MAUSbkmbX5Juls3maWFwjz1Zsxb5y5do9sXtWGMHvWM2rzSyWUIptXZIchW1jV2xu+XEtca9Mxarym1ONJ1aPXCtyESbM9uAkJ1s1xVgmlyOYV2T70BK6fwPq8jcAMLAWsTzcd1kq8UGIQnYDVgfu1hvUSL2qWCXlmbb5JGmYlXsgsyRDmqzdj3th8rak8aoYAYfasZ9Tmm681lRcyS7IqrPKoGQKEa0ugtkSP41+1hLR58HASL5SukSEuHU8qz3RDI8SZGNuDm5Bg3RxnRxGVd7xP/98T+CGBN+BkCqGQL9MfAAAAAElFTkSuQmCC"),
+        (5, 85) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABQUlEQVR4Ae2W0QnDMAxE891xukYnyE7Zoatki46Sz/ResILBFS2yAzW4cLEwPnS5SKqn8RsO/ODA/rzNwipsCcTzN+r99ZiFVdgSiC/jHXokcBF2B8tx6MNDAhdhd9Ccd0iQSJz1xNp+4ZhE4qwn1vab8Q6xPCSYT2/CvHXlbA4J5tObMG9txjtzSzA16wm1/e0kpECCqVlPqO0346W009Sj4O5Koq+mozZUFv2MNQQDicZpyoMmBMTFWOJsDjUf442JQRMC4st4ee4RDwe6diDadFFelVlKGhprUV6tWMaZ3Rm8tRhTEhviVYmFrMTMW0+o7Re3riiPnFVQYv4kTJi3FreuKK9KLORo4iiPnFVQ4rMkFHsO/1VJhJpHLxfiVblrZCXvZ6xlonGM8qAJAXExzuy8rXrZEM/4Yx0OBBx4A+4GJ4FwgJ96AAAAAElFTkSuQmCC"),
+        (5, 166) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJHC93nphFKYE6v4d9fy49MIoTAnUP+MtfmRwEGYHw7LoxUMGB2F2cDhvsSCTJOuZtfksMZkkWc+szR/GW8zykGFevRnzxpG1W8gwr96MeeNhvFVbhulZz6jNTyshFTJMz3pGbf4wXpLtuhoNV9cSdW06ekNtUc+xhmEg0yRNe7AJAXV2LLF2C20+jjdODDYhoP4Zb6vd6pZA1QnM91MvjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4ArwlKenT2+C9AAAAAElFTkSuQmCC"),
+        (5, 31) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVElEQVR4Ae2W0Y2DMBBE+b5yro2rgJ7o4VqhiyuFT24eYhHSZkU0lpIgOdLgleXxjJf1hqH/egaeyMD3388ozMKyg3i8oq6/X6MwC8sO4kueNCy9zY/Ik7AWmLZFDx4yOAlrgZInHUtvsyAyJ63MxnzKmEyS2cpszCeeq7eZ5aENePVhrBpn1p4hw7z6MFaNiefqHdragJqtjMb8chD2QIap2cpozCeeq7fLDoO7wTsN364k7nXpqA2VhdVmVBavb2sYBjJNpikPLiEgTm2JtWfINO2NjsElBMSXPFfvrN3jnoFbZ8C9PC6vKVkStdqTy2s1S1uK//5qTG1KZi1ek1nIEqZvVkZjPn11uTw0myBhmn0Yq8b01eXymsxCdoVdHppNkPBREoqrDH9USViXR4ezeE3ZDbLE79PWTqbJGOXBJQTEqZ3F+hh1WIsX/D72DBgZ+AecrCeBUpQ3cgAAAABJRU5ErkJggg=="),
+        (5, 112) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsII6TUorpUValS9YgV5XQX45h07dcy8EYG5vulF0ZhWkHcH1G11uJdH7deGIVpBfGh3uJHooMwJxiWRS8eWm/xZHAQ5gSp3mJBomQoMxvzxc5dnkyS2cxszBd6i1keEubVh7FsHFm7h8uTYV59GMvGQm/TljA1mxmN+WkjrIHLk2FqNjMa84XeKtt1rrDL+4Th05XEuQ4dtaHXa7Unl6ey8NsahoHEyTTlwSEExHl7gSS4PJmmvdExOISA+FBPku3fMvAfGXAPj8uryppEv9rWas3SzuLOkI1Fu9EmLV6VWcgSpt9mRmO+uD25PDSrIGE+EmEsG4vbk8urMgvZFXZ5aFZBwltJKM4y/FMlYR0ebc7iVWU3yBI/T1vbmSZjlAeHEBAX7SzWx6jNWrzgt7FlwMjAE6pORGGI3mi2AAAAAElFTkSuQmCC"),
+        (5, 193) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s+9fbLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA3htRslNpuxJAAAAAElFTkSuQmCC"),
+        (5, 58) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EECr59vozALSwH1eEV9PN5HYRaWAupLnjQsvc2PyJOwJpi2Rd9cZHAS1gQpTzqW3mZBZJ40MxvzVWIySbKZ2ZiveK7eZpaLbsCrD2PZOLP2CBnm1YexbKx4rt6urRvQs5nRmF92QilkmJ7NjMZ8xXP1iuwwuDf4T8O3a4l7bTp6Q21hHTNqi78/1jAMZJqkaQ82IaCujiXWHiHTHG+cGGxCQH3Jc/WO2r3uCdw6gfXjZRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBL+P8KenEF+TNAAAAAElFTkSuQmCC"),
+        (5, 139) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++sj8fnLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA/GeRslWSjSqAAAAAElFTkSuQmCC"),
+        (5, 220) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96AjckcLl8j8IsLAXU4xlVay3e5+/XKMzCUkB9qrf5kegkrAmmbdGVi9ZbPBmchDVBqrdZkCgJZWZjvrpzlyeTJJuZjflKbzPLRcI8+jCWjTNr/8PlyTCPPoxlY6W3a0uYns2MxvyyE0rh8mSYns2MxnylV2SHwRV2eY8w/HIt8Vqbjt7Q47WOJ5entvCPNQwDiZM07cEmBNT58QJJcHkyzfHGicEmBNSnepLs357AeySw/nyMwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHv71JMTBr1rAAAAAASUVORK5CYII="),
+        (5, 13) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVXCEFq+jCB0VBXGNFOd3FcdwO/dcz8EEGro/bKMzCUkA8HlG11uKt98sozMJSQHyot/mR6CSsCaZt0ZuH1ls8GZyENUGqt1mQKBnKzMZ8tXOXJ5NkNjMb85XeZpaHhDn6MJaNM2tf4fJkmKMPY9lY6e3aEqZmM6Mxv+yEErg8GaZmM6MxX+kV2WFwhV3eNwyfriTOdemoDR2v1Z5cnsrCb2sYBhIn05QHlxAQ5+0FkuDyZJr2RsfgEgLiQz1J9n/PwH9kwL0ELq8paxK12ozLazVLe4l3eDZW7UZmLV6TWcgSpv9lRmO++npyeWg2QcI07TCWjdXXk8trMgvZFXZ5aDZBwntJKM4y/FMlYV0ebc7iNWU3yBI/T1t7MU3GKA8uISCu2lmsj1GbtXjB72PPgJGBJ0tSJ4HXF1ReAAAAAElFTkSuQmCC"),
+        (5, 94) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0Q2DMAxE+e44XaMTsBM7dBW26Ch80nsII6TUojqqtpFS6YgV5bjDcdx07dcy8EYG5vulF0ZhWkHcH1Gvj1svjMK0gviQJw1Lb/Ej8iDMCYZl0YuHDA7CnCDlScfSWyyIzJdmZmO+yJhMktnMbMwXPFdvMctDL2Drw1g2jqzdQ4bZ+jCWjQXP1du09QJqNjMa89NGWAMZpmYzozFf8Fy9Vbbr3Bf80nB1JVHXoaM2VBZWm1FZfL+tYRjINJmmPDiEgLhoS6zdQ6Zpb3QMDiEgPuS5envtFrcMVJ0B9xC4vFPJkqjV1lzeWbO0s7gzZGPRpmTW4p0yC1nC9NvMaMx//taFuAMZ5k8ijGXj529djlk4NRreSkLmswz/VUlYh0cfZ/HY1dOQeD1tLb5WpskY5cEhBMRFO4v1Mbq84LexZcDIwBNY9ERhSD4AsAAAAABJRU5ErkJggg=="),
+        (5, 175) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s798fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwAycTRsney4ioAAAAAElFTkSuQmCC"),
+        (5, 40) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae2W0Q3CMAxE+804rMEE3ak7sEq3YJR+lntVHEUKFjQKCEtBOmJFMXm62qbT+AwHPnDg+rjN0iptScTzu9T9fpmlVdqSiL+Wd/AIcJF2R8tx6MWXABdpd9Q970AQJM56sLZfOSZInPVgbb9b3gHLl4B59AbmrStnSwmYR29g3totL98tYGrWA7X9LSekQMDUrAdq+93y0rXTFBE4XEnEajpqQ2URZ6wBjASN05QHTYiIq7HE2VJqPsYbE4MmRMRfyyvvHvFwILQDoZpHsL9/62p9vIJlLNl/v7dWY6o1r5Uz5+li5qYHavv937oywclAwAx7A/PW/m9dJznz8YjAuSQE7zn8VyURq+moDTkbZ6wBjASN05QHTYiIq3HG2VKteeVvjHg4cNKBJweaRGH0lxcdAAAAAElFTkSuQmCC"),
+        (5, 121) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABB0lEQVR4Ae2WUQrDIBBE/e4Nc6fcoVfJrfKZzhMVwS5tNSwVLEyU4GSGcd0a1m8l8EUC1/OxCYdwJjDfPlG11pUX/Uh0Fy4De1z05qH1rrxoQaIkZJnN75ukvXnRLA8Js/XZmDUerK3hzSvaEqZmLaP5/VkIaeLNS7IheAv36tWGpyuJuQ4dUWubXNtTrx5eC/QRkqY8OISAedPOCiFNvHlJdg0rgfkTmOrwyKxrWxvaXpmlneU7gzU27a2XN2QWsoTpt5bR/P622xqaQ5Bh/iSyMWu87bY2ZBbyjIZLSci8lfBflcRchy6VxTxtDcNA5UDSlAeHEDBv2hlra/Ty6m+s+UrgxwReFTxhQbdthGcAAAAASUVORK5CYII="),
+        (5, 202) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLElEQVR4Ae2WQQrCMBBFu/aGvVNx4wG8Sm/VZf2vZEIgDtqQigMRvhlCxjx+Z8ZO4zMc+MKB+/0xS6u0JRHPn1L3522WVmlLIr4s7+AR4CLtjpbj0JsvAS7S7qh73oEgSJz1YG2/ckyQOOvB2n63vAOWLwHz6A3MW1fOlhIwj97AvLVbXr5bwNSsB2r7W05IgYCpWQ/U9rvlpWunKSJwuJKI1XTUhsoizlgDGAkapykPmhARV2OJs6XUfIw3JgZNiIgvyyvvHvFwILQDoZpHsL9/62p9vIJlLNl/v7dWY6o1r5Uz5+li5qYHavv937oywclAwAx7A/PW/m9dJznz8YjAuSQE7zn8VyURq+moDTkbZ6wBjASN05QHTYiIq3HG2VKteeVvjHg4cNKBF+NMY6kHrIxNAAAAAElFTkSuQmCC"),
+        (5, 67) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6zPh6fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA07qRskWVnk5AAAAAElFTkSuQmCC"),
+        (5, 148) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABSElEQVR4Ae2WUQqDMBBE/e4NvZP0pwfoVbyVn3aeuCKki2WUtoEUxiwh44ybzTZd+7UMfJCB+XnrhVGYVhD3R9T7/dELozCtID7kScPSW/yIPAhzgmFZ9OYhg4MwJ0h50rH0Fgsi86WZ2ZgvMiaTZDYzG/MFz9VbzPLQC9j6MJaNI2v3kGG2PoxlY8Fz9TZtvYCazYzG/LQR1kCGqdnMaMwXPFdvle069wW/NFxdSdR16KgNlYXVZlQW329rGAYyTaYpDw4hIC7aEmv3kGnaGx2DQwiID3mu3l67xS0DVWfAPQQu71SyJGq1NZd31iztLO4M2Vi0KZm1eKfMQpYw/TYzGvPX37oQdyDD/EmEsWy8/tblmIVTo+GtJGQ+y/BflYR1ePRxFo9dPQ2J19PW4mtlmoxRHhxCQFy0s1gfo8sLfhtbBowMvABcjGOpZZO+LwAAAABJRU5ErkJggg=="),
+        (5, 229) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUQ6DMAxD+d4NuRPazw6wq3ArPpkfahBSFzG5+xhTp5lGVS27aRoY+q9n4IMM3O+PUZiFpYB4PKNqrcVbn7dRmIWlgPhUb/Mj0UlYE0zbojcPrbd4MjgJa4JUb7MgUTKUmY35aucuTybJbGY25iu9zSwPCXP0YSwbZ9Ye4fJkmKMPY9lY6e3aEqZmM6Mxv+yEErg8GaZmM6MxX+kV2WFwhV3eNwxfriSudemoDR2v1Z5cnsrCb2sYBhIn05QHlxAQ5+0FkuDyZJr2RsfgEgLiUz1J9n/PwH9kwL0ELq8paxK12ozLazVLe4l3eDZW7UZmLV6TWcgSpv9lRmO++npyeWg2QcI07TCWjdXXk8trMgvZFXZ5aDZBwntJKM4y/FMlYV0ebc7iNWU3yBK/Tls7mCZjlAeXEBBX7SzWx6jNWrzg97FnwMjACyqrZhGgtqSpAAAAAElFTkSuQmCC"),
+        (5, 22) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96Ajck8Pn7NQqzsBRQj2dUrbV4l8v3KMzCUkB9qrf5kegkrAmmbdGVi9ZbPBmchDVBqrdZkCgJZWZjvrpzlyeTJJuZjflKbzPLRcI8+jCWjTNr/8PlyTCPPoxlY6W3a0uYns2MxvyyE0rh8mSYns2MxnylV2SHwRV2eY8w/HIt8Vqbjt7Q47WOJ5entvCPNQwDiZM07cEmBNT58QJJcHkyzfHGicEmBNSnepLs357AeySw/nyMwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHC+Ip6dHNMJQAAAAASUVORK5CYII="),
+        (5, 103) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++s798fs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwAxmERsl1t1FdAAAAAElFTkSuQmCC"),
+        (5, 184) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EECj8f7KMzCUkA9XlFfP99GYRaWAupLnjQsvc2PyJOwJpi2Rd9cZHAS1gQpTzqW3mZBZJ40MxvzVWIySbKZ2ZiveK7eZpaLbsCrD2PZOLP2CBnm1YexbKx4rt6urRvQs5nRmF92QilkmJ7NjMZ8xXP1iuwwuDf4T8O3a4l7bTp6Q21hHTNqi78/1jAMZJqkaQ82IaCujiXWHiHTHG+cGGxCQH3Jc/WO2r3uCdw6gfXjZRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBL+eUSTHWMQoFAAAAAElFTkSuQmCC"),
+        (5, 49) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6z7l9vs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA8gbRsneHfIiAAAAAElFTkSuQmCC"),
+        (5, 130) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUQqDMBBE/e4NvZP40wP0Kt7KTztPXBHSxTIppZaUjllChpmsmzVd+7UMvJGB5XHrhUmYNxD3Z1SttXjjeO+FSZg3EJ/qrX4kOghLgmFd9OKh9RZPBgdhSZDqrRYkSoYyszFf7NzlySSZzczGfKG3muUhYV59GMvGibVHuDwZ5tWHsWws9HZtCVOzmdGYn3fCFrg8GaZmM6MxX+htsl3nCru8Txi+XElc69BRG3q9VntyeSoLv61hGEicTFMeHEJAnLcXSILLk2naGx2DQwiIT/Uk2f4tA/+RAffwuLyqrEn0q22t1iztLO4M2Vi0G23S4lWZhSxh+m1mNOaL25PLQ7MKEuYjEcaysbg9ubwqs5BdYZeHZhUkvJeE4izDP1US1uHR5ixeVXaDLPHrtLWDaTJGeXAIAXHRzmJ9jNqsxQt+G1sGjAw8AdW9Y6kMHbweAAAAAElFTkSuQmCC"),
+        (5, 211) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUY6DMAxE+d4bcifUnz3AXoVb8cnOQxghuRbVRGqLlEpDrCiTmRjHZei/noEXMvB4/I7CLCw7iMcr6vr3MwqzsOwgvuRJw9Lb/Ig8CWuBaVv05CGDk7AWKHnSsfQ2CyJz0spszKeMySSZrczGfOK5eptZHtqAVx/GqnFm7RkyzKsPY9WYeK7eoa0NqNnKaMwvB2EPZJiarYzGfOK5ervsMLgbfNLw7UriXpeO2lBZWG1GZfH+toZhINNkmvLgEgLi1JZYe4ZM097oGFxCQHzJc/XO2j3uGbh1BtzL4/KakiVRqz25vFaztKX476/G1KZk1uI1mYUsYfpmZTTm01eXy0OzCRKm2YexakxfXS6vySxkV9jlodkECR8lobjK8FeVhHV5dDiL15TdIEv8Pm3tZJqMUR5cQkCc2lmsj1GHtXjB72PPgJGBf6PcZhE8MPaZAAAAAElFTkSuQmCC"),
+        (5, 76) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJHB+XHphFKYE6v4d9Xq99cIoTAnUP+MtfmRwEGYHw7LoxUMGB2F2cDhvsSCTJOuZtfksMZkkWc+szR/GW8zykGFevRnzxpG1W8gwr96MeeNhvFVbhulZz6jNTyshFTJMz3pGbf4wXpLtuhoNV9cSdW06ekNtUc+xhmEg0yRNe7AJAXV2LLF2C20+jjdODDYhoP4Zb6vd6pZA1QnM91MvjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4Ag96STFRaT0rAAAAAElFTkSuQmCC"),
+        (5, 157) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPklEQVR4Ae2W0QnDMAxE890Ns1PITwfoKtkqn+m9YAWDK1pkB2pw4WJhfOhykVRP4zcc+MGB4/WYhU3YE4jnb9R1fc7CJuwJxLfxTj0SuAiHg+U89OEhgYtwOGjOOyVIJM56Ym2/cEwicdYTa/vNeKdYHhLMpzdh3rpxNocE8+lNmLc24125JZia9YTa/n4RUiDB1Kwn1Pab8VLaaepRcHcl0VfTURsqi37GGoKBROM05UETAuJiLHE2h5qP8cbEoAkB8W28PPeIhwNdOxBtuiivyiwlDY21KK9WLOPM7gzeWowpiQ3xqsRCVmLmrSfU9otbV5RHziooMX8SJsxbi1tXlFclFnI0cZRHzioo8VUSij2H/6okQs2jlwvxqtw1spL3M9Yy0ThGedCEgLgYZ3beVr1siGf8sQ4HAg68AR0cZhEFhA88AAAAAElFTkSuQmCC"),
+        (5, 238) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLElEQVR4Ae1WQQ6DMAzjvB/yJ8RlD9hX+BVHZqOmQnQRmyNFQ+ok06yqsTFpxdB/PYEvEpjn5wgswFrAeryiYm0qb/cD0QnYHEz7og8XrE/l7RYgyoQ8szbfJJ3N283yAmG+ejPmjQvXHpHNq9oQZs96Rm1+rYRSZPOK7DBkC6t6R8O3a4l7bTpGjdeUejypevRagZswabYHNyHBujnOKqEU2bwi24eewP0T2F6PEViAtYD15abDWokXSgyiE7A5cL/WsF7iRc0yIc+szTdJw6zEC5klGcJ89WbMG5uvNZVHzRAgzJ71jNp887Wm8kJmSVaFVR41Q4BwbQnUluh5/KuWkDYPHk7ihdI1MsSl40nlmW5ohDgTY3twExKsm+PsLKLyzvfp/3sCPyTwBussaHmAmMxiAAAAAElFTkSuQmCC"),
+        (5, 7) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXzjw/7jMwipsCcRziaq9TXmHHhVdhD3Acmz68NH+prxDgoriUCTW8s7p1rxDLB8V5uhNWLSu7H1Fa16urcL0bCTU8lsmpKA1L5WdptaFz9Z7FdxdS/Q1dFitY2p6PZ2th9YM/QlO0x4MISB211kmpKA1L5Udy3Cgfweu19ssrMKWQFwcuv3+NwursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeAJieg0JC9TOpQAAAABJRU5ErkJggg=="),
+        (5, 88) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD8vPTSKE1JxP1e6vV166VRmpKIT8tbeAQ4SHOgYXnpy0OAgzQHKp63IAgSZyNY23eOCRJnI1jbL5a3wPIQMJ/ewKJ15N2tBMynN7BoLZa3ni1gajYCtf1pTUiBgKnZCNT2i+WlY7uuRuDqSqKupqM2VBb1jDWAkaBxmvKgCRGxG0u8u5Waj/HGxKAJEfFpeduzW9wcqNqB+/3RS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOANcBwp6bYfhnoAAAAASUVORK5CYII="),
+        (5, 169) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScceDy+R2mWliLi8Sz18/drlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm279+RilWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBPjssUQ2QO/sAAAAASUVORK5CYII="),
+        (5, 34) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcy8P3/M0urtBVhzzXX/e9rllZpK8Ku+ilGKt7BI+dF2gMtx0NPvgS4SHug0E9xUvEOBDnzSyNY23cZEySZjWBt3/ll4x2wfOkFHL2BRevKs1cJmKM3sGh1ftl4Z2y9gJqNQG1/Ox2KIWBqNgK1feeXjVfCTlP2BZ8E7q4k+mo6akNlkRozKov3jzWAkaDJNOVBEyJsN5Z49ipBM96YGDQhwq76ZeNdYw97ZKDrDNxuv7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDh7CKekp50RDAAAAAElFTkSuQmCC"),
+        (5, 115) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA/vf1yyswlZAPNeoejfF+/7/mYVV2AqIq3qHH4kuwh5gOV568ND7KZ4MLsIeINQ7LEiUDEVmbd/98ixPJslsZNb2nd5hloeEOXozFq0r794iy5Nhjt6MRavTO7UlTM1GRm1/OwklyPJkmJqNjNq+0yuy05QVzvJeYbi7kuir6agNHW9qPGV5Kov8WMMwkDiZpjxoQkAcjxdIQpYn04w3JgZNCIirepIc35GBz8jA5fI7C6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcASxkRsn/TRe1AAAAAElFTkSuQmCC"),
+        (5, 196) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwOXyO0urtBUxn2vW/e9rllZpK2Je9X3//8zSKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwB+nRJMaVuLGcAAAAASUVORK5CYII="),
+        (5, 61) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0Hfh9/s7RKWxHxXEu93f5naZW2IuJqnmqk6h08Sl6kPdByXPTiS4CLtAcK81QnVe9AUDK/NIK1feeYIHE2grV9l5etd8DypRvw6A0sWleuvUrAPHoDi1aXl6131tYN6NkI1Pa3M6EEAqZnI1Dbd3nZeqXsNGVv8E3g7lqir0NHb6gtUmNGbfH5sQYwEjRO0x4cQkTsxhLXXiVoxhsTg0OIiKt52XrX2iMeDnTtQPbw7PefWVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeAJmEixRSaBTSwAAAABJRU5ErkJggg=="),
+        (5, 142) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBs6vt1XapaOIeK1ZH4/PVdqlo4i46nv//lilXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/c7RJMa5eo8IAAAAASUVORK5CYII="),
+        (5, 223) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAqfT/yyt0lZEPLdS9Wwq7/fyN0urtBURN/0OHpku0h5oOR6686HnU3kCXKQ9UOh3IMiUCkWwtu++eTZPkFQ2grV953fA8iFjjt7AonXl2Vtl8wTM0RtYtDq/6i1jejYCtf2tJpQgmydgejYCtX3nV2ynKWuczXsFcHct0delozd0vKnxlM1TW+THGsBI5lSa9uASIuJ4vJAkZfMEzXhjYnAJEXHTT5bjf1TgOyqQvTz7+WeWVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYErQdNLmUBM/UkAAAAASUVORK5CYII="),
+        (5, 16) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQGfi9/ozRLSxH7seaqsym/9fwzSrO0FLGvxtt4FHSS1kDTdujBQ+dTfgKcpDVQGG9DUFAyFMGa3f3yrJ8gyWwEa3YXb4PlocBcvYFF68zZW2X9BMzVG1i0unh7bAWmZiNQsy+7Q9lk/QRMzUagZnfxSthhyAbO+r0DuLmSaKvpqA1db2o8Zf1UFvmxBjBScDJNedCEiH08XnCSsn6CZrwxMWhCxL4aTyH7t2fgOzJwOv2P0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq7NWSnpnSv3PQAAAABJRU5ErkJggg=="),
+        (5, 97) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjAev4bpVlakrDHmuv/5TBKs7QkYVf9FCMUb+OR8yStjqZt0Z2PACdpdeT6KU4o3oYgZ/6pB2vzRcYESWY9WJsv/KLxNlg+2oCjNzBvnFm7l4A5egPzxsIvGi/H1gbUrAdq80t2SIaAqVkP1OYLv2i8FHYYoht8E7i5kmjr0lEbKotQm1FZfL6tAYwETaYpDy4hwi7aEmv3EjTtjY7BJUTYVb9ovH3sbvcMNJ2B4/E0SrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANX2vtGyS7c0BMAAAAASUVORK5CYII="),
+        (5, 178) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Hb7XaVdOoqI15b1+/9nlXbpKCJu+s6/r1XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHakaSTGcUwlNAAAAAElFTkSuQmCC"),
+        (5, 43) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HLi/H700SXMUcb+VurxuvTRJcxTxaXmBR4CDtDgawqIfPwEO0uKoeF5AECTOerA2nzkmSJz1YG2+WF6A5Sdgjt7AvHFi7VoC5ugNzBuL5aW9BUzNeqA2P6eEGAiYmvVAbb5YXty262oErq4k6rp01IbKop62BjASNE5THlxCRJy1JdaupctHe6NjcAkR8Wl5671b3Byo2oFxfPbSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBD4mhRski37xtAAAAAElFTkSuQmCC"),
+        (5, 124) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABIUlEQVR4Ae2W0QnDMAxE890Ns1PoTwfoKtkqn+m9IJtQV6TEqajBhYuF8VXHWRYa+q878IUD6/M2CrOwGIjHI6rOhvI2PUo6CauDaTv04aPzobxNgpLikCc27RdOR/M2sXyUmKtPwrx15uwe0bycW4mpWU9o2l8ywYJonqUdhujEZ/PtBTdXEm09OqzWNYW2p7P50JqhP8FpyoNHCIiLdpYJFkTzLG1fugPtO3C/P0ZhFhYD8c8eXZVjEjgJq4PLp7VasTjriU37hdPWztKs4a0Fr0osZLnK1Sdh3nrZtEbOKkgwNesJTfuXTWtVYiG3KDiXhMQnR9/XvyqJth6dlUU7bQ3BQOWA05QHjxAQH7Yla29Mdkx4gPiQR86O7sBJB16XQ2OpysP/sgAAAABJRU5ErkJggg=="),
+        (5, 205) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABNElEQVR4Ae2WQQqDMBBFXfeG3knc9AC9irdyaf8LGRHSwaJRHEjhmyE45PGdmaZrv+bAHw6M47uXJmnOIu73UpfPq5cmac4iviwv8QhwkBZHQ3rpx0OAg7Q4qp6XEASJsx6s7ReOCRJnPVjbr5aXYHkImE9vYN468e5WAubTG5i3VstbzxYwNeuB2v68JuRAwNSsB2r71fLysV0XEThcScRqOmpDZRFnrAGMBI3TlAdNiIiLscS7W6n5GG9MDJoQEV+Wtz27xc2B0A7c3XSnzBLsrWPtLCzjzO4M3lqMqTzO7M7grUXeKViS5S7z1gO1/fq3Lg4/IgHzJ2Fg3lr/1nUElpyIwGtJCN5z+FElEavpclnEGWsAI5UDTlMeNCEi3h1LebxxQ+Omhoh38zizqTlw0IEvZWJmEWUiRNIAAAAASUVORK5CYII="),
+        (5, 70) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9k4Pf2N0urtBURzy3r5fI/S6u0FRE3ffv1Z5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHdDxSTE5Amc8AAAAAElFTkSuQmCC"),
+        (5, 151) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABTElEQVR4Ae2WUQqDMAyGfd4NvZPsZQfYVbyVj+7/pBEhC3VhzBU6+G0ojfmWprFD//UMnMjA+ryN0iwtRdhjzfV+f4zSLC1F2FU/xUjF23jkPElroGlb9OYhwElaA4V+ipOKtyHImX8awdq8y5ggyWwEa/POLxtvg+WhF7D1BhaNM2uPEjBbb2DR6Pyy8fbYegE1G4Ha/LI7FEPA1GwEavPOLxuvhB2G7AuuBG6uJNo6dNSGyiLVZlQWv29rACNBk2nKg0OIsF1bYu1Rgqa90TE4hAi76peNd4zd7Z6BpjPQ1OER7HXt6dNtFixtyb790ejaVGlLdteIRuf3KZ9bL2D6ZgRq89+/dTmSkxMCptkbWDR+/9Z1ks8taxF4LwnBRxn+q5Jo69BRI8psO20NYCRoMk15cAgRdrUtlfbGzY4bHsKu+hGzq2cgmYEX3pNmEW9oA9EAAAAASUVORK5CYII="),
+        (5, 232) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2WUWrDMBBE/d0b+k4mPz1Ar+Jb+dOdZ7ymsB1UbwNBQSETCaFlX1arsafxGRX4QwUej89ZWqXtFPO5Faq9pbj962OWVmk7xbyZ7+BR0kXajZZj0y8/2l+KE+Ai7UY234GgpFTIwcZ6+ufVOEFSWQcb6ynfAcuPEnP0AebGlb0/VY0TMEcfYG5M+a7cSkzPOtBY366Ac1KNEzA960BjPeU7005TNXE17hnA3bVEX5eO3tDxluypGqe2qNsawEjJqTTtwSVEzL29ECRV4wSNveEYXELEvJlPKcd3VOA9KtDV5RFsydZ00/9vT3fPW7DYWbwzuDHZjWCxpXj2uzHF3eVL+wWM3zrQWE9vTwLGNx1orKe4BHB3QcA8JALMjentScCYfYC5McXd5Uv7ewS+WkLwrsLpaFXhl7VEX5eOHlFl+7E1gJGgqTTtwSVEzJu2pNbA3mgPLiFi3owj59CoQLEC36yyaHnDZC8YAAAAAElFTkSuQmCC"),
+        (5, 25) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAr+Xv1lapa2IeG6l6tlU3un0P0urtBURN/0OHpku0h5oOR6686HnU3kCXKQ9UOh3IMiUCkWwtu++eTZPkFQ2grV953fA8iFjjt7AonXl2Vtl8wTM0RtYtDq/6i1jejYCtf2tJpQgmydgejYCtX3nV2ynKWuczXsFcHct0delozd0vKnxlM1TW+THGsBI5lSa9uASIuJ4vJAkZfMEzXhjYnAJEXHTT5bjf1TgOyqQvQT7+WeWVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AFjeksUbLVbUwAAAAASUVORK5CYII="),
+        (5, 106) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBs6vt1XapaOIeK1Z378/VmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/m4tJMejvuHwAAAAASUVORK5CYII="),
+        (5, 187) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYGbrf/WVqlrQh7rrn+Pv5maZW2Iuyqn2Kk4h08cl6kPdByPPTiS4CLtAcK/RQnFe9AkDO/NIK1fZcxQZLZCNb2nV823gHLl17A0RtYtK48e5WAOXoDi1bnl413xtYLqNkI1Pa306EYAqZmI1Dbd37ZeCXsNGVf8E3g7kqir6ajNlQWqTGjsvj8WAMYCZpMUx40IcJ2Y4lnrxI0442JQRMi7KpfNt419rBHBrrOQLYJ9vvPLK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8ARpqkuZUrFk2gAAAABJRU5ErkJggg=="),
+        (5, 52) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBt6/P1Zpl44i4rVmPb/eVmmXjiLiqu/x+FylXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8AEoxSTEOYKNFAAAAAElFTkSuQmCC"),
+        (5, 133) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABZUlEQVR4Ae2WUQrCMBBE++0Ne6fSHw/gVXqrftZ5JVuEdYlsBIlEHBNChhk3m2mn8RkV+KACx+M2C5uwFzCfa1TtTfHW9T4Lm7AXMK/qnX4kughHgOXc9OZH+1M8GVyEI0Cod1qQKBWKzNq6++dZnkxS2cisrTu90yw/EubozVg0bux9RZYnwxy9GYtGp3dpS5iejYza+n4RyiTLk2F6NjJq606vyE5TVjjL+4bh7lqir0tHb+h4U/GU5akt8rGGYSBxKk17cAkB8zheIAlZnkwTbyQGlxAwr+pJcnxHBf6jAtlLkL10TVWT2VTMyGwqDlvNEi/2DI9GFzcySwzau0Y0Ol6TWciqLvkXGbV19/Ykw+R0ZNTWHQ/NJsgwoW3GotG9PckwDxczFo2O12QWco+Gr5aQ+ajC7mhV4Z+1RF+XrrRFP7GGYaB2oNK0B5cQMK/GklqDeKM9uISAeZWH5sCoQLICT1fTZhGCdckwAAAAAElFTkSuQmCC"),
+        (5, 214) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABWElEQVR4Ae2WQQqDMBBFXfeG3knc9AC9irdyaf+TjAjTwTIBJZDCNyE4zut3Mmbov+7AHw7M83uUFmktYj5ehW6f1ygt0lrE/DJOOVL5dh4FT9IWaNpv+nER4CRtgcI45Unl2xEUzD+NYG3dOSZInI1gbd3FZfPtsFz0AF69gUXjwr1nCZhXb2DR6OKy+Y7cegA1G4Ha+noElImAqdkI1NZdXDZfSTsM2Qc8CdxcSbS16agNlUWqzags7m9rACNB4zTlwSZEzF1b4t6zBE17o2OwCRHzy7hsvnPuPu8ONO1AdhNkN12VWYK9ta3VwtLO7MwQja5NFWftzBCNLq4KlmC5S7+NQG3dnboETL+NQG3dxZGzSgLmI2Fg0ehOXQLmI2Fg0ejiqmAJbhH4KAnBRw67VyuHHyuJtjZdKYt22hrASOWA05QHmxAxv2xLKo3UaY2cXd2BpANfJfJoefRiGp8AAAAASUVORK5CYII="),
+        (5, 79) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScc+Pz9GqVZWoqIx7PUx+N7lGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm2f9+RilWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBkYFLmSWAYSAAAAAASUVORK5CYII="),
+        (5, 160) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WQQrDMAwEc+4P86fQSx/Qr+RXOaY7xgoBVaTYDsXgwtbCRHjYSIqn8RsO/ODA/n7M0iptWcTzVerz+ZqlVdqyiG/LSzwCXKQ90JIe+vInwEXaAzXPSwiCxNkI1vadY4LE2QjW9pvlJVj+BMyrN7BoXXn2LAHz6g0sWpvlHWcLmJqNQG1/OxJyIGBqNgK1/WZ5+dhp6hG4u5Loq+moDZVFP2MNYCRonKY8aEJE7MYSz56l5mO8MTFoQkR8W9757BEPB7p2oLR5Spu1yizBFt26BFs0DmthGUv27Y9WN6YEyxi0u0a0urwqWJLlLnMzArV9d+sSMHM6ArV9l8eZVRIww97AotXdugTMx8XAotXlVcGS3CPwURKCjxx2r1YO/60k+mq6XBb9jDWAkcoBpykPmhARX44llQbjjfKgCRHxZR5nDg0HCh34AJ8jaHmo/6B3AAAAAElFTkSuQmCC"),
+        (5, 241) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2W0QnDMAxE890Ns1PoTwfoKtkqn+m9YJmAKlxscDG4cLUwvuo4S6qX+ZkO/ODA8/lahV04EojXElVnu/IuPUq6CWeA7Tr05Uvnu/IuCUqKQ5FY23dO9+ZdYvlSYq7ehEXrztk7evNybiWmZiOhtn9kQgp681LaZemduDbfXfBwJTFW02G1rqnreKrNh9YM/QhOUx40ISB24ywTUtCbl9LOZTowvgO1zXO+H6uwC0cCcbFZmxyT2KqxJoGbcAYIX3mtYhln9maIVueYROJsJNb2Ha9JLGS5y7yNhNq+e61JMFdvwqLV8cjZBAnmT8KERat7rUkwNRsJtX3HaxILeUTBuSQkPnLYXa0c/ltJjNV0qSzGGWsIBioHnKY8aEJAXBxLKg3GG+VBEwLiIo+cE9OBSgc+bUJq4VSt1S0AAAAASUVORK5CYII="),
+        (5, 2) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPUlEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9F6wTEAVKTa4GFy4WhhfdZwl1dP4DAd+cODxfs7CJuwJxPMdVWeb8k49SroIR4DlPPTlS+eb8k4JSopDkVjbd0635p1i+VJirt6ERevG2Sta83JuJaZmI6G2v2dCClrzUtppap24NN9VcHcl0VfTYbWuqel4Ks2H1gz9CE5THjQhIHbjLBNS0JqX0o5lONC/A6XNs66vWdiEPYH4tlmrHJPYorEmgYtwBAhfebViGWf2ZohW55hE4mwk1vYdr0osZLnLvI2E2r57rUkwV2/CotXxyFkFCeZPwoRFq3utSTA1Gwm1fcerEgu5R8G5JCQ+cthdrRz+W0n01XSpLPoZawgGKgecpjxoQkB8O5ZUGow3yoMmBMS3PHIODAcKHfgAXrHwGuK8osIAAAAASUVORK5CYII="),
+        (5, 83) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgSccWH8+RmmWliLi8Sz18/drlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm+fx+B6lWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBbFMNCZDhwxMAAAAASUVORK5CYII="),
+        (5, 164) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2WYQqDMAyFPdOusRN4J/HPLuQtdhR/uvdJI0IWHG1lFDp4ayiGfjyT2KH/ugM/ODDPr1FapDWJeLxKfbyfo7RIaxLxbXk7jwAnaQs07Q99+RPgJG2BquftCILE2QjW9p1jgsTZCNb2q+XtsPwJmFdvYNG68OxZAubVG1i0Vss7zhYwNRuB2v56JKRAwNRsBGr71fLSscPQInBzJdFW01EbKot2xhrASNA4TXnQhIjYjSWePUvNx3hjYtCEiPi2vPPZPe4ONO1AbvPkNmuRWYLNunUJNmsclsIyluzbH61uTAmWMWh3jWh1eUWwJMtd5mYEavvu1iVg5nQEavsujzOLJGCGvYFFq7t1CZiPi4FFq8srgiW5ReCjJAQfOexerRz+W0m01XSpLNoZawAjlQNOUx40ISK+HEsqDcYb5UETIuLLPM7s6g5kOvABOnIPcZRhw6cAAAAASUVORK5CYII="),
+        (5, 29) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYGfh9/s7RKWxH2XHPd7z+ztEpbEXbVTzFS8Q4eOS/SHmg5HnrxJcBF2gOFfoqTincgyJlfGsHavsuYIMlsBGv7zi8b74DlSy/g6A0sWleevUrAHL2BRavzy8Y7Y+sF1GwEavvb6VAMAVOzEajtO79svBJ2mrIv+CZwdyXRV9NRGyqL1JhRWXx+rAGMBE2mKQ+aEGG7scSzVwma8cbEoAkRdtUvG+8ae9gjA11nINsEt9v/LK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8AQa+Q0J/Gfe1AAAAABJRU5ErkJggg=="),
+        (5, 110) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAvv5Z5ZWaSsinlupejaV93v5m6VV2oqIm34Hj0wXaQ+0HA/d+dDzqTwBLtIeKPQ7EGRKhSJY23ffPJsnSCobwdq+8ztg+ZAxR29g0bry7K2yeQLm6A0sWp1f9ZYxPRuB2v5WE0qQzRMwPRuB2r7zK7bTlDXO5r0CuLuW6OvS0Rs63tR4yuapLfJjDWAkcypNe3AJEXE8XkiSsnmCZrwxMbiEiLjpJ8vxPyrwHRXIXoLT6X+WVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AFKJsp6VtJ/7sAAAAASUVORK5CYII="),
+        (5, 191) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBh6Pz1XapaOIeK1Zz6+3Vdqlo4i46nv//lilXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/9qssUTfi1v0AAAAASUVORK5CYII="),
+        (5, 56) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABW0lEQVR4Ae2WYQqDMAyFPdOusRN4J9mfXchb7Cj+dO+TRoQsOFJQCh08W4ox355p7NB/3YE/HHh8nqM0S0sR8/Es9PV6j9IsLUXMT+OUI5Vv41HwJK2Bpu2mHxcBTtIaKIxTnlS+DUHB/NMI1tadY4LE2QjW1l1cNt8Gy0UP4NUbWDTO3HuUgHn1BhaNLi6bb8+tB1CzEaitL3tAmQiYmo1Abd3FZfOVtMOQfcCdwM2VRFubjtpQWaTajMri+rYGMBI0TlMebELE3LUl7j1K0LQ3OgabEDE/jcvmO+bu8+5A0w5kN0F201WZJdhL21otLO3MzgzR6NpUcdbODNHo4qpgCZa79NsI1NbdqUvA9NsI1NZdHDmrJGA+EgYWje7UJWA+EgYWjS6uCpbgFoH3khB85LB7tXL4tpJoa9OVsminrQGMVA44TXmwCRHz07ak0kid1sjZ1R1IOvAFYkkPcVbrOQIAAAAASUVORK5CYII="),
+        (5, 137) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBs6vt1XapaOIeK1ZH4/PVdqlo4i46nv//lilXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8AG/rLFHYpYRWAAAAAElFTkSuQmCC"),
+        (5, 218) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2WUQrCMBBEeyav4Ql6p+KPF+otPEo/67ySLcK6RDaCRCKOCSHDjJvNtNP4jAp8UIHb7T4Lq7AVMJ9rVO1N8S6P6yyswlbAvKp3+JHoIuwBlmPTmx/tT/FkcBH2AKHeYUGiVCgya+vun2d5MkllI7O27vQOs/xImKM3Y9G4svcVWZ4Mc/RmLBqd3qktYXo2Mmrr20kokyxPhunZyKitO70iO01Z4SzvG4a7a4m+Lh29oeNNxVOWp7bIxxqGgcSpNO3BJQTM43iBJGR5Mk28kRhcQsC8qifJ8R0V+I8KZC9B9tI1VU1mUzEjs6k4bDVLvNgzPBpd3MgsMWjvGtHoeE1mIau65F9k1Nbd25MMk9ORUVt3PDSbIMOEthmLRvf2JMM8XMxYNDpek1nIPRo+W0Lmowq7o1WFf9YSfV260hb9xBqGgdqBStMeXELAvBpLag3ijfbgEgLmVR6aA6MCyQo8AT4KLrkXdkOjAAAAAElFTkSuQmCC"),
+        (5, 11) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAr+Xv1lapa2IeG6l6tlU3n7+maVV2oqIm34Hj0wXaQ+0HA/d+dDzqTwBLtIeKPQ7EGRKhSJY23ffPJsnSCobwdq+8ztg+ZAxR29g0bry7K2yeQLm6A0sWp1f9ZYxPRuB2v5WE0qQzRMwPRuB2r7zK7bTlDXO5r0CuLuW6OvS0Rs63tR4yuapLfJjDWAkcypNe3AJEXE8XkiSsnmCZrwxMbiEiLjpJ8vxPyrwHRXIXp7T6X+WVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYEryZANCcnUKKwAAAAASUVORK5CYII="),
+        (5, 92) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0H9vvPLK3SVkQ811J/H3+ztEpbEXE1TzVS9Q4eJS/SHmg5LnrxJcBF2gOFeaqTqncgKJlfGsHavnNMkDgbwdq+y8vWO2D50g149AYWrSvXXiVgHr2BRavLy9Y7a+sG9GwEavvbmVACAdOzEajtu7xsvVJ2mrI3+CZwdy3R16GjN9QWqTGjtvj8WAMYCRqnaQ8OISJ2Y4lrrxI0442JwSFExNW8bL1r7REPB7p2IHt4brf/WVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeALXMinpjI88NgAAAABJRU5ErkJggg=="),
+        (5, 173) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBh6Pz1XapaOIeK1Z378/VmmXjiLiqu/8elulXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/pVEsUeqor1sAAAAASUVORK5CYII="),
+        (5, 38) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScc+Pz9GqVZWoqIx7PU9edjlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm+7x+B6lWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBhdgp6eWYg+sAAAAASUVORK5CYII="),
+        (5, 119) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXziw3/9mYRW2BOK5RNXeprxDj4ouwh5gOTZ9+Gh/U94hQUVxKBJreed0a94hlo8Kc/QmLFpX9r6iNS/XVmF6NhJq+S0TUtCal8pOU+vCZ+u9Cu6uJfoaOqzWMTW9ns7WQ2uG/gSnaQ+GEBC76ywTUtCal8qOZTjQvwP/j8ssrMKWQFwcuuv1NgursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeAKTekbJoV4xtQAAAABJRU5ErkJggg=="),
+        (5, 200) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD9/uilUZqSiPu91Pl56aVRmpKIT8tbeAQ4SHOgYXnpy0OAgzQHKp63IAgSZyNY23eOCRJnI1jbL5a3wPIQMJ/ewKJ15N2tBMynN7BoLZa3ni1gajYCtf1pTUiBgKnZCNT2i+WlY7uuRuDqSqKupqM2VBb1jDWAkaBxmvKgCRGxG0u8u5Waj/HGxKAJEfFpeduzW9wcqNqB6+vWS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOANYZlJMeAGulMAAAAASUVORK5CYII="),
+        (5, 65) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwPf/zyyt0lbEfK5ZL5ffWVqlrYh51bf/fc3SKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwBzSgsUaEp21kAAAAASUVORK5CYII="),
+        (5, 146) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcysP99zdIqbUXYc831dvudpVXairCrfoqRinfwyHmR9kDL8dCTLwEu0h4o9FOcVLwDQc780gjW9l3GBElmI1jbd37ZeAcsX3oBR29g0bry7FUC5ugNLFqdXzbeGVsvoGYjUNvfTodiCJiajUBt3/ll45Ww05R9wSeBuyuJvpqO2lBZpMaMyuL9Yw1gJGgyTXnQhAjbjSWevUrQjDcmBk2IsKt+2XjX2MMeGeg6A9//P7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDtrKSTEAcprVAAAAAElFTkSuQmCC"),
+        (5, 227) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA5fL7yyswlZAPNeoejfF2/++ZmEVtgLiqt7hR6KLsAdYjpcePPR+iieDi7AHCPUOCxIlQ5FZ23e/PMuTSTIbmbV9p3eY5SFhjt6MRevKu7fI8mSYozdj0er0Tm0JU7ORUdvfTkIJsjwZpmYjo7bv9IrsNGWFs7xXGO6uJPpqOmpDx5saT1meyiI/1jAMJE6mKQ+aEBDH4wWSkOXJNOONiUETAuKqniTHd2TgMzLw/f8zC6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcAajpS5mBINe8AAAAAElFTkSuQmCC"),
+        (5, 20) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABa0lEQVR4Ae2W0W3DMAxEPVPX6ATeychPF/IWHcWf6T3DNAqwB9VMgECBglwkCCL4QlFnT+MzKvCPCnx8f87SKm2HmM+tUO0txd1uX7O0Stsh5s18O4+SLtLdaNk3/fGj/aU4AS7S3cjm2xGUlAo52FhP/7waJ0gq62BjPeXbYflRYo4+wNy4sve3qnEC5ugDzI0p35lbielZBxrr2xlwTKpxAqZnHWisp3xH2mmqJq7GPQO4u5bo69LRGzrekj1V49QWdVsDGCk5laY9uISIubcXgqRqnKCxNxyDS4iYN/Mp5fiOCrxHBbq6PIIt2Zpu+uP2dPW8BYudxTuDG5PdCBZbime/G1PcVb60X8D4rQON9fT2JGB804HGeopLAFcXBMxDIsDcmN6eBIzZB5gbU9xVvrS/R+CzJQTvKpyOVhV+WUv0denoEVW2H1sDGAmaStMeXELEvGlLag3sjfbgEiLmzThyDo0KFCvwA4ogD3G0Vy2ZAAAAAElFTkSuQmCC"),
+        (5, 101) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9kYL/+zNIqbUXEc8v6e/ubpVXaioibvsvlf5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHZfCLFFlqAEGAAAAAElFTkSuQmCC"),
+        (5, 182) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABT0lEQVR4Ae2WUQrCMAyGdyav4Ql2p+GLF9otPMoe9f9GMwYxdAZxFir8ayjN8pmmWYf+6xk4kIHb7T5Ks7QUYY8118vjOkqztBRhV/0UIxVv5ZHzJD0DTeuiNw8BTtIzUOinOKl4K4Kc+acRrM27jAmSzEawNu/8svFWWB56AVtvYNE4s3YvAbP1BhaNzi8bb4utF1CzEajNL5tDMQRMzUagNu/8svFK2GHIvuBM4OZKoq1DR22oLFJtRmXx+7YGMBI0maY8OIQI27Ul1u4laNobHYNDiLCrftl4+9jd7hloOgNNHR7BnteePt1mwdKW7Nsfja5NlbZkd41odH6f8rn1AqZvRqA2//1blyM5OCFgmr2BReP3b10H+dyyFoG3khB8lOG/Kom2Dh01osy209YARoIm05QHhxBhV9tSaW/c7LjhIeyqHzG7egaSGXgBZeEuud7+1zYAAAAASUVORK5CYII="),
+        (5, 47) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Pv/Z5V26SgiXlvW8+9rlXbpKCJu+m6331XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHUZoLFEHZdjbAAAAAElFTkSuQmCC"),
+        (5, 128) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQG1vPPKM3SUsR+rLnqbMrvdPofpVlaithX4208CjpJa6BpO/TgofMpPwFO0hoojLchKCgZimDN7n551k+QZDaCNbuLt8HyUGCu3sCidebsrbJ+AubqDSxaXbw9tgJTsxGo2ZfdoWyyfgKmZiNQs7t4JewwZANn/d4B3FxJtNV01IauNzWesn4qi/xYAxgpOJmmPGhCxD4eLzhJWT9BM96YGDQhYl+Np5D92zPwHRn4vfyN0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq5UCkkx5AEsRQAAAABJRU5ErkJggg=="),
+        (5, 209) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjA8XgapVlakrDHmut6/hulWVqSsKt+ihGKt/HIeZJWR9O26M5HgJO0OnL9FCcUb0OQM//Ug7X5ImOCJLMerM0XftF4GywfbcDRG5g3zqzdS8AcvYF5Y+EXjZdjawNq1gO1+SU7JEPA1KwHavOFXzReCjsM0Q2+CdxcSbR16agNlUWozagsPt/WAEaCJtOUB5cQYRdtibV7CZr2RsfgEiLsql803j52t3sGms7A/+UwSrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANXIilLmfobEpYAAAAASUVORK5CYII="),
+        (5, 74) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABN0lEQVR4Ae2WYQqDMAyFPdOusRN4J/HPLuQtdhR/uveVRoQuOLTKAh08G4qhH88ka9d+zYEfHHi8n700SXMWcb+XOo6vXpqkOYv4srzEI8BBWhwN6aUvDwEO0uKoel5CECTOerC2XzgmSJz1YG2/Wl6C5SFgPr2BeevEu1sJmE9vYN5aLW89W8DUrAdq+/OakAMBU7MeqO1Xy8vHdl1E4HAlEavpqA2VRZyxBjASNE5THjQhIi7GEu9upeZjvDExaEJEfFne9uwWNwdCO3B3050yS7C3jrWzsIwzuzN4azGm8jizO4O3FnmnYEmWu8xbD9T269+6OPyIBMyfhIF5a/1b1xFYciICryUheM/hvyqJWE2XyyLOWAMYqRxwmvKgCRHx7ljK440bGjc1RLybx5lNzYGDDnwAjbguuWXh7sIAAAAASUVORK5CYII="),
+        (5, 155) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HFhet16apDmKuN9KHcdnL03SHEV8Wl7gEeAgLY6GsOjHT4CDtDgqnhcQBImzHqzNZ44JEmc9WJsvlhdg+QmYozcwb5xYu5aAOXoD88ZieWlvAVOzHqjNzykhBgKmZj1Qmy+WF7ftuhqBqyuJui4dtaGyqKetAYwEjdOUB5cQEWdtibVr6fLR3ugYXEJEfFreeu8WNweqduD+fvTSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBD5taS5kNLp1PAAAAAElFTkSuQmCC"),
+        (5, 236) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABJElEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9J6RTagrUuLU1ODCxcL4quMsCw391x34woF5fozCIqwG4vGIqrNVeUGPkk7C5mAKhz58dL4qL0hQUhzyxMb9zOnavCCWjxJz9VGYty6c3aM2L+VWYmrWExr310SwoDbP0g5D7cRn8+0FN1cSbT06rNY1VW1PZ/OhNUF/gtOUB48QEGftLBEsqM2ztH3pDrTvwO15H4VFWA3EP3t0RY5J4CRsDi6f1krF4qwnNu5nTls7i7OGt2a8IrGQ5SpXH4V562XTGjmLIMHUrCc07l82rRWJhdyi4FQSEh8dfV//qiTaenRWFu20NQQDlQNOUx48QkB82JasvTHZMeEB4kMeOTu6AycdeAFpeU4Bv37AAwAAAABJRU5ErkJggg=="),
+        (5, 5) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABS0lEQVR4Ae2W0cnDMAyE8/yP86/RCbJT6EsH6CrZoqPkMb0vWKZUFS4xuBhcuFgIX3WcJeNp/IYDXzjw/7jMwipsCcRziaq9TXmHHhVdhD3Acmz68NH+prxDgoriUCTW8s7p1rxDLB8V5uhNWLSu7H1Fa16urcL0bCTU8lsmpKA1L5WdptaFz9Z7FdxdS/Q1dFitY2p6PZ2th9YM/QlO0x4MISB211kmpKA1L5Udy3Cgfwf2+98srMKWQFwcuuv1NgursCUQF3lVjkngIuwBwteaBC7CHiDk1YrF2Uis5Z1jEomzkVjLO16VWMhylaM3YdHqXmsSzNGbsGh1PGpWQYLp2Uio5d1rTYLp2Uio5R2vSizkHgXnlpB4c/R9dUcrh3/WEn0NXWqLfq41BAO1A07THgwhIC5eS2oNrjfagyEExEUeNQeGAycdeALbqw0JQQWXxAAAAABJRU5ErkJggg=="),
+        (5, 86) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgSccWH8+RmmWliLi8Sz18/drlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm+7x+B6lWVqKiE+brsoswV4aawKcpNXI3tZqYRlncWdwa3JMkDjrYGM/5VXBkix3mbcONPbTrUvAfPoAc2vK48wqCZg/iQBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwB6U0p6UZws+sAAAAASUVORK5CYII="),
+        (5, 167) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2WwQnDMAxFc+44XaMTZKfQSwfoKtmio+SY/hesEKqKlNihGFz4sTARfvxIqrv2aw784MD9/uilUZqSiPu91Ovr1kujNCURn5a38AhwkOZAw/LSl4cAB2kOVDxvQRAkzkawtu8cEyTORrC2XyxvgeUhYD69gUXryLtbCZhPb2DRWixvPVvA1GwEavvTmpACAVOzEajtF8tLx3ZdjcDVlURdTUdtqCzqGWsAI0HjNOVBEyJiN5Z4dys1H+ONiUETIuLT8rZnt7g5ULUD8/PSS6M0JRHvNs/RZs0yS4CDNAcKb12CPTQOc2FxNoK1fee0YBmDdteIVpeXBUuyXOXTG1i0uluXgJnTEajtuzzOzJKAqdkI1PbdrUvA/LkYWLS6vCxYkmsEXktC8Obo5+o+rRz+W0nU1XSpLOoZawAjlQNOUx40ISLeHUsqDcYb5UETIuLdPM5sag4cdOANt2wsUTTCXxYAAAAASUVORK5CYII="),
+        (5, 32) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouj0RlYzjc9w4A0Hfh9/s7RKWxHxXEvd7z+ztEpbEXE1TzVS9Q4eJS/SHmg5LnrxJcBF2gOFeaqTqncgKJlfGsHavnNMkDgbwdq+y8vWO2D50g149AYWrSvXXiVgHr2BRavLy9Y7a+sG9GwEavvbmVACAdOzEajtu7xsvVJ2mrI3+CZwdy3R16GjN9QWqTGjtvj8WAMYCRqnaQ8OISJ2Y4lrrxI0442JwSFExNW8bL1r7REPB7p2IHt4brf/WVqlrYi4euiazBJsajwJcJH2QOHbWissY8n++6PVOSZInI1gbd/lNcGSLHeZmxGo7bu3LgHz6A0sWl0eNZskYIa9gUWre+sSMD0bgdq+y2uCJblH4LMlBB857B6tHP5aS/R16Epb9DPWAEZqB5ymPTiEiLg6ltQajDfag0OIiKt51BwaDiQdeAKX8ynp/vacgAAAAABJRU5ErkJggg=="),
+        (5, 113) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAvv5Z5ZWaSsinlupejaV93v5m6VV2oqIm34Hj0wXaQ+0HA/d+dDzqTwBLtIeKPQ7EGRKhSJY23ffPJsnSCobwdq+8ztg+ZAxR29g0bry7K2yeQLm6A0sWp1f9ZYxPRuB2v5WE0qQzRMwPRuB2r7zK7bTlDXO5r0CuLuW6OvS0Rs63tR4yuapLfJjDWAkcypNe3AJEXE8XkiSsnmCZrwxMbiEiLjpJ8vxPyrwHRXIXp7T6X+WVmkrIn7v5RFsaqwJcJH2QI/furLnLFjGmb0zRKurmCCpbARr+y4vy1nzBMy8jUBt3709CZijN7BodXnVOBsImB8JA4tW9/YkYHo2ArV9l5flrHk9AteWEHxUYXe0qvDHWqKvS0dvqLL9jDWAkaCpNO3BJUTEzbGk1mC80R5cQkTczMNzaFQgWYErpZVGyXlrV3IAAAAASUVORK5CYII="),
+        (5, 194) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBh6Pz1XapaOIeK1Zz6+3Vdqlo4i46nv//lilXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGvztDZrV9YE2/TWJdimcdgLy1iKZ79b07gRLGMw3jXcmnxdsJiVXeamA4399PYkYOa0A4395OPMLgmYYR9gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/c7RJMWy0RAkAAAAASUVORK5CYII="),
+        (5, 59) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2W0YnDMAyG83zj3Bo3QXYKfbkBbpVscaPkMf2/YIVQVbjI0GJw4a+FiaKvsqR6Gp+RgRcy8P3/M0urtBVhzzXX2+13llZpK8Ku+ilGKt7BI+dF2gMtx0NPvgS4SHug0E9xUvEOBDnzSyNY23cZEySZjWBt3/ll4x2wfOkFHL2BRevKs1cJmKM3sGh1ftl4Z2y9gJqNQG1/Ox2KIWBqNgK1feeXjVfCTlP2BZ8E7q4k+mo6akNlkRozKov3jzWAkaDJNOVBEyJsN5Z49ipBM96YGDQhwq76ZeNdYw97ZKDrDOx/X7O0SlsRdrV5sk3XlCwBLtIeKLx1CTY11lphyWwEa/su04JlnNmdIVqdXxMszsoqR29g0epuXQJm3kagtu/8iNkkAVOzEajtu1uXgPmTMLBodX5NsDj3CHyWhOAto4+rO1pl+GMl0VfTlbLoZ6wBjFQOZJryoAkRdnUsqTQYb5QHTYiwq37EHBoZSGbgDt9DLFGASoeyAAAAAElFTkSuQmCC"),
+        (5, 140) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2W0YnDMBBE/X3lXBtXgXsy+bkCrhV3caX405lntCawGRQiSFBQyERCeNDLanetaXxGBB6IwP73NUurtBUxn2vWy+V3llZpK2Je9X3//8zSKm1FzKu+g0eAi7QbLcdDd34EuEi7kfUJcJF2I+s7EARJZB1srKd/Lkgi62BjPfkESWQdbKwn3wHLj4A5+gBz48qztxIwRx9gbkw+AXP0AebG5Dv3FjA560BjfTsNZSJgctaBxnryCZicdaCxnnxl22nqEbi7lOir6MgNpUU/bQ1gJGgiTXpQhIi5by+YJBUf7Y2OQREi5lWfio/2RsegCBHzqk9bju+IwGdE4NVF1xQ1wb60rbXC0s7izuDG1G5KO4s7gxuTrwkWs6JLv3WgsZ5uTwKm3zrQWE8+9mySgHlJBJgb0+1JwLwkAsyNydcEi7lH4DMlBO8inI5WEX5bSvRVdCUt+mlrACOlA5EmPShCxLzalpQaT93W2HNoRODJCFwB7OVJMf0H8EcAAAAASUVORK5CYII="),
+        (5, 221) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeklEQVR4Ae2W0W3DMAxE/d1xukYn8E5GfjpAV/EWHcWfzj1DNIIwhAIqQKBAQc4iBB/uQpGMpvEZGXgiA5fL7yyswlZAPNeoejfF+/7/mYVV2AqIq3qHH4kuwh5gOV568ND7KZ4MLsIeINQ7LEiUDEVmbd/98ixPJslsZNb2nd5hloeEOXozFq0r794iy5Nhjt6MRavTO7UlTM1GRm1/OwklyPJkmJqNjNq+0yuy05QVzvJeYbi7kuir6agNHW9qPGV5Kov8WMMwkDiZpjxoQkAcjxdIQpYn04w3JgZNCIirepIc35GBz8jA/vc1C6uwFRBXmyDbdE1Zk8FF2AOEtyeZTY3DVrNkNjJr+y7TMssYtLtGtDpek1nIyipHb8ai1d2eZJg5HRm1fcdDswkyTM1GRm3f3Z5kmD8XMxatjtdkFnKPhs+SkHnL6P3qjlYZfltJ9NV0pSz6GWsYBioHMk150ISAuDqWVBqMN8qDJgTEVR6aAyMDyQxcAbsES5nVvb/yAAAAAElFTkSuQmCC"),
+        (5, 14) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABeUlEQVR4Ae2WQY7CMAxFu57jzDXmBL1TxWYOwFV6C47SZfmviiMkY4IsEArKaD6xolr/4Tim0/gbFXiiAr+Xv1lapa2IeG6l6tlU3n7+maVV2oqIm34Hj0wXaQ+0HA/d+dDzqTwBLtIeKPQ7EGRKhSJY23ffPJsnSCobwdq+8ztg+ZAxR29g0bry7K2yeQLm6A0sWp1f9ZYxPRuB2v5WE0qQzRMwPRuB2r7zK7bTlDXO5r0CuLuW6OvS0Rs63tR4yuapLfJjDWAkcypNe3AJEXE8XkiSsnmCZrwxMbiEiLjpJ8vxPyrwHRXIXoLT6X+WVmkrIn7v5RFsaswIcJH2QI/furLnLFjGi/2GR6urmCCpbARr+y4vy1nzBMz8i0Bt3709CZijN7BodXnVOBsImKFtYNHq3p4ETM9GoLbv8rKcNa9H4NoSgo8q7I5WFf5YS/R16egNVbafsQYwEjSVpj24hIi4OZbUGow32oNLiIibeXgOjQokK3AFRpkp6cxZChUAAAAASUVORK5CYII="),
+        (5, 95) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdUlEQVR4Ae2W0anDMAxF8/3GeWu8CbJT6M8boKtki46Sz/SeYIWAKlxkaDG4cGthouhUllRP4zMy8EYG9vvPLK3SVoQ911x/H3+ztEpbEXbVTzFS8Q4eOS/SHmg5HnrxJcBF2gOFfoqTincgyJlfGsHavsuYIMlsBGv7zi8b74DlSy/g6A0sWleevUrAHL2BRavzy8Y7Y+sF1GwEavvb6VAMAVOzEajtO79svBJ2mrIv+CZwdyXRV9NRGyqL1JhRWXx+rAGMBE2mKQ+aEGG7scSzVwma8cbEoAkRdtUvG+8ae9gjA11nINsEt9v/LK3SVoRdbbqmZAk2NdYEuEh7oPC21grLOLM7Q7S6jAmSzEawtu/8mmBxVnaZtxGo7btbl4A5egOLVudHzCYJmD8JA4tWd+sSMDUbgdq+82uCxblH4LMkBB9l2B2tMvy1kuir6UpZ9DPWAEYqBzJNedCECLs6llQajDfKgyZE2FU/Yg6NDCQz8ARUO0bJhIC7uQAAAABJRU5ErkJggg=="),
+        (5, 176) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhUlEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8Rgj/0QpO0l/mZGfhHBh6Pz1XapaOIeK1Z378/VmmXjiLiqu/8elulXTqKiKu+i0eAm3QabddFf/wIcJNOI+sT4CadRtZ3IQiSzDrY2E//XJBk1sHGfvIJksw62NhPvguWHwFz6wPMrTvX/paAufUB5tbkEzC3PsDcmnz32QKmZh1o7B+3oQQCpmYdaOwnn4CpWQca+8lXjl2WEYGHK4mxmo7aUFmMM9YARoIm05QHTYiI/XjBJKn5GG9MDJoQEVd9aj7GGxODJkTEVZ+OnN+ZgdfIQGsTtDZrV9YE2/T2JNimcdgLy3iJZ7hb07gRLGMw3jXcmnxdsJiVXeafA4399PYkYOa0A4395OPMLgmYoR1gbk1vTwLm4RJgbk2+LljMIwLfJSF4l+F0a5Xhp5XEWE1XymKcsQYwUjmQacqDJkTE1bGk0mC8UR40ISKu+jhzamagMQM/IlpJMQDY/ogAAAAASUVORK5CYII="),
+        (5, 41) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABYUlEQVR4Ae2W0WnEMBBE/Z1y0kYqcE/mflJAWnEXKcWfzjyjNYbN4MPycQh0MNYivOgx3t3T0H/dgScc+Pz9GqVZWoqIx7PU9edjlGZpKSJ+Wd7GI8BJWo2m7aV/HgKcpNXo9rwNQZA462BjPzkmSJx1sLF/W94Gy0PAfPoAc+vMu0cJmE8fYG69LW8/W8DUrAON/WVPKIGAqVkHGvu35ZVjh6FF4OZKoq2mozZUFu2MNYCRoHGa8qAJEXEaS7x7lJqP8cbEoAkR8cvyjmf3uDvQtANXm+fx+B6lWVqKiE+brsoswV66dQlwklYje1urhWUsxX+/W5NjgsRZBxv7Ka8KlmS5y9x0oLGfbl0C5tMHmFtTHmdWScAM+wBza7p1CZiadaCxn/KqYEluEXgvCcE7h9OnlcNvK4m2mq6URTtjDWCkcsBpyoMmRMSnY0mlwXijPGhCRHyax5ld3YGLDvwBAuFGySzrP4MAAAAASUVORK5CYII="),
+        (5, 122) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABOklEQVR4Ae2W0QnDMAxE890Ns1PoTwfoKtkqn+m9YJmAKlxscDG4cLUwvuo4S6qX+ZkO/ODA+X6swi4cCcRriaqzXXmXHiXdhDPAdh368qXzXXmXBCXFoUis7Tune/MusXwpMVdvwqJ15+wdvXk5txJTs5FQ2z8yIQW9eSntsvROXJvvLni4khir6bBa19R1PNXmQ2uGfgSnKQ+aEBC7cZYJKejNS2nnMh0Y34Ha5nk+X6uwC0cCcbFZmxyT2KqxJoGbcAYIX3mtYhln9maIVueYROJsJNb2Ha9JLGS5y7yNhNq+e61JMFdvwqLV8cjZBAnmT8KERat7rUkwNRsJtX3HaxILeUTBuSQkPnLYXa0c/ltJjNV0qSzGGWsIBioHnKY8aEJAXBxLKg3GG+VBEwLiIo+cE9OBSgc+EINjqSUE6WkAAAAASUVORK5CYII="),
+        (5, 203) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WQQrDMAwEc+4P86fQSx/Qr+RXOaY7xgoBVaTYDsXgwtbCRHjYSIqn8RsO/ODA8/mapVXasojnq9T9/ZilVdqyiG/LSzwCXKQ90JIe+vInwEXaAzXPSwiCxNkI1vadY4LE2QjW9pvlJVj+BMyrN7BoXXn2LAHz6g0sWpvlHWcLmJqNQG1/OxJyIGBqNgK1/WZ5+dhp6hG4u5Loq+moDZVFP2MNYCRonKY8aEJE7MYSz56l5mO8MTFoQkR8W9757BEPB7p2oLR5Spu1yizBFt26BFs0DmthGUv27Y9WN6YEyxi0u0a0urwqWJLlLnMzArV9d+sSMHM6ArV9l8eZVRIww97AotXdugTMx8XAotXlVcGS3CPwURKCjxx2r1YO/60k+mq6XBb9jDWAkcoBpykPmhARX44llQbjjfKgCRHxZR5nDg0HCh34AN6TZhGVU7JRAAAAAElFTkSuQmCC"),
+        (5, 68) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwW3DMAxFfe44XaMTeCcjlw7QVbxFR/HR/c8QjQLshwrpEChQkB8RQj70QpOMlvmaGfhHBt6/P1Zpl44i4rVmfTw+V2mXjiLiqu/8elulXTqKiKu+i0eAm3QabdeX/vgQ4CadRtYnwE06jazvQhAkmXWwsZ9+uSDJrION/eQTJJl1sLGffBcsHwLm0QeYW3e++1sC5tEHmFuTT8A8+gBza/LdZwuYmnWgsX/chhIImJp1oLGffAKmZh1o7CdfOXZZRgQeriTGajpqQ2UxzlgDGAmaTFMeNCEi9uMFk6TmY7wxMWhCRFz1qfkYb0wMmhARV306cr5nBl4jA61N0Np0XVkTbNPtSbBNt7VeWMZL/Ie7NY0bwTLO4s7g1uTrgsWs7DL/HGjsp9uTgJm3DjT2k48zuyRghnaAuTXdngTMn0SAuTX5umAxjwh8l4TgXYbTo1WGn1YSYzVdKYtxxhrASOVApikPmhARV8eSSoPxRnnQhIi46uPMqZmBxgz8AEoxSTE3P5aIAAAAAElFTkSuQmCC"),
+        (5, 149) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABWElEQVR4Ae2WQQqDMBBFXfeG3knc9AC9irdyaf+TjAjTwTIBJZDCNyE4zut3Mmbov+7AHw5sn9coLdJaxHy8Cp3n9ygt0lrE/DJOOVL5dh4FT9IWaNpv+nER4CRtgcI45Unl2xEUzD+NYG3dOSZInI1gbd3FZfPtsFz0AF69gUXjwr1nCZhXb2DR6OKy+Y7cegA1G4Ha+noElImAqdkI1NZdXDZfSTsM2Qc8CdxcSbS16agNlUWqzags7m9rACNB4zTlwSZEzF1b4t6zBE17o2OwCRHzy7hsvnPuPu8ONO1AdhNkN12VWYK9ta3VwtLO7MwQja5NFWftzBCNLq4KlmC5S7+NQG3dnboETL+NQG3dxZGzSgLmI2Fg0ehOXQLmI2Fg0ejiqmAJbhH4KAnBRw67VyuHHyuJtjZdKYt22hrASOWA05QHmxAxv2xLKo3UaY2cXd2BpANfV9NmEb3XeY8AAAAASUVORK5CYII="),
+        (5, 230) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABZUlEQVR4Ae2WUQrCMBBE++0Ne6fSHw/gVXqrftZ5JVuEdYlsBIlEHBNChhk3m2mn8RkV+KAC63qfhU3YC5jPNar2pnjH4zYLm7AXMK/qnX4kughHgOXc9OZH+1M8GVyEI0Cod1qQKBWKzNq6++dZnkxS2cisrTu90yw/EubozVg0bux9RZYnwxy9GYtGp3dpS5iejYza+n4RyiTLk2F6NjJq606vyE5TVjjL+4bh7lqir0tHb+h4U/GU5akt8rGGYSBxKk17cAkB8zheIAlZnkwTbyQGlxAwr+pJcnxHBf6jAtlLkL10TVWT2VTMyGwqDlvNEi/2DI9GFzcySwzau0Y0Ol6TWciqLvkXGbV19/Ykw+R0ZNTWHQ/NJsgwoW3GotG9PckwDxczFo2O12QWco+Gr5aQ+ajC7mhV4Z+1RF+XrrRFP7GGYaB2oNK0B5cQMK/GklqDeKM9uISAeZWH5sCoQLICTyXyaHk68PnlAAAAAElFTkSuQmCC"),
+        (5, 23) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABe0lEQVR4Ae2W0a3CMAxF+/3GeWu8CbpTxc8bgFW6BaP0s9xTxRXCWKEGCQUFcZvIiuWDY5sO/dMz8EQGfi9/ozRLSxH7seaqsym/0+l/lGZpKWJfjbfxKOgkrYGm7dCDh86n/AQ4SWugMN6GoKBkKII1u/vlWT9BktkI1uwu3gbLQ4G5egOL1pmzt8r6CZirN7BodfH22ApMzUagZl92h7LJ+gmYmo1Aze7ilbDDkA2c9XsHcHMl0VbTURu63tR4yvqpLPJjDWCk4GSa8qAJEft4vOAkZf0EzXhjYtCEiH01nkL2b8/Ad2RgPf+M0iwtReyrTfCR5hHgJK2Bwrcnwb4+no7etyDJbARrdpdpwTKW7L8/Wp3fUT53XsBcvYFFq3t7EjBzMwI1u/NzAEcNAqZmI1Czu7cnATPsDSxand9RPne+ReC9JARvGb1f3dUqwx8ribaajhpRZtsZawAjQZNpyoMmROyrY0mlwXijPGhCxL7qR8yunoFkBq4HKSxRm5v3eQAAAABJRU5ErkJggg=="),
+        (5, 104) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABhklEQVR4Ae2WwY3DMAwE/b5yro2rwD0Z+VwB14q7uFL8dHYMUQjALBToEyhQkI0IIQtNKJLxMl8zAy9k4Pz7WqVdOoqI15b1+/9nlXbpKCJu+m6331XapaOIuOm7eAS4SafRdn3pyYcAN+k0sj4BbtJpZH0XgiDJrION/fTLBUlmHWzsJ58gyayDjf3ku2D5EDBXH2Bu3fnuowTM1QeYW5NPwFx9gLk1+erZAqZmHWjsH9VQAgFTsw409pNPwNSsA4395CvHLsuIwMOVxFhNR22oLMYZawAjQZNpyoMmRMR+vGCS1HyMNyYGTYiImz41H+ONiUETIuKmT0fO98zAZ2Sgt+ne0jyC7Rprgu1/6uq9Z8EyzuKZwa1p3AiWsRT//W5Nvl7O6hMw89aBxn56ehIwc9OBxn7y1YN7AwHzJxFgbk1PTwJm2AeYW5Ovl7P6RgSuJSF4l+F0tcrw20pirKajNpTZccYawEjQZJryoAkRcXMsqTQYb5QHTYiImz7OnJoZ6MzAHRTLSTGHLGfsAAAAAElFTkSuQmCC"),
+        (5, 185) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABXklEQVR4Ae2W3a3CMAyF+3zHuWswQXeqeGEAVukWjNLHcr4qjiqCFbD4ixSk01hRHH84jpWh/3oGHsjA8XgapVlakrDHmuv/5TBKs7QkYVf9FCMUb+OR8yStjqZt0Z2PACdpdeT6KU4o3oYgZ/6pB2vzRcYESWY9WJsv/KLxNlg+2oCjNzBvnFm7l4A5egPzxsIvGi/H1gbUrAdq80t2SIaAqVkP1OYLv2i8FHYYoht8E7i5kmjr0lEbKotQm1FZfL6tAYwETaYpDy4hwi7aEmv3EjTtjY7BJUTYVb9ovH3sbvcMNJ2B9fw3SrO0JGH/5uUR4CStjt7z6ooeryDJrAdr80WmU1uyt4Y3Fn5RzuwnYI7ewLzx9a+uTPCkIWBq1gO1+de/up7kzMtbBM4lIXjL6O34UyXR1qWjNpTZdtoawEjQZJry4BIi7GpbSu2Nlx0vPIRd9SNmV89AMANX4ttLmf8mnKwAAAAASUVORK5CYII="),
+        (5, 50) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABd0lEQVR4Ae2WwY3CMBBFc95yto2tID1FXLYAWkkXlJJj+C/yWEjDl1EOICMjPh5Z+cpjPDPJND4jAy9k4Pf2N0urtBURzy3rfv2ZpVXaioibvsvlf5ZWaSsibvoOHgEu0m60HBc9+RHgIu1G1ifARdqNrO9AECSZdbCxn/65IMmsg4395BMkmXWwsZ98Byw/AuboA8ytK9c+SsAcfYC5NfkEzNEHmFuTr95bwNSsA439rRpKIGBq1oHGfvIJmJp1oLGffOW209QjcHcl0VfTURsqi37GGsBI0GSa8qAJEbEfL5gkNR/jjYlBEyLipk/Nx3hjYtCEiLjp0y3Hd2TgOzLQVfMI9v1vXWfPWbCMpXj2uzWNmzKW4tnv1uQ7y1l9AmZuOtDYT29PAmZuOtDYT75647OBgBn2AebW9PYkYIZ9gLk1+c5yVl+PwLUkBO8ynI5WGf5YSfTVdNSGMtvPWAMYCZpMUx40ISJujiWVxnjrIoFD78zAHcNiSTH08Xj5AAAAAElFTkSuQmCC"),
+        (5, 131) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2WUWrDMBBE/d0b+k4mPz1Ar+Jb+dOdZ7ymsB1UbwNBQSETCaFlX1arsafxGRX4QwX2r49ZWqXtFPO5Faq9pbjH43OWVmk7xbyZ7+BR0kXajZZj0y8/2l+KE+Ai7UY234GgpFTIwcZ6+ufVOEFSWQcb6ynfAcuPEnP0AebGlb0/VY0TMEcfYG5M+a7cSkzPOtBY366Ac1KNEzA960BjPeU7005TNXE17hnA3bVEX5eO3tDxluypGqe2qNsawEjJqTTtwSVEzL29ECRV4wSNveEYXELEvJlPKcd3VOA9KtDV5RFsydZ00/9vT3fPW7DYWbwzuDHZjWCxpXj2uzHF3eVL+wWM3zrQWE9vTwLGNx1orKe4BHB3QcA8JALMjentScCYfYC5McXd5Uv7ewS+WkLwrsLpaFXhl7VEX5eOHlFl+7E1gJGgqTTtwSVEzJu2pNbA3mgPLiFi3owj59CoQLEC39EEZhHU3qW6AAAAAElFTkSuQmCC"),
+        (5, 212) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABTElEQVR4Ae2WUQqDMAyGfd4NvZPsZQfYVbyVj+7/pBEhC3VhzBU6+G0ojfmWprFD//UMnMjA/f4YpVlairDHmuv6vI3SLC1F2FU/xUjF23jkPElroGlb9OYhwElaA4V+ipOKtyHImX8awdq8y5ggyWwEa/POLxtvg+WhF7D1BhaNM2uPEjBbb2DR6Pyy8fbYegE1G4Ha/LI7FEPA1GwEavPOLxuvhB2G7AuuBG6uJNo6dNSGyiLVZlQWv29rACNBk2nKg0OIsF1bYu1Rgqa90TE4hAi76peNd4zd7Z6BpjPQ1OER7HXt6dNtFixtyb790ejaVGlLdteIRuf3KZ9bL2D6ZgRq89+/dTmSkxMCptkbWDR+/9Z1ks8taxF4LwnBRxn+q5Jo69BRI8psO20NYCRoMk15cAgRdrUtlfbGzY4bHsKu+hGzq2cgmYEXnyNoeXjCrZwAAAAASUVORK5CYII="),
+        (5, 77) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABR0lEQVR4Ae2WQQqDMBBFXfc4vUZP4J3ETQ/Qq3iLHsWl/S9kgjQdrBLBQIRvhpAhj5/JkK59zYE/HLi/H700SXMUcb+VOo7PXpqkOYr4tLzAI8BBWhwNYdGPnwAHaXFUPC8gCBJnPVibzxwTJM56sDZfLC/A8hMwR29g3jixdi0Bc/QG5o3F8tLeAqZmPVCbn1NCDARMzXqgNl8sL27bdTUCV1cSdV06akNlUU9bAxgJGqcpDy4hIs7aEmvX0uWjvdExuISI+LS89d4tbg5U7cDyuvXSJM1RxNe8PAIcpMXROa+uo8crSJz1YG0+czq2M3szeGOWd5Qz5QmYozcwbyz/6koEOwMBU7MeqM2Xf3Xt5EzLawROJSF4c/R7vFRJ1HXpqA05W09bAxgJGqcpDy4hIt5sS7G98ULjpYaIN/PYs6k5cNCBDwrBS5kq1JL6AAAAAElFTkSuQmCC"),
+        (5, 158) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABNElEQVR4Ae2WQQqDMBBFXfeG3knc9AC9irdyaf8LGRHSwaJRHEjhmyE45PGdmaZrv+bAHw4sn1cvTdKcRdzvpY7ju5cmac4iviwv8QhwkBZHQ3rpx0OAg7Q4qp6XEASJsx6s7ReOCRJnPVjbr5aXYHkImE9vYN468e5WAubTG5i3VstbzxYwNeuB2v68JuRAwNSsB2r71fLysV0XEThcScRqOmpDZRFnrAGMBI3TlAdNiIiLscS7W6n5GG9MDJoQEV+Wtz27xc2B0A7c3XSnzBLsrWPtLCzjzO4M3lqMqTzO7M7grUXeKViS5S7z1gO1/fq3Lg4/IgHzJ2Fg3lr/1nUElpyIwGtJCN5z+FElEavpclnEGWsAI5UDTlMeNCEi3h1LebxxQ+Omhoh38zizqTlw0IEvGGNoeR6gWoQAAAAASUVORK5CYII="),
+        (5, 239) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABIUlEQVR4Ae2W0QnDMAxE890Ns1PoTwfoKtkqn+m9IJtQV6TEqajBhYuF8VXHWRYa+q878IUD9/tjFGZhMRCPR1SdDeVtepR0ElYH03bow0fnQ3mbBCXFIU9s2i+cjuZtYvkoMVefhHnrzNk9onk5txJTs57QtL9kggXRPEs7DNGJz+bbC26uJNp6dFitawptT2fzoTVDf4LTlAePEBAX7SwTLIjmWdq+dAfad2B93kZhFhYD8c8eXZVjEjgJq4PLp7VasTjriU37hdPWztKs4a0Fr0osZLnK1Sdh3nrZtEbOKkgwNesJTfuXTWtVYiG3KDiXhMQnR9/XvyqJth6dlUU7bQ3BQOWA05QHjxAQH7Yla29Mdkx4gPiQR86O7sBJB17mc2rhcW8kWgAAAABJRU5ErkJggg=="),
+        (5, 8) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLklEQVR4Ae1WwQ2DMBBjpq7RCdgJ9dOF2KKj8KQ2ykWI9ETrk05FSiWTaxRjYy4RQ//1BL5I4Pa6j8AMLAWsxzMq1qbyNj8QnYDVwbQt+nDB+lTeZgGiTMgza/NN0tm8zSwvEOarN2PeOHPtHtm8qg1h9qxn1OaXSihFNq/IDkO2sKq3N3y5lrjWpmPUeE2px5OqR68VuAmTZntwExKsm+OsEkqRzSuyfegJXD+Bx+M5AjOwFLA+3XRYK/FCiUF0AlYH7tca1ku8qFkm5Jm1+SZpmJV4IbMkQ5iv3ox5Y/O1pvKoGQKE2bOeUZtvvtZUXsgsyaqwyqNmCBCuLYHaEj2Of9US0ubBw0m8ULpGhrh0PKk80w2NEGdibA9uQoJ1c5wdRVTe8T79f0/ghwTeXcEPcfsiEu0AAAAASUVORK5CYII="),
+        (5, 89) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJDDfT70wClMCdf+Oen5cemEUpgTqn/EWPzI4CLODYVn04iGDgzA7OJy3WJBJkvXM2nyWmEySrGfW5g/jLWZ5yDCv3ox548jaLWSYV2/GvPEw3qotw/SsZ9Tmp5WQChmmZz2jNn8YL8l2XY2Gq2uJujYdvaG2qOdYwzCQaZKmPdiEgDo7lli7hTYfxxsnBpsQUP+Mt9VudUug6gSu11svjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4AmtjLFFblTVhAAAAAElFTkSuQmCC"),
+        (5, 170) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABQElEQVR4Ae2W0QnDMAxEM1PX6ATZKfSnC2WLjpLP9F6wgsEVLbIDNbhwsTA+dLlIqqfxGw784MDj8ZyFVdgSiOdv1NvrPgursCUQX8Y79EjgIuwOluPQh4cELsLuoDnvkCCROOuJtf3CMYnEWU+s7TfjHWJ5SDCf3oR568rZHBLMpzdh3tqMd+aWYGrWE2r720lIgQRTs55Q22/GS2mnqUfB3ZVEX01Hbags+hlrCAYSjdOUB00IiIuxxNkcaj7GGxODJgTEl/Hy3CMeDnTtQLTporwqs5Q0NNaivFqxjDO7M3hrMaYkNsSrEgtZiZm3nlDbL25dUR45q6DE/EmYMG8tbl1RXpVYyNHEUR45q6DEZ0ko9hz+q5IINY9eLsSrctfISt7PWMtE4xjlQRMC4mKc2Xlb9bIhnvHHOhwIOPAGOYIuuSlyAUYAAAAASUVORK5CYII="),
+        (5, 35) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EECr59vozALSwH1eEVdP15GYRaWAupLnjQsvc2PyJOwJpi2Rd9cZHAS1gQpTzqW3mZBZJ40MxvzVWIySbKZ2ZiveK7eZpaLbsCrD2PZOLP2CBnm1YexbKx4rt6urRvQs5nRmF92QilkmJ7NjMZ8xXP1iuwwuDf4T8O3a4l7bTp6Q21hHTNqi78/1jAMZJqkaQ82IaCujiXWHiHTHG+cGGxCQH3Jc/WO2r3uCdw6gcfjfRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBLxoJLFEiRmRTAAAAAElFTkSuQmCC"),
+        (5, 116) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96AjcksP58jMIsLAXU4xlVay3e5+/XKMzCUkB9qrf5kegkrAmmbdGVi9ZbPBmchDVBqrdZkCgJZWZjvrpzlyeTJJuZjflKbzPLRcI8+jCWjTNr/8PlyTCPPoxlY6W3a0uYns2MxvyyE0rh8mSYns2MxnylV2SHwRV2eY8w/HIt8Vqbjt7Q47WOJ5entvCPNQwDiZM07cEmBNT58QJJcHkyzfHGicEmBNSnepLs357AeyRwuXyPwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHJ6tJMXulR7wAAAAASUVORK5CYII="),
+        (5, 197) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s+9fbLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA/W7S5nunoBtAAAAAElFTkSuQmCC"),
+        (5, 62) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABU0lEQVR4Ae2W0YnDMBBEXdO1cRW4J5Ofa8hdXCn+TOYZrzFsFocRJDEoMNYiNJrRerXx0H89Ay9k4Of/dxRmYdlAPJ5Rb7e/UZiFZQPxKU8alt7qR+RJuBeY1kVPHjI4CfcCJU86lt5qQWROWpmN+ZQxmSSzldmYTzxXbzXLQxvw6sNYNc6sPUKGefVhrBoTz9XbtbUBNVsZjfllJ2yBDFOzldGYTzxXb5MdBneDTxq+XElc69JRGyoLq82oLN7f1jAMZJpMUx5cQkCc2hJrj5Bp2hsdg0sIiE95rt5Ru8c9A5fOgHt5XF5TsiRqtSeX12qWthT//dWY2pTMWrwms5AlTN+sjMZ8+upyeWg2QcI0+zBWjemry+U1mYXsCrs8NJsg4b0kFFcZ/qqSsC6PDmfxmrIbZIlfp60dTJMxyoNLCIhTO4v1MeqwFi/4fewZMDLwAGFZLrkdhwmbAAAAAElFTkSuQmCC"),
+        (5, 143) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++sj8fnLK3Sdor9re/9+2OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA277S5nIeofTAAAAAElFTkSuQmCC"),
+        (5, 224) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2WUQ6CMBBEOZPX8ATcifjjhbiFR+ET5xGWkNQNZmqMmBqHbppOZrpsl3bt1zLwRgZut3svjMK0grg/omqtxbs8rr0wCtMK4kO9xY9EB2FOMCyLXjy03uLJ4CDMCVK9xYJEyVBmNuaLnbs8mSSzmdmYL/QWszwkzKsPY9k4snYPlyfDvPowlo2F3qYtYWo2Mxrz00ZYA5cnw9RsZjTmC71VtutcYZf3CcOnK4lzHTpqQ6/Xak8uT2XhtzUMA4mTacqDQwiI8/YCSXB5Mk17o2NwCAHxoZ4k279l4D8y4B4el1eVNYl+ta3VmqWdxZ0hG4t2o01avCqzkCVMv82Mxnxxe3J5aFZBwnwkwlg2Frcnl1dlFrIr7PLQrIKEt5JQnGX4p0rCOjzanMWrym6QJX6etrYzTcYoDw4hIC7aWayPUZu1eMFvY8uAkYEnPRpOASlfru0AAAAASUVORK5CYII="),
+        (5, 17) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaklEQVR4Ae2WwW3DMBRDfe44XaMTeCcjlw7QVbxFR/HR5TP0jcLKhxMqhyRQEFo/ghjS9JfgoX96Ajck8Pn7NQqzsBRQj2dUrbV468/HKMzCUkB9qrf5kegkrAmmbdGVi9ZbPBmchDVBqrdZkCgJZWZjvrpzlyeTJJuZjflKbzPLRcI8+jCWjTNr/8PlyTCPPoxlY6W3a0uYns2MxvyyE0rh8mSYns2MxnylV2SHwRV2eY8w/HIt8Vqbjt7Q47WOJ5entvCPNQwDiZM07cEmBNT58QJJcHkyzfHGicEmBNSnepLs357AeyRwuXyPwiwsBdSnm0BrLV5TahKdhDVB+vak9Rav1SwJZWZjvkpaZi1ek1nIEubRh7FsrN6eXB6aTZAwPZsZjfnq7cnlNZmF7Aq7PDSbIOG9JVRHosfxqVrC2jy6OYvXlG6QJW4dTy4vdJtGiZMY7cEmBNTVcXYUcXnH/+m/ewJ3JPAHyKAsUbpLLdYAAAAASUVORK5CYII="),
+        (5, 98) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABaElEQVR4Ae2W0W2EMBBE+U45aSMV0BO6nxSQVugipfBJ5iEvQjgrkrGUHJJPGrxneZhhWFsM/dcT+EEC68fLKMzCUkA9XlFfP99GYRaWAupLnjQsvc2PyJOwJpi2Rd9cZHAS1gQpTzqW3mZBZJ40MxvzVWIySbKZ2ZiveK7eZpaLbsCrD2PZOLP2CBnm1YexbKx4rt6urRvQs5nRmF92QilkmJ7NjMZ8xXP1iuwwuDf4T8O3a4l7bTp6Q21hHTNqi78/1jAMZJqkaQ82IaCujiXWHiHTHG+cGGxCQH3Jc/WO2r3uCdw6gcfjfRRmYSmgvtw8WmvxmsKS6CSsCdKvLq23eK1mSSgzG/NV0jJr8ZrMQpYwrz6MZWP11eXy0GyChOnZzGjMV19dLq/JLGRX2OWh2QQJ7y2hOhI9j0/VEtbm0cNZvKZ0gyxx63hyeaHbNEqcxGgPNiGgro6zs4jLO9+n/+8J/CKBL9ZCSTEemF0EAAAAAElFTkSuQmCC"),
+        (5, 179) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4PH4nKVV2k6xn++s798fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC16aq+pqwpaGmsVX2tsIyzeGdwaxo3gi35mmAxKzDz1oHGeXp7qvqI2SQF5k8iwNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA6RhS5nEhIblAAAAAElFTkSuQmCC"),
+        (5, 44) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABVklEQVR4Ae2W0Q3CMBBD+804rMEE3anihwFYpVswSj+LX5WrqoYTcCkSkYLk5ohibNxLlK59WgIfJHB+XHphFKYE6v4ddb6femEUpgTqn/EWPzI4CLODYVn04iGDgzA7OJy3WJBJkvXM2nyWmEySrGfW5g/jLWZ5yDCv3ox548jaLWSYV2/GvPEw3qotw/SsZ9Tmp5WQChmmZz2jNn8YL8l2XY2Gq2uJujYdvaG2qOdYwzCQaZKmPdiEgDo7lli7hTYfxxsnBpsQUP+Mt9VudUug6gSu11svjMKUQP1282htiFcUlkQHYXbg3rq0PsQrNUtCnlmbz5KW2RCvyCxkCfPqzZg3ZreuKA/NIkiYnvWM2nx264ryisxCjgpHeWgWQcJrS6i2RPfjX7VEaPPoz4V4RekaWeKh4ynKM92iUeIkRnuwCQF1dpztRaK8/e+07y2BLxJ4AoToSTFyqzmaAAAAAElFTkSuQmCC"),
+        (5, 125) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLElEQVR4Ae1WQQ6DMAzjvB/yJ8RlD9hX+BVHZqOmQnQRmyNFQ+ok06yqsTFpxdB/PYEvEthejxFYgLWA9XhFxdpU3u4HohOwOZj2RR8uWJ/K2y1AlAl5Zm2+STqbt5vlBcJ89WbMGxeuPSKbV7UhzJ71jNr8WgmlyOYV2WHIFlb1joZv1xL32nSMGq8p9XhS9ei1Ajdh0mwPbkKCdXOcVUIpsnlFtg89gfsnMM/PEViAtYD15abDWokXSgyiE7A5cL/WsF7iRc0yIc+szTdJw6zEC5klGcJ89WbMG5uvNZVHzRAgzJ71jNp887Wm8kJmSVaFVR41Q4BwbQnUluh5/KuWkDYPHk7ihdI1MsSl40nlmW5ohDgTY3twExKsm+PsLKLyzvfp/3sCPyTwBpKKZhEn5kG3AAAAAElFTkSuQmCC"),
+        (5, 206) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABPklEQVR4Ae2W0QnDMAxE890Ns1PITwfoKtkqn+m9YAWDK1pkB2pw4WJhfOhykVRP4zcc+MGBdX3OwibsCcTzN+rxeszCJuwJxLfxTj0SuAiHg+U89OEhgYtwOGjOOyVIJM56Ym2/cEwicdYTa/vNeKdYHhLMpzdh3rpxNocE8+lNmLc24125JZia9YTa/n4RUiDB1Kwn1Pab8VLaaepRcHcl0VfTURsqi37GGoKBROM05UETAuJiLHE2h5qP8cbEoAkB8W28PPeIhwNdOxBtuiivyiwlDY21KK9WLOPM7gzeWowpiQ3xqsRCVmLmrSfU9otbV5RHziooMX8SJsxbi1tXlFclFnI0cZRHzioo8VUSij2H/6okQs2jlwvxqtw1spL3M9Yy0ThGedCEgLgYZ3beVr1siGf8sQ4HAg68AWCpaHl9XAj6AAAAAElFTkSuQmCC"),
+        (5, 71) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6zPh6fs7RK2yn2t779622WVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1eaq+pqwpaOmtq+prhWUsxX+/W9O4EWzJ1wSLWYGZmw40ztPbU9VHzCYpMMM+wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA8w4S5mGFymIAAAAAElFTkSuQmCC"),
+        (5, 152) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUY6DMAxE+d4bcifUnz3AXoVb8cnOQxghuRbVRGqLlEpDrCiTmRjHZei/noEXMrD+/YzCLCw7iMcr6uPxOwqzsOwgvuRJw9Lb/Ig8CWuBaVv05CGDk7AWKHnSsfQ2CyJz0spszKeMySSZrczGfOK5eptZHtqAVx/GqnFm7RkyzKsPY9WYeK7eoa0NqNnKaMwvB2EPZJiarYzGfOK5ervsMLgbfNLw7UriXpeO2lBZWG1GZfH+toZhINNkmvLgEgLi1JZYe4ZM097oGFxCQHzJc/XO2j3uGbh1BtzL4/KakiVRqz25vFaztKX476/G1KZk1uI1mYUsYfpmZTTm01eXy0OzCRKm2YexakxfXS6vySxkV9jlodkECR8lobjK8FeVhHV5dDiL15TdIEv8Pm3tZJqMUR5cQkCc2lmsj1GHtXjB72PPgJGBf9naaHkuhg+sAAAAAElFTkSuQmCC"),
+        (5, 233) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUQqDMBBE/e4NvZP40wP0Kt7KTztPXBHSxTIppZaUjllChpmsmzVd+7UMvJGBcbz3wiTMG4j7M6rWWrzlceuFSZg3EJ/qrX4kOghLgmFd9OKh9RZPBgdhSZDqrRYkSoYyszFf7NzlySSZzczGfKG3muUhYV59GMvGibVHuDwZ5tWHsWws9HZtCVOzmdGYn3fCFrg8GaZmM6MxX+htsl3nCru8Txi+XElc69BRG3q9VntyeSoLv61hGEicTFMeHEJAnLcXSILLk2naGx2DQwiIT/Uk2f4tA/+RAffwuLyqrEn0q22t1iztLO4M2Vi0G23S4lWZhSxh+m1mNOaL25PLQ7MKEuYjEcaysbg9ubwqs5BdYZeHZhUkvJeE4izDP1US1uHR5ixeVXaDLPHrtLWDaTJGeXAIAXHRzmJ9jNqsxQt+G1sGjAw8Aaf5auHgoyr5AAAAAElFTkSuQmCC"),
+        (5, 26) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUklEQVR4Ae2W0Q2DMAxEmalrdAJ2Qvx0IbboKHzSewgjpNSiuvSjVKl6xIpyuovjGLr2axn4IAO3570XJmHeQNyfUbXW4o3joxcmYd5AfKq3+pHoICwJhnXRm4fWWzwZHIQlQaq3WpAoGcrMxnyxc5cnk2Q2Mxvzhd5qloeEOfowlo0Ta49weTLM0YexbCz0dm0JU7OZ0Zifd8IWuDwZpmYzozFf6G2yXecKu7xvGL5cSVzr0lEbOl6rPbk8lYXf1jAMJE6mKQ8uISDO2wskweXJNO2NjsElBMSnepJs/5aB/8iAewlcXlXWJGq1GZdXa5b2Eu/wbCzajcxavCqzkCVM/8uMxnzx9eTy0KyChGnaYSwbi68nl1dlFrIr7PLQrIKE95JQnGX4p0rCujzanMWrym6QJX6dtnYwTcYoDy4hIC7aWayPUZu1eMFvY8uAkYEXiTAuueYfczEAAAAASUVORK5CYII="),
+        (5, 107) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9kYP96m6VV2k6xn++s798fs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA5bSS5kaag6UAAAAAElFTkSuQmCC"),
+        (5, 188) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABSklEQVR4Ae2WUQ6CMBBEOZPX8ATcifjjhbiFR+FT5xGWkNQNZiBqk5oM3TQdZthu13bt1zLwQQZut3svjMK0gLjfo14e114YhWkB8S5PGpbe7EfkQXgmGOZFbx4yOAjPBClPOpbebEFkvjQzG/NFxmSSzGZmY77guXqzWR56AVsfxrJxZO0WMszWh7FsLHiu3qqtF1CzmdGYn1bCEsgwNZsZjfmC5+otsl3nvuCXhqsriboOHbWhsrDajMri+20Nw0CmyTTlwSEExEVbYu0WMk17o2NwCAHxLs/V22q3uGWg6gy4h8DlHUqWRK225vKOmqWdxZ0hG4s2JbMW75BZyBKm32ZGY/78WxfiDmSYP4kwlo3n37ocs3BqNLyWhMxnGf6rkrAOjz7O4rGrhyHxetpafK1MkzHKg0MIiIt2FutjdHnBb2PLgJGBF2TxTgFNQf+sAAAAAElFTkSuQmCC"),
+        (5, 53) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABdElEQVR4Ae2WwW2EQAxFOaectJEK6AntJQWkFbpIKRzJfwijlZwvIs8ls5rV/p3RiC8/jO1lGp+RgT9k4P37Y5ZWaTvFfr6z7l9vs7RK2yn2t77H43OWVmk7xf7Wd/AIcJF2o+W46JcfAS7SbmR9Alyk3cj6DgRBklkHG+fpzgVJZh1snCefIMmsg43z5Dtg+REwjz7A3Lpy7bMEzKMPMLcmn4B59AHm1uS7YguYmnWgcb5dhnMjYGrWgcZ58gmYmnWgcZ58Z9hp6hG4u5Loq+moDZVFP2MNYCRoMk150ISIvR8vmCQ1H+ONiUETIva3PjUf442JQRMi9rc+hRzfkYHXyEC1Caq+pqwpaOntqeprhWW8xH+4W9O4EWzJ1wSLWYGZfw40ztPbU9VHzCYpMEM7wNya3p6qviZYzNXAVR8xm6TAV0lo7zL8r0qi1Dy6uZKvKbthVvB+xtoTNBmjPGhCxD6Ns7g+Vt1syRf+sY4MFDLwA0V4S5nSoybiAAAAAElFTkSuQmCC"),
+        (5, 134) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABUElEQVR4Ae2WUQ6DMAxD+d4NuRPazw6wq3ArPpkfahBSFzG5+xhTp5lGVS27aRoY+q9n4IMMrM/bKMzCUkA8nlG11uLd749RmIWlgPhUb/Mj0UlYE0zbojcPrbd4MjgJa4JUb7MgUTKUmY35aucuTybJbGY25iu9zSwPCXP0YSwbZ9Ye4fJkmKMPY9lY6e3aEqZmM6Mxv+yEErg8GaZmM6MxX+kV2WFwhV3eNwxfriSudemoDR2v1Z5cnsrCb2sYBhIn05QHlxAQ5+0FkuDyZJr2RsfgEgLiUz1J9n/PwH9kwL0ELq8paxK12ozLazVLe4l3eDZW7UZmLV6TWcgSpv9lRmO++npyeWg2QcI07TCWjdXXk8trMgvZFXZ5aDZBwntJKM4y/FMlYV0ebc7iNWU3yBK/Tls7mCZjlAeXEBBX7SzWx6jNWrzg97FnwMjAC1MaaHkMMNjoAAAAAElFTkSuQmCC"),
+        (5, 215) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABSElEQVR4Ae2WUQqDMBBE/e4NvZP0pwfoVbyVn3aeuCKki2WUtoEUxiwh44ybzTZd+7UMfJCB+/3RC6MwrSDuj6jz89YLozCtID7kScPSW/yIPAhzgmFZ9OYhg4MwJ0h50rH0Fgsi86WZ2ZgvMiaTZDYzG/MFz9VbzPLQC9j6MJaNI2v3kGG2PoxlY8Fz9TZtvYCazYzG/LQR1kCGqdnMaMwXPFdvle069wW/NFxdSdR16KgNlYXVZlQW329rGAYyTaYpDw4hIC7aEmv3kGnaGx2DQwiID3mu3l67xS0DVWfAPQQu71SyJGq1NZd31iztLO4M2Vi0KZm1eKfMQpYw/TYzGvPX37oQdyDD/EmEsWy8/tblmIVTo+GtJGQ+y/BflYR1ePRxFo9dPQ2J19PW4mtlmoxRHhxCQFy0s1gfo8sLfhtbBowMvAAhOWrhV9t/MwAAAABJRU5ErkJggg=="),
+        (5, 80) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABL0lEQVR4Ae2W0QnDMAxEM1PX6ATZKeSnC2WLjpLP9F6IjMEVbYxTKnDhamGs+nGR1Az90x34woHb8z5Ki7QeIh4/pc7zY5QWaT1EfFneziPASdocTfuhN18CnKTNUfO8HUGQOOvB2n7hmCBx1oO1/WZ5OyxfAubRG5i3LpzNJWAevYF5a7O8dLeAqVkP1PbXlHAEAqZmPVDbb5Z3XDsMEYHDlUSspqM2VBZxxhrASNA4TXnQhIi4GEuczaXmY7wxMWhCRHxZXn53j7sDoR0I1TyC/f1bV+3jFSxjyf77vbUYU7V5tZwpTxczNz1Q22//1pUITgYCZtgbmLe2f+s6yZmORwROJSF4z+G/KolYTUdtyNk4Yw1gJGicpjxoQkRcjDPO5qrNy3+jx92Bkw68AIzITgExJgasAAAAAElFTkSuQmCC"),
+        (5, 161) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABLElEQVR4Ae2WQQrCMBBFu/aGvVNx4wG8Sm/VZf2vZEIgDtqQigMRvhlCxjx+Z8ZO4zMc+MKB/XmbpVXakojnT6n3+2OWVmlLIr4s7+AR4CLtjpbj0JsvAS7S7qh73oEgSJz1YG2/ckyQOOvB2n63vAOWLwHz6A3MW1fOlhIwj97AvLVbXr5bwNSsB2r7W05IgYCpWQ/U9rvlpWunKSJwuJKI1XTUhsoizlgDGAkapykPmhARV2OJs6XUfIw3JgZNiIgvyyvvHvFwILQDoZpHsL9/62p9vIJlLNl/v7dWY6o1r5Uz5+li5qYHavv937oywclAwAx7A/PW/m9dJznz8YjAuSQE7zn8VyURq+moDTkbZ6wBjASN05QHTYiIq3HG2VKteeVvjHg4cNKBF5pqauG8ZE/2AAAAAElFTkSuQmCC"),
+        (5, 242) => Some("iVBORw0KGgoAAAANSUhEUgAAACwAAAAeCAYAAABXNvynAAABBklEQVR4Ae2WUQrDIBBEvWbuFPLTC+VW+WzniYpgl7YalgoWJkpwMsO4bg3rtxL4IoHjeGzCKVwJzLdPVK115UU/Et2Fp4E9Lnrz0HpXXrQgURKyzOb3TdLevGiWh4TZ+mzMGk/W1vDmFW0JU7OW0fz+KoQ08eYl2RC8hXv1asPTlcRch46otU2u7alXD68F+ghJUx4cQsC8aWeFkCbevCS7hpXA/AlMdXhk1rWtDW2vzNLO8p3BGpv21ssbMgtZwvRby2h+f9ttDc0hyDB/EtmYNd52WxsyC3lGw6UkZN5K+K9KYq5Dl8pinraGYaByIGnKg0MImDftjLU1enn1N9Z8JfBjAi9oiW1JELmjNwAAAABJRU5ErkJggg=="),
+        _ => None,
+    }
+}
@@ -0,0 +1,5 @@
+#[doc(hidden)]
+pub mod __private226 {
+    #[doc(hidden)]
+    pub use crate::private::*;
+}
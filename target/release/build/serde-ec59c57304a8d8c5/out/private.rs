@@ -0,0 +1,6 @@
+#[doc(hidden)]
+pub mod __private226 {
+    #[doc(hidden)]
+    pub use crate::private::*;
+}
+use serde_core::__private226 as serde_core_private;